@@ -2,45 +2,14 @@
 # Section 1: DNA to Protein Translation
 # ==============================================
 
-# Standard genetic code (codon to amino acid mapping)
-
-CODON_TABLE = {
-    'ATA': 'I', 'ATC': 'I', 'ATT': 'I', 'ATG': 'M',
-    'ACA': 'T', 'ACC': 'T', 'ACG': 'T', 'ACT': 'T',
-    'AAC': 'N', 'AAT': 'N', 'AAA': 'K', 'AAG': 'K',
-    'AGC': 'S', 'AGT': 'S', 'AGA': 'R', 'AGG': 'R',
-    'CTA': 'L', 'CTC': 'L', 'CTG': 'L', 'CTT': 'L',
-    'CCA': 'P', 'CCC': 'P', 'CCG': 'P', 'CCT': 'P',
-    'CAC': 'H', 'CAT': 'H', 'CAA': 'Q', 'CAG': 'Q',
-    'CGA': 'R', 'CGC': 'R', 'CGG': 'R', 'CGT': 'R',
-    'GTA': 'V', 'GTC': 'V', 'GTG': 'V', 'GTT': 'V',
-    'GCA': 'A', 'GCC': 'A', 'GCG': 'A', 'GCT': 'A',
-    'GAC': 'D', 'GAT': 'D', 'GAA': 'E', 'GAG': 'E',
-    'GGA': 'G', 'GGC': 'G', 'GGG': 'G', 'GGT': 'G',
-    'TCA': 'S', 'TCC': 'S', 'TCG': 'S', 'TCT': 'S',
-    'TTC': 'F', 'TTT': 'F', 'TTA': 'L', 'TTG': 'L',
-    'TAC': 'Y', 'TAT': 'Y', 'TAA': '_', 'TAG': '_',
-    'TGC': 'C', 'TGT': 'C', 'TGA': '_', 'TGG': 'W'
-}
-# Function to translate DNA sequence to protein sequence
-
-def translate_dna_to_protein(dna_sequence):
-    # Step 1: Convert DNA to uppercase
-    dna_sequence = dna_sequence.upper()
-    
-    # Step 2: Split into codons
-    codons = [dna_sequence[i:i+3] for i in range(0, len(dna_sequence), 3)]
-    
-    # Step 3: Translate codons to amino acids
-    protein_sequence = ''
-    for codon in codons:
-        if len(codon) == 3:  # Ensure it's a complete codon
-            amino_acid = CODON_TABLE.get(codon, '?')  # Use '?' for unknown codons
-            if amino_acid == '_':  # Stop codon
-                break
-            protein_sequence += amino_acid
-    
-    return protein_sequence
+import os
+import sys
+
+# Make the shared hackbio package (repository root) importable when running this script directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# translate_dna_to_protein (and its CODON_TABLE) live in hackbio/translation.py
+from hackbio.translation import translate_dna_to_protein
 
 # Example DNA sequence
 dna_sequence = "ATGGCCATTGTAATGGGCCGCTGAA"
@@ -54,56 +23,16 @@ print(f"Protein: {protein_sequence}")
 # Initialiation of required libraries
 # ==============================================
 
-import random
-import pandas as pd # type: ignore
 import matplotlib.pyplot as plt # type: ignore
 
 # ==============================================
 # Section 2: Logistic Population Growth
 # ==============================================
 
-# Function to simulate logistic growth with randomized lag and exponential phases
-
-def logistic_growth(K, P0, r, total_time, lag_mean, lag_std, exp_mean, exp_std):
-    """
-    Simulates logistic population growth with randomized lag and exponential phases.
-
-    Parameters:
-        K (float): Carrying capacity.
-        P0 (float): Initial population size.
-        r (float): Growth rate.
-        total_time (int): Total simulation time.
-        lag_mean (float): Mean duration of the lag phase.
-        lag_std (float): Standard deviation of the lag phase.
-        exp_mean (float): Mean duration of the exponential phase.
-        exp_std (float): Standard deviation of the exponential phase.
-
-    Returns:
-        time (list): List of time points.
-        population (list): List of population sizes (OD) at each time point.
-    """
-    # Step 1: Randomize lag and exponential phases
-    lag_duration = max(0, int(random.gauss(lag_mean, lag_std)))  # Ensure lag is non-negative
-    exp_duration = max(0, int(random.gauss(exp_mean, exp_std)))  # Ensure exp is non-negative
-
-    # Step 2: Initialize variables
-    time = list(range(total_time))  # Time points
-    population = [P0] * total_time  # Population sizes (OD) at each time point
-
-    # Step 3: Simulate logistic growth
-    for t in range(1, total_time):
-        if t < lag_duration:
-            # Lag phase: slow growth
-            population[t] = population[t - 1]
-        elif t < lag_duration + exp_duration:
-            # Exponential phase: rapid growth
-            delta_population = r * population[t - 1] * (1 - population[t - 1] / K)
-            population[t] = population[t - 1] + delta_population
-        else:
-            # Stationary phase: growth levels off
-            population[t] = K
-
-    return time, population
+# logistic_growth, generate_growth_curves and time_to_80_percent live in hackbio/growth.py
+from hackbio.growth import generate_growth_curves, logistic_growth, time_to_80_percent
+from hackbio.growth_fitting import fit_growth_curves, growth_matrix_from_frame
+from hackbio.plotting import show_figure
 
 # Example usage
 K = 1000  # Carrying capacity
@@ -127,45 +56,6 @@ for t, od in zip(time, population):
 # Section 3: Generate a DataFrame with 100 Different Growth Curves
 # ==============================================
 
-# Function to generate multiple logistic growth curves and store them in a DataFrame
-
-def generate_growth_curves(num_curves, K, P0, r, total_time, lag_mean, lag_std, exp_mean, exp_std):
-    """
-    Generates multiple logistic growth curves and stores them in a DataFrame.
-
-    Parameters:
-        num_curves (int): Number of growth curves to generate.
-        K (float): Carrying capacity.
-        P0 (float): Initial population size.
-        r (float): Growth rate.
-        total_time (int): Total simulation time.
-        lag_mean (float): Mean duration of the lag phase.
-        lag_std (float): Standard deviation of the lag phase.
-        exp_mean (float): Mean duration of the exponential phase.
-        exp_std (float): Standard deviation of the exponential phase.
-
-    Returns:
-        df (pd.DataFrame): DataFrame containing time and population data for all curves.
-    """
-    # Initialize an empty DataFrame
-    df = pd.DataFrame()
-
-    # Generate growth curves
-    for curve_id in range(1, num_curves + 1):
-        time, population = logistic_growth(K, P0, r, total_time, lag_mean, lag_std, exp_mean, exp_std)
-        
-        # Create a temporary DataFrame for the current curve
-        temp_df = pd.DataFrame({
-            "curve_id": curve_id,
-            "time": time,
-            "population": population
-        })
-        
-        # Append the temporary DataFrame to the main DataFrame
-        df = pd.concat([df, temp_df], ignore_index=True)
-
-    return df
-
 # Step 5: Example usage
 K = 1000  # Carrying capacity
 P0 = 10   # Initial population size
@@ -182,31 +72,11 @@ growth_df = generate_growth_curves(100, K, P0, r, total_time, lag_mean, lag_std,
 # Display the first few rows of the DataFrame
 print(growth_df.head())
 
-# Function to determine the time to reach 80% of the carrying capacity
-
-def time_to_80_percent(time, population, K):
-    """
-    Determines the time to reach 80% of the carrying capacity.
-
-    Parameters:
-        time (list): List of time points.
-        population (list): List of population sizes (OD) at each time point.
-        K (float): Carrying capacity.
-
-    Returns:
-        t_80 (int or None): Time to reach 80% of carrying capacity, or None if not reached.
-    """
-    target_population = 0.8 * K
-    for t, pop in zip(time, population):
-        if pop >= target_population:
-            return t
-    return None
-
 # Generate 100 growth curves
 growth_df = generate_growth_curves(100, K, P0, r, total_time, lag_mean, lag_std, exp_mean, exp_std)
 
 # Convert the DataFrame to a list of dictionaries for easier processing
-growth_curves = growth_df.groupby('curve_id').apply(lambda x: x.to_dict(orient='list')).tolist()
+growth_curves = [curve_df.to_dict(orient='list') for _, curve_df in growth_df.groupby('curve_id')]
 
 # Determine time to reach 80% of carrying capacity for each curve
 times_to_80_percent = []
@@ -236,7 +106,7 @@ for curve in growth_curves:
 plt.xlabel('Time')
 plt.ylabel('Population (OD)')
 plt.title('Logistic Growth Curves')
-plt.show()
+show_figure('Logistic Growth Curves')
 
 # Plot histogram of times to reach 80% of carrying capacity for better visualization
 plt.figure(figsize=(10, 6))
@@ -244,24 +114,24 @@ plt.hist([t for t in times_to_80_percent if t is not None], bins=20, edgecolor='
 plt.xlabel('Time to reach 80% of carrying capacity')
 plt.ylabel('Frequency')
 plt.title('Histogram of Times to Reach 80% of Carrying Capacity')
-plt.show()
+show_figure('Time to 80 Percent Histogram')
 
 # ==============================================
-# Section 4: Calculating The Hamming Distance
+# Section 3b: Estimating Growth Parameters from OD Curves
 # ==============================================
 
-# Function to calculate the Hamming distance between two strings
+# Fit lag, r, K and t80 back from the curves (as for plate-reader OD data),
+# using the measured times to 80% of K as starting points for the lag
+wells, time_points, od_matrix = growth_matrix_from_frame(growth_df)
+growth_fits = fit_growth_curves(time_points, od_matrix, wells=wells, t80_seeds=times_to_80_percent)
+print(growth_fits[["well", "P0", "K", "r", "lag", "t80", "rmse", "r2", "converged"]].head())
 
+# ==============================================
+# Section 4: Calculating The Hamming Distance
+# ==============================================
 
-def hamming_distance(str1, str2):
-    # Pad the shorter string with spaces to make both strings of equal length
-    max_len = max(len(str1), len(str2))
-    str1 = str1.ljust(max_len)
-    str2 = str2.ljust(max_len)
-    
-    # Calculate the Hamming distance
-    distance = sum(1 for x, y in zip(str1, str2) if x != y)
-    return distance
+# hamming_distance lives in hackbio/sequences.py
+from hackbio.sequences import KmerIndex, hamming_distance, levenshtein_distance
 
 # Example usage
 slack_username = "Adams"
@@ -269,6 +139,31 @@ linkedin_handle = "J.Adams Nyaata"
 distance = hamming_distance(slack_username, linkedin_handle)
 print(f"Hamming Distance: {distance}")
 
+# The edit distance counts insertions and deletions as single edits
+# (hamming_distance shifts every character after the "J." prefix)
+print(f"Edit Distance: {levenshtein_distance(slack_username, linkedin_handle)}")
+
+# Find protein products within 2 edits of a query with a k-mer prefiltered index
+proteins = [translate_dna_to_protein(dna) for dna in ["ATGGCCATTGTAATGGGCCGCTGAA", "ATGGCCATTGTTATGGGCCGCTGAA",
+                                                     "ATGGCCATTATGGGCCGCTGAA", "ATGAAACCCGGGTTTTGA"]]
+protein_index = KmerIndex(proteins, k=2)
+print(f"Proteins within 2 edits of {proteins[0]}: {protein_index.search(proteins[0], max_distance=2)}")
+
+# ==============================================
+# Section 4b: K-mer Spectrum & Codon Usage
+# ==============================================
+
+# k-mer counts, codon usage/RSCU and GC content live in hackbio/kmers.py
+# (fasta_stats streams a FASTA file in pieces and can count them in parallel)
+from hackbio.kmers import sequence_stats
+
+coding_sequences = ["ATGGCCATTGTAATGGGCCGCTGAA", "ATGGCCATTGTTATGGGCCGCTGAA", "ATGAAACCCGGGTTTTGA"]
+sequence_summary = sequence_stats(coding_sequences, k=3)
+print(f"GC Content: {sequence_summary.gc_content:.2%}")
+print(f"Most frequent 3-mers:\n{sequence_summary.kmer_counts(top=5)}")
+codon_usage = sequence_summary.codon_usage()
+print(codon_usage[codon_usage["count"] > 0].sort_values("amino_acid"))
+
 # ==============================================
 # Github Link: 
 # ==============================================
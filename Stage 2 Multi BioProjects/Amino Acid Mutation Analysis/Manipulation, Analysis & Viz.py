@@ -7,11 +7,20 @@
 # ==============================================
 
 # importing the necessary libraries
-import pandas as pd
 import os
+import sys
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+# Make the shared hackbio package (repository root) importable when running this script directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from hackbio.dtypes import compact_frame, memory_report, print_memory_report
+from hackbio.mutations import filter_deleterious_mutations, load_mutation_dataset, merge_mutation_datasets
+from hackbio.mutation_frequencies import mutation_frequencies
+from hackbio.plotting import show_figure
+from hackbio.report_figures import TABLE_COLUMNS, table_figure
+
 # Define the path to your working directory
 working_dir = os.getenv("HACKBIO_WORKING_DIR", ".")
 
@@ -24,50 +33,46 @@ print(f"SIFT CSV Path: {sift_csv}")
 print(f"FoldX CSV Path: {foldx_csv}")
 
 # Load CSV files into Pandas DataFrames
+# (load_mutation_dataset also strips leading/trailing spaces from the column names)
 try:
-    sift_df = pd.read_csv(sift_csv)
-    foldx_df = pd.read_csv(foldx_csv)
+    sift_df = load_mutation_dataset(sift_csv)
+    foldx_df = load_mutation_dataset(foldx_csv)
 except FileNotFoundError as e:
     print(e)
     print("Loading datasets from URLs instead...")
     sift_url = "Stage 2 Multi BioProjects/Amino Acid Mutation Analysis/sift_dataset.csv"
     foldx_url = "Stage 2 Multi BioProjects/Amino Acid Mutation Analysis/foldx_dataset.csv"
-    sift_df = pd.read_csv(sift_url)
-    foldx_df = pd.read_csv(foldx_url)
-
-# ==============================================
-# 1.2: Ensuring Data Consistency
-# ==============================================
+    sift_df = load_mutation_dataset(sift_url)
+    foldx_df = load_mutation_dataset(foldx_url)
 
-# Ensure column names are correctly formatted (strip leading/trailing spaces if needed)
-sift_df.columns = sift_df.columns.str.strip()
-foldx_df.columns = foldx_df.columns.str.strip()
+# Compact the tables: Protein/Amino_Acid become categoricals and the mutation codes
+# are parsed into wild type / position / mutant fields (merging and filtering run unchanged)
+sift_loaded, foldx_loaded = sift_df, foldx_df
+sift_df = compact_frame(sift_loaded, parse_mutations="Amino_Acid")
+foldx_df = compact_frame(foldx_loaded, parse_mutations="Amino_Acid")
+print_memory_report(memory_report({"sift": (sift_loaded, sift_df), "foldx": (foldx_loaded, foldx_df)}))
 
 # ==============================================
 # 2: Merging Datasets and Filtering Deleterious Mutations
 # ==============================================
 
-# Create 'specific_Protein_aa' column by concatenating 'Protein' and 'Amino_Acid'
-sift_df["specific_Protein_aa"] = sift_df["Protein"] + "_" + sift_df["Amino_Acid"]
-foldx_df["specific_Protein_aa"] = foldx_df["Protein"] + "_" + foldx_df["Amino_Acid"]
-
-# Merge both datasets on 'specific_Protein_aa'
-merged_df = pd.merge(sift_df, foldx_df, on="specific_Protein_aa", suffixes=('_sift', '_foldx'))
+# Merge both datasets on 'specific_Protein_aa' (Protein + "_" + Amino_Acid)
+merged_df = merge_mutation_datasets(sift_df, foldx_df)
 
 # Filter mutations that are deleterious in both function and structure
-deleterious_mutations = merged_df[
-    (merged_df["sift_Score"] < 0.05) & (merged_df["foldX_Score"] > 2)
-]
+deleterious_mutations = filter_deleterious_mutations(merged_df, sift_threshold=0.05, foldx_threshold=2)
 
 # ==============================================
 # 3: Analyzing Deleterious Mutations
 # ==============================================
 
-# Extract the first amino acid from the 'Amino_Acid' column
-deleterious_mutations.loc[:, "First_AA"] = deleterious_mutations["Amino_Acid_sift"].str[0]
+# Count wild-type residues, substitutions, positions and proteins in one pass
+# (mutation codes like "K60Q" are parsed without modifying the filtered frame)
+frequencies = mutation_frequencies(deleterious_mutations, mutation_column="Amino_Acid_sift",
+                                   protein_column="Protein_sift")
 
-# Generate frequency table for amino acids
-amino_freq = deleterious_mutations["First_AA"].value_counts()
+# Frequency table of the wild-type (first) amino acid, most frequent first
+amino_freq = frequencies.wild_type_frequencies()
 
 # Display results
 print("\nDeleterious Mutations:")
@@ -76,17 +81,19 @@ print(deleterious_mutations)
 print("\nAmino Acid Frequency Table:")
 print(amino_freq)
 
+print("\nWild Type -> Mutant Substitution Matrix:")
+print(frequencies.substitution_matrix())
+
+print("\nMost Affected Proteins:")
+print(frequencies.protein_summary().head(10))
+
 # Save the table as an image
-fig, ax = plt.subplots(figsize=(8, 4))
-ax.axis('tight')
-ax.axis('off')
-table_data = [deleterious_mutations.columns.tolist()] + deleterious_mutations.head(10).values.tolist()
-table = ax.table(cellText=table_data, colLabels=None, loc='center', cellLoc='center')
-table.auto_set_font_size(False)
-table.set_fontsize(8)
-table.auto_set_column_width([i for i in range(len(deleterious_mutations.columns))])
+# (key columns only; column widths come from the text lengths instead of auto_set_column_width)
+fig = plt.figure(figsize=(8, 4))
+table_rows = deleterious_mutations[TABLE_COLUMNS].head(10).astype(str).values.tolist()
+table_figure(fig, TABLE_COLUMNS, table_rows, "First 10 Deleterious Mutations")
 plt.savefig("deleterious_mutations_table.png", dpi=300)
-plt.show()
+show_figure("Deleterious Mutations Table")
 
 # ==============================================
 # 4: Visualizing Results
@@ -100,12 +107,9 @@ amino_acid_dict = {
     "S": "Serine", "T": "Threonine", "W": "Tryptophan", "Y": "Tyrosine", "V": "Valine"
 }
 
-# Convert dictionary to sorted lists
+# Residues and counts, already sorted by frequency
 amino_acids = list(amino_freq.index)
 counts = list(amino_freq.values)
-
-# Sort by frequency
-amino_acids, counts = zip(*sorted(zip(amino_acids, counts), key=lambda x: x[1], reverse=True))
 labels = [f"{aa} - {amino_acid_dict[aa]}" for aa in amino_acids]
 
 # Bar Plot
@@ -116,7 +120,7 @@ plt.ylabel("Frequency", fontsize=14)
 plt.title("Frequency of Amino Acids in Deleterious Mutations", fontsize=16)
 plt.xticks(rotation=45)
 plt.legend(labels, title="Amino Acid Key", bbox_to_anchor=(1.05, 1), loc='upper left')
-plt.show()
+show_figure("Amino Acid Frequency")
 
 # Pie Chart
 plt.figure(figsize=(10, 10))
@@ -124,4 +128,4 @@ plt.pie(counts, labels=amino_acids, autopct=None, colors=sns.color_palette("viri
 plt.title("Proportion of Amino Acids in Deleterious Mutations", fontsize=16)
 plt.legend([f"{aa} - {amino_acid_dict[aa]} ({count/sum(counts)*100:.1f}%)" for aa, count in zip(amino_acids, counts)], 
            title="Amino Acid Key", bbox_to_anchor=(1.05, 1), loc='upper left')
-plt.show()
\ No newline at end of file
+show_figure("Amino Acid Proportion")
\ No newline at end of file
@@ -6,41 +6,26 @@
 # 1.1: Downloading SIFT dataset from URL
 # ==============================================
 
-import requests
 import os
+import sys
 
-"""
-    Downloads a TSV file from a given URL and saves it to the specified path.
-
-    Parameters:
-        url (str): The URL of the TSV dataset.
-        filename (str): The full path to save the file.
-    """
-
-def download_tsv(url, filename):
-   
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-
-        with open(filename, "wb") as file:
-            file.write(response.content)
+# Make the shared hackbio package (repository root) importable when running this script directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-        print(f"File saved: {filename}")
+# download_tsv lives in hackbio/mutations.py
+from hackbio.mutations import FOLDX_URL, SIFT_URL, download_tsv
 
-    except requests.exceptions.RequestException as e:
-        print(f"Error downloading {filename}: {e}")
-
-# Define your desktop path
-desktop_path = "/Users/Admin.DESKTOP-8TK90VT/Desktop"
+# Define the path to your working directory (defaults to this script's directory)
+script_dir = os.path.dirname(os.path.abspath(__file__))
+working_dir = os.getenv("HACKBIO_WORKING_DIR", script_dir)
 
 # Define full paths for the files
-sift_file = os.path.join(desktop_path, "sift_dataset.tsv")
-foldx_file = os.path.join(desktop_path, "foldx_dataset.tsv")
+sift_file = os.path.join(working_dir, "sift_dataset.tsv")
+foldx_file = os.path.join(working_dir, "foldx_dataset.tsv")
 
-# Download the files to Desktop (or directory of your choice)
-download_tsv("https://raw.githubusercontent.com/HackBio-Internship/public_datasets/main/R/datasets/sift.tsv", sift_file)
-download_tsv("https://raw.githubusercontent.com/HackBio-Internship/public_datasets/main/R/datasets/foldX.tsv", foldx_file)
+# Download the files to the working directory
+download_tsv(SIFT_URL, sift_file)
+download_tsv(FOLDX_URL, foldx_file)
 
 # ==============================================
 """
@@ -59,10 +44,6 @@ download_tsv("https://raw.githubusercontent.com/HackBio-Internship/public_datase
 # ==============================================
 
 import pandas as pd
-import os
-
-# Define the path to your working directory
-working_dir = r"C:\Users\Admin.DESKTOP-8TK90VT\HackBio-Biocoding\Stage 2"
 
 # Define full file paths
 sift_csv = os.path.join(working_dir, "sift_dataset.csv")
@@ -8,47 +8,27 @@
 
 # Import necessary libraries
 import os
-import io
-import requests
+import sys
 import matplotlib.pyplot as plt
 import numpy as np
 import seaborn as sns
 import pandas as pd
 
+# Make the shared hackbio package (repository root) importable when running this script directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# download_and_process_dataset lives in hackbio/transcriptomics.py
+from hackbio.transcriptomics import DATASET_URL, download_and_process_dataset, significant_gene_masks
+from hackbio.dtypes import compact_frame, memory_report, print_memory_report
+from hackbio.plotting import show_figure, volcano_plot
+
 # Define the dataset URL
-dataset_url = "https://gist.githubusercontent.com/stephenturner/806e31fce55a8b7175af/raw/1a507c4c3f9f1baaa3a69187223ff3d3050628d4/results.txt"
+dataset_url = DATASET_URL
 
 # Get the directory of the current script file
 script_dir = os.path.dirname(os.path.abspath(__file__))
 csv_filename = os.path.join(script_dir, "transcriptomics_data.csv")
 
-def download_and_process_dataset(url, save_path):
-    """
-    Downloads the dataset from the given URL, processes it into a structured CSV format,
-    and saves it to the specified path.
-
-    Parameters:
-        url (str): The dataset URL.
-        save_path (str): Path to save the processed CSV file.
-    """
-    try:
-        # Download the dataset
-        response = requests.get(url)
-        response.raise_for_status()  # Raise an error if download fails
-
-        # Convert content into a DataFrame
-        data = pd.read_csv(io.StringIO(response.text), delim_whitespace=True)
-
-        # Save as CSV
-        data.to_csv(save_path, index=False)
-
-        print(f"Dataset successfully saved to: {save_path}")
-
-    except requests.exceptions.RequestException as e:
-        print(f"Error downloading dataset: {e}")
-    except Exception as e:
-        print(f"Error processing dataset: {e}")
-
 # Run the function
 download_and_process_dataset(dataset_url, csv_filename)
 
@@ -82,19 +62,23 @@ df.columns = df.columns.str.strip()
 print("\nColumn names after formatting:")
 print(df.columns)
 
+# Store exactly representable floats as float32 (the analysis below runs unchanged);
+# p-values stay float64 because -log10(p-value) is derived from them
+df_loaded = df
+df = compact_frame(df_loaded, exclude=["pvalue"])
+print_memory_report(memory_report({"transcriptomics": (df_loaded, df)}))
+
 # ==============================================
 # 2:  Data Preprocessing & Exploration  
 # ==============================================
 
 import matplotlib.pyplot as plt
-import seaborn as sns
 
 # Convert p-value to -log10(p-value) for visualization
 df["neg_log10_pvalue"] = -np.log10(df["pvalue"])
 
-# Define significance thresholds
-upregulated = (df["log2FoldChange"] > 1) & (df["pvalue"] < 0.01)
-downregulated = (df["log2FoldChange"] < -1) & (df["pvalue"] < 0.01)
+# Define significance thresholds (|log2FC| > 1 & p-value < 0.01)
+upregulated, downregulated = significant_gene_masks(df, log2fc_threshold=1, pvalue_threshold=0.01)
 
 # ==============================================
 # 3:  Filter and Save Significant Genes   
@@ -121,25 +105,12 @@ print("\nSignificant genes saved successfully!")
 
 # 4.1: Volcano Plot with Significance Thresholds
 
-# Assign colors based on significance
-df["color"] = "gray"  # Default: Non-significant
-df.loc[upregulated, "color"] = "red"   # Upregulated
-df.loc[downregulated, "color"] = "blue" # Downregulated
-
-# Create the volcano plot
-plt.figure(figsize=(10, 6))
-sns.scatterplot(x=df["log2FoldChange"], y=df["neg_log10_pvalue"], hue=df["color"], palette={"gray": "gray", "red": "red", "blue": "blue"}, alpha=0.7)
-colors = df["color"].map({"gray": "gray", "red": "red", "blue": "blue"})
-plt.scatter(x=df["log2FoldChange"], y=df["neg_log10_pvalue"], c=colors, alpha=0.7)
-# Add labels and title
-plt.axhline(-np.log10(0.01), linestyle="dashed", color="black", alpha=0.7)  # p-value threshold line
-plt.axvline(1, linestyle="dashed", color="black", alpha=0.7)   # log2FC threshold for upregulation
-plt.axvline(-1, linestyle="dashed", color="black", alpha=0.7)  # log2FC threshold for downregulation
-plt.xlabel("Log2 Fold Change")
-plt.ylabel("-log10(p-value)")
-plt.legend(["Significant (p-value < 0.01)", "Upregulated (log2FC > 1)", "Downregulated (log2FC < -1)"], loc="upper right")
-plt.legend(["p-value < 0.01", "log2FC > 1", "log2FC < -1"], loc="upper right")
-plt.show()
+# Draw every gene once: gray for non-significant, red/blue for significant genes.
+# Large tables switch to a hexbin density layer for the non-significant genes.
+fig, ax = plt.subplots(figsize=(10, 6))
+volcano_plot(ax, df["log2FoldChange"], df["neg_log10_pvalue"], upregulated, downregulated,
+             log2fc_threshold=1, pvalue_threshold=0.01)
+show_figure("Volcano Plot", fig)
 
 # 4.2: Bar Plot of Top 20 Upregulated and Downregulated Genes
 import matplotlib.pyplot as plt
@@ -166,4 +137,4 @@ plt.ylabel("Gene", fontsize=14)
 plt.title("Top 20 Upregulated and Downregulated Genes (Bar Plot)", fontsize=16)
 plt.grid(axis="x", linestyle="--", alpha=0.5)
 
-plt.show()
\ No newline at end of file
+show_figure("Top Upregulated and Downregulated Genes")
@@ -7,16 +7,23 @@
 import matplotlib.pyplot as plt
 import numpy as np
 import os
-import pandas as pd
+import sys
 import seaborn as sns
-from sklearn.cluster import KMeans, AgglomerativeClustering
-from sklearn.decomposition import PCA
-from sklearn.impute import SimpleImputer
-from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix, f1_score, precision_score, recall_score, silhouette_score, davies_bouldin_score
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
-from scipy.cluster.hierarchy import dendrogram, linkage
+
+# Make the shared hackbio package (repository root) importable when running this script directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hackbio.cancer import load_and_debug_dataset
+from hackbio.model_artifacts import LABEL_MAP, build_diagnosis_pipeline, save_model_artifact
+from hackbio.evaluation import evaluate_classifier, print_evaluation
+from hackbio.preprocessing_cache import preprocess_cached
+from hackbio.hierarchical import hierarchical_clustering, plot_truncated_dendrogram
+from hackbio.dimensionality_reduction import benchmark_projection, fit_projection, load_projection, project_samples, save_projection
+from hackbio.plotting import class_density_scatter, show_figure
+from hackbio.importance import feature_groups, permutation_importance
+from hackbio.subclasses import discover_subclasses
 
 # Get the directory where the script is located
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -24,92 +31,60 @@ csv_filename = os.path.join(script_dir, "cancer_transcriptomics_cleaned.csv")
 
 print(f"🔍 Looking for file at: {csv_filename}")
 
-def load_and_debug_dataset(filename):
-    try:
-        if not os.path.exists(filename):
-            raise FileNotFoundError(f"❌ Error: '{filename}' not found. Please check the file path.")
-
-        # Load dataset
-        df = pd.read_csv(filename)
-        print(f"✅ Dataset successfully loaded from: {filename}")
-        print(f"📊 Dataset Shape: {df.shape[0]} rows, {df.shape[1]} columns")
-
-        # Inspect first few rows
-        print("\n🔍 Raw Data Sample (First 5 rows):")
-        print(df.head())
-
-        # Standardize column names
-        df.columns = df.columns.str.strip().str.lower()
-        
-        # Drop 'id' column if it exists (since it's not useful for ML)
-        if 'id' in df.columns:
-            df = df.drop(columns=['id'])
-        
-        # Convert numeric columns (excluding diagnosis) to proper types
-        numeric_cols = df.columns.difference(['diagnosis'])
-        df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors='coerce')
-        
-        # Display dataset info after conversion
-        print("\n📌 Dataset Info After Processing:")
-        print(df.info())
-
-        return df
-
-    except FileNotFoundError as fnf_error:
-        print(fnf_error)
-        return None
-    except pd.errors.EmptyDataError:
-        print("❌ Error: The file is empty. Please provide a valid dataset.")
-        return None
-    except pd.errors.ParserError:
-        print("❌ Error: The file could not be parsed. Please check the file format.")
-        return None
-    except Exception as e:
-        print(f"❌ An error occurred while processing the dataset: {e}")
-        return None
-
-# Run the debugging function
-df = load_and_debug_dataset(csv_filename)
+# load_and_debug_dataset lives in hackbio/cancer.py
 
 # ==============================================
 # 2.2 Data Preprocessing
 # ==============================================
-# Drop rows with missing target values
-X = df.drop('diagnosis', axis=1) # Features
-y = df['diagnosis'] # Target
-
-# Encode 'diagnosis' as numerical (0 = benign, 1 = malignant)
-y = y.map({'B': 0, 'M': 1})
-
-# Handle missing values
-imputer = SimpleImputer(strategy='mean')
-X = imputer.fit_transform(X)
-
-# Scale features
-scaler = StandardScaler()
-X_scaled = scaler.fit_transform(X)
+# Load (via load_and_debug_dataset), encode 'diagnosis' (0 = benign, 1 = malignant),
+# impute missing values with the mean and scale features. The result is cached on the
+# CSV's content hash, so unchanged data skips straight to modelling.
+preprocessed = preprocess_cached(csv_filename, load_and_debug_dataset,
+                                 cache_dir=os.path.join(script_dir, ".preprocessing_cache"),
+                                 target='diagnosis', label_map=LABEL_MAP, strategy='mean')
+
+X_raw = preprocessed['X_raw'] # Raw features for the packaged model pipeline (Section 5)
+X_scaled = preprocessed['X_scaled'] # Imputed & scaled features
+y = preprocessed['y'] # Target
+imputer = preprocessed['imputer']
+scaler = preprocessed['scaler']
+feature_names = preprocessed['feature_names']
 
 # ==============================================
 # Section 3: Data Analysis and Model Building
 # ==============================================
 # 3.1 Apply PCA for Dimensionality Reduction
 # ==============================================
-pca = PCA(n_components=2)
-X_pca = pca.fit_transform(X_scaled)
+# Reuse the persisted projection when available so new samples land in the same space
+pca_model_filename = os.path.join(script_dir, "pca_projection.joblib")
+projection = load_projection(pca_model_filename, n_features=X_raw.shape[1], feature_names=feature_names)
+
+if projection is None:
+    pca = fit_projection(X_scaled, n_components=2)
+    projection = {"imputer": imputer, "scaler": scaler, "pca": pca}
+    save_projection(projection, pca_model_filename)
+
+pca = projection["pca"]
+X_pca = project_samples(projection, X_raw)
+
+# Optional: compare solver throughput against the full-SVD path
+if os.getenv("HACKBIO_BENCHMARK_PCA"):
+    benchmark_projection(X_scaled)
 
 # Variance explained by each component
 print("\n🔍 PCA Explained Variance:", pca.explained_variance_ratio_)
 
 # ==============================================
 # 3.2 Visualize PCA Result
+# (one marker per sample; large datasets are drawn as hexbins colored by the most common diagnosis)
 # ==============================================
 plt.figure(figsize=(8, 6))
-plt.scatter(X_pca[:, 0], X_pca[:, 1], c=y, cmap='coolwarm', alpha=0.7)
+points = class_density_scatter(plt.gca(), X_pca[:, 0], X_pca[:, 1], y, cmap='coolwarm', alpha=0.7)
 plt.xlabel('Principal Component 1')
 plt.ylabel('Principal Component 2')
 plt.title('PCA Visualization of Cancer Data')
-plt.colorbar(label='Diagnosis (0=Benign, 1=Malignant)')
-plt.show()
+plt.colorbar(points, label='Diagnosis (0=Benign, 1=Malignant)')
+show_figure('PCA Visualization of Cancer Data')
 
 # ==============================================
 # Section 4: Clustering and Classification
@@ -117,49 +92,50 @@ plt.show()
 # 4.1 Apply K-Means Clustering
 # ==============================================
 # Determine optimal K using Elbow Method
-wcss = []
-for k in range(1, 11):
-    kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-    kmeans.fit(X_scaled)
-    wcss.append(kmeans.inertia_)
+# (discover_subclasses fits every k concurrently and keeps the fit for the chosen k)
+overall_clustering = discover_subclasses(X_scaled, k_range=range(1, 11), n_clusters=2)['groups']['all']
+wcss = overall_clustering['wcss']
 
 plt.figure(figsize=(8, 6))
-plt.plot(range(1, 11), wcss, marker='o', linestyle='--')
+plt.plot(wcss.index, wcss, marker='o', linestyle='--')
 plt.xlabel('Number of Clusters (K)')
 plt.ylabel('WCSS (Within-cluster Sum of Squares)')
 plt.title('Elbow Method for Optimal K')
-plt.show()
+show_figure('Elbow Method for Optimal K')
 
 #  ==============================================
 # 4.2 Apply K-means with optimal K (assuming 2 based on domain knowledge)
 # ==============================================
-kmeans = KMeans(n_clusters=2, random_state=42, n_init=10)
-clusters = kmeans.fit_predict(X_scaled)
+# (reused from the elbow fits above, no refit)
+kmeans = overall_clustering['model']
+clusters = overall_clustering['labels']
 
 # ==============================================
 # 4.3 Visualize Clustering Result
 # ==============================================
 plt.figure(figsize=(8, 6))
-plt.scatter(X_pca[:, 0], X_pca[:, 1], c=clusters, cmap='viridis', alpha=0.7)
+points = class_density_scatter(plt.gca(), X_pca[:, 0], X_pca[:, 1], clusters, cmap='viridis', alpha=0.7)
 plt.xlabel('Principal Component 1')
 plt.ylabel('Principal Component 2')
 plt.title('K-Means Clustering on PCA-Reduced Data')
-plt.colorbar(label='Cluster')
-plt.show()
+plt.colorbar(points, label='Cluster')
+show_figure('K-Means Clustering on PCA-Reduced Data')
 
 # ==============================================
 # Section 5: Model Training, & Evaluation;
 #           Train-Test Split.
 # ==============================================
 # 5: Data Splitting
-X_train, X_test, y_train, y_test = train_test_split(X_scaled, y, test_size=0.2, random_state=42)
+# The pipeline fits its own imputer and scaler, so it is trained on the raw features
+X_train, X_test, y_train, y_test = train_test_split(X_raw, y, test_size=0.2, random_state=42)
 
-# 5.1: Model Selection and Training
-model = LogisticRegression()
-model.fit(X_train, y_train)
+# 5.1: Model Selection and Training (SimpleImputer -> StandardScaler -> LogisticRegression)
+diagnosis_pipeline = build_diagnosis_pipeline()
+diagnosis_pipeline.fit(X_train, y_train)
+model = diagnosis_pipeline.named_steps['classifier']
 
 # 5.2: Model Evaluation
-y_pred = model.predict(X_test)
+y_pred = diagnosis_pipeline.predict(X_test)
 accuracy = accuracy_score(y_test, y_pred)
 precision = precision_score(y_test, y_pred)
 recall = recall_score(y_test, y_pred)
@@ -175,87 +151,88 @@ print(conf_matrix)
 print("Classification Report:")
 print(classification_report(y_test, y_pred))
 
+# 5.3: Save the versioned pipeline for score_samples.py
+models_dir = os.path.join(script_dir, "models")
+save_model_artifact(diagnosis_pipeline, models_dir, feature_names, metrics={
+    "accuracy": accuracy, "precision": precision, "recall": recall, "f1": f1,
+}, training_data_hash=preprocessed['meta']['key'])
+
+# 5.4: Stratified K-Fold Cross-Validation & Hyperparameter Search
+# (C, penalty, solver, class_weight; preprocessing is fitted once per fold)
+cv_report = evaluate_classifier(X_raw, y, n_splits=5, n_repeats=int(os.getenv("HACKBIO_CV_REPEATS", "1")))
+print_evaluation(cv_report)
+
 # ==============================================
 # Section 6: Detecting Subclasses
 # ==============================================
-# Separate benign and malignant cases
-benign_data = X_scaled[y == 0]
-malignant_data = X_scaled[y == 1]
-
-# Function to find optimal K for subclasses
-def find_optimal_k(data, title):
-    wcss = []
-    for k in range(1, 11):
-        kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-        kmeans.fit(data)
-        wcss.append(kmeans.inertia_)
+# K selection and final clustering for every diagnosis group run concurrently;
+# the chosen k per group comes from the elbow of its WCSS curve
+subclass_result = discover_subclasses(X_scaled, labels=y, k_range=range(1, 11), method='elbow')
+print("\n🔬 Subclasses per diagnosis group:")
+print(subclass_result['summary'])
+
+for group, name, cmap in [(0, 'Benign', 'coolwarm'), (1, 'Malignant', 'viridis')]:
+    subclasses = subclass_result['groups'][group]
+
     plt.figure(figsize=(8, 6))
-    plt.plot(range(1, 11), wcss, marker='o', linestyle='--')
+    plt.plot(subclasses['wcss'].index, subclasses['wcss'], marker='o', linestyle='--')
+    plt.axvline(subclasses['k'], color='grey', linestyle=':', label=f"Chosen K = {subclasses['k']}")
     plt.xlabel('Number of Clusters (K)')
     plt.ylabel('WCSS')
-    plt.title(f'Elbow Method for {title}')
-    plt.show()
+    plt.title(f'Elbow Method for {name} Subclasses')
+    plt.legend()
+    show_figure(f'Elbow Method for {name} Subclasses')
 
-# Determine optimal clusters for benign and malignant
-find_optimal_k(benign_data, 'Benign Subclasses')
-find_optimal_k(malignant_data, 'Malignant Subclasses')
-
-# Apply K-means to find subclasses
-optimal_k_benign = 2  # Adjust based on elbow method
-optimal_k_malignant = 2  # Adjust based on elbow method
-
-kmeans_benign = KMeans(n_clusters=optimal_k_benign, random_state=42, n_init=10)
-kmeans_malignant = KMeans(n_clusters=optimal_k_malignant, random_state=42, n_init=10)
-
-benign_clusters = kmeans_benign.fit_predict(benign_data)
-malignant_clusters = kmeans_malignant.fit_predict(malignant_data)
-
-# Visualize subclass distributions
-plt.figure(figsize=(8, 6))
-plt.scatter(X_pca[y == 0, 0], X_pca[y == 0, 1], c=benign_clusters, cmap='coolwarm', alpha=0.7)
-plt.xlabel('Principal Component 1')
-plt.ylabel('Principal Component 2')
-plt.title('Benign Subclasses')
-plt.colorbar(label='Subclass')
-plt.show()
-
-plt.figure(figsize=(8, 6))
-plt.scatter(X_pca[y == 1, 0], X_pca[y == 1, 1], c=malignant_clusters, cmap='viridis', alpha=0.7)
-plt.xlabel('Principal Component 1')
-plt.ylabel('Principal Component 2')
-plt.title('Malignant Subclasses')
-plt.colorbar(label='Subclass')
-plt.show()
+    # Visualize subclass distributions
+    plt.figure(figsize=(8, 6))
+    group_pca = X_pca[subclasses['rows']]
+    points = class_density_scatter(plt.gca(), group_pca[:, 0], group_pca[:, 1], subclasses['labels'], cmap=cmap, alpha=0.7)
+    plt.xlabel('Principal Component 1')
+    plt.ylabel('Principal Component 2')
+    plt.title(f'{name} Subclasses')
+    plt.colorbar(points, label='Subclass')
+    show_figure(f'{name} Subclasses')
 
 # ==============================================
 # Section 7: Feature Importance; (Additional Analysis)
 # ==============================================
-# 7.1: Feature Importance in Logistic Regression Model
-feature_importance = abs(model.coef_[0])
-feature_names = df.drop(columns=['diagnosis']).columns
+# 7.1: Permutation Feature Importance of the Diagnosis Pipeline
+# (drop in held-out accuracy when a feature group is shuffled; works for any classifier.
+# The _mean/_se/_worst measurements of one property are permuted together.)
+importance_groups = feature_groups(feature_names)
+importance_result = permutation_importance(diagnosis_pipeline, X_test, y_test, groups=importance_groups,
+                                           n_repeats=20, scoring='accuracy', n_jobs=None)
+feature_importance = importance_result['importances']
+print(f"\n🔍 Baseline test accuracy: {importance_result['baseline_score']:.4f}")
+print(feature_importance)
 
 plt.figure(figsize=(10, 6))
-sns.barplot(x=feature_importance, y=feature_names, palette='coolwarm')
-plt.xlabel('Feature Importance')
-plt.ylabel('Feature')
-plt.title('Feature Importance in Logistic Regression Model')
-plt.show()
+plt.barh(feature_importance['group'], feature_importance['importance_mean'],
+         xerr=[feature_importance['importance_mean'] - feature_importance['ci_low'],
+               feature_importance['ci_high'] - feature_importance['importance_mean']],
+         color=sns.color_palette('coolwarm', len(feature_importance)), capsize=3)
+plt.gca().invert_yaxis()
+plt.xlabel('Permutation Importance (drop in accuracy, 95% CI)')
+plt.ylabel('Feature Group')
+plt.title('Permutation Feature Importance of the Diagnosis Model')
+show_figure('Permutation Feature Importance of the Diagnosis Model')
 
 # ==============================================
 # Section 8: Additional Clustering Methods and Validation
 # ==============================================
 # 8.1: Apply Hierarchical Clustering
-hierarchical = AgglomerativeClustering(n_clusters=2)
-hierarchical_labels = hierarchical.fit_predict(X_scaled)
+# (the tree is built once; flat labels and the dendrogram both come from it)
+hierarchical = hierarchical_clustering(X_scaled, n_clusters=2, method='ward')
+linkage_matrix = hierarchical['linkage']
+hierarchical_labels = hierarchical['labels']
 
-# 8.2: Visualize Hierarchical Clustering Result
-linkage_matrix = linkage(X_scaled, method='ward')
+# 8.2: Visualize Hierarchical Clustering Result (last 30 merges only)
 plt.figure(figsize=(10, 5))
-dendrogram(linkage_matrix)
-plt.title("Hierarchical Clustering Dendrogram")
-plt.xlabel("Samples")
+plot_truncated_dendrogram(linkage_matrix, p=30, truncate_mode='lastp')
+plt.title("Hierarchical Clustering Dendrogram (Truncated)")
+plt.xlabel("Samples (cluster size in brackets)")
 plt.ylabel("Distance")
-plt.show()
+show_figure("Hierarchical Clustering Dendrogram")
 
 # 8.3: Cluster Validation
 silhouette_avg = silhouette_score(X_scaled, clusters)
@@ -280,4 +257,4 @@ sns.histplot(clusters, bins=2, kde=True)
 plt.title("Distribution of K-Means Clusters")
 plt.xlabel("Cluster Label")
 plt.ylabel("Count")
-plt.show()
+show_figure("Distribution of K-Means Clusters")
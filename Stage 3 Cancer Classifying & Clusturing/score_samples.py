@@ -0,0 +1,192 @@
+# ==============================================
+# Batch Scoring: Score New Samples with the Saved Diagnosis Model
+# ==============================================
+#
+# One-shot:   python score_samples.py new_samples.csv --output predictions.csv
+# Worker:     python score_samples.py --serve
+#             (reads one input path per line on stdin, model stays loaded)
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Make the shared hackbio package (repository root) importable when running this script directly
+sys.path.insert(0, os.path.dirname(script_dir))
+
+from hackbio.model_artifacts import load_model_artifact
+
+default_model_dir = os.path.join(script_dir, "models")
+
+
+def iter_sample_batches(filename, batch_size=10000):
+    """
+    Reads samples from a CSV or Parquet file in batches.
+
+    Parameters:
+        filename (str): Path of a .csv or .parquet file.
+        batch_size (int): Number of rows per batch.
+
+    Yields:
+        batch (pd.DataFrame): The next batch of rows.
+    """
+    if filename.endswith((".parquet", ".pq")):
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(filename)
+        for record_batch in parquet_file.iter_batches(batch_size=batch_size):
+            yield record_batch.to_pandas()
+    else:
+        yield from pd.read_csv(filename, chunksize=batch_size)
+
+
+def score_batch(pipeline, manifest, batch):
+    """
+    Scores one batch of samples in a single vectorized call.
+
+    Parameters:
+        pipeline (Pipeline): Fitted diagnosis pipeline.
+        manifest (dict): Artifact metadata with the expected feature names.
+        batch (pd.DataFrame): Raw samples, columns in any order or case.
+
+    Returns:
+        predictions (pd.DataFrame): Predicted diagnosis and malignancy probability per sample.
+
+    Raises:
+        ValueError: If a feature column is missing or holds no numeric value at all.
+    """
+    batch = batch.copy()
+    batch.columns = batch.columns.str.strip().str.lower()
+
+    # Individual missing values are filled by the pipeline's imputer, but a whole
+    # missing or non-numeric column would silently score every sample on the training means
+    missing = [name for name in manifest["feature_names"] if name not in batch.columns]
+    if missing:
+        raise ValueError(f"❌ Error: input is missing {len(missing)} feature column(s): {', '.join(missing)}")
+
+    raw_features = batch[manifest["feature_names"]]
+    features = raw_features.apply(pd.to_numeric, errors="coerce")
+    non_numeric = [name for name in manifest["feature_names"]
+                   if raw_features[name].notna().any() and features[name].isna().all()]
+    if non_numeric:
+        raise ValueError(f"❌ Error: feature column(s) with no numeric values: {', '.join(non_numeric)}")
+
+    probabilities = pipeline.predict_proba(features)[:, 1]
+    inverse_labels = {code: label for label, code in manifest["label_map"].items()}
+
+    predictions = pd.DataFrame({
+        "diagnosis_pred": np.where(probabilities >= 0.5, inverse_labels[1], inverse_labels[0]),
+        "malignant_probability": probabilities,
+    })
+    if "id" in batch.columns:
+        predictions.insert(0, "id", batch["id"].to_numpy())
+    return predictions
+
+
+def score_file(pipeline, manifest, filename, output_filename, batch_size=10000, log=print):
+    """
+    Scores every sample in a file and writes the predictions as CSV.
+
+    Parameters:
+        pipeline (Pipeline): Fitted diagnosis pipeline.
+        manifest (dict): Artifact metadata.
+        filename (str): Input CSV or Parquet file.
+        output_filename (str): Path of the predictions CSV.
+        batch_size (int): Number of rows per batch.
+        log (callable): Receives one metrics dictionary per batch.
+
+    Returns:
+        summary (dict): Total rows, wall time and throughput for the file.
+    """
+    start_file = time.perf_counter()
+    total_rows = 0
+
+    for batch_index, batch in enumerate(iter_sample_batches(filename, batch_size)):
+        start = time.perf_counter()
+        predictions = score_batch(pipeline, manifest, batch)
+        latency = time.perf_counter() - start
+
+        predictions.to_csv(output_filename, mode="w" if batch_index == 0 else "a",
+                           header=batch_index == 0, index=False)
+        total_rows += len(predictions)
+
+        log({
+            "event": "batch",
+            "file": filename,
+            "batch": batch_index,
+            "rows": len(predictions),
+            "latency_ms": round(latency * 1000, 3),
+            "rows_per_second": round(len(predictions) / latency, 1) if latency > 0 else None,
+        })
+
+    elapsed = time.perf_counter() - start_file
+    summary = {
+        "event": "file",
+        "file": filename,
+        "output": output_filename,
+        "rows": total_rows,
+        "seconds": round(elapsed, 4),
+        "rows_per_second": round(total_rows / elapsed, 1) if elapsed > 0 else None,
+        "model_version": manifest["version"],
+        "model_sha256": manifest["sha256"],
+    }
+    log(summary)
+    return summary
+
+
+def default_output_filename(filename, output_dir=None):
+    """Returns '<input name>.predictions.csv', next to the input or in output_dir."""
+    base = os.path.splitext(os.path.basename(filename))[0] + ".predictions.csv"
+    return os.path.join(output_dir or os.path.dirname(os.path.abspath(filename)), base)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score samples with the saved diagnosis model.")
+    parser.add_argument("inputs", nargs="*", help="CSV or Parquet files to score.")
+    parser.add_argument("--model-dir", default=default_model_dir, help="Directory with versioned model artifacts.")
+    parser.add_argument("--version", type=int, default=None, help="Model version (default: newest).")
+    parser.add_argument("--output", default=None, help="Output CSV (single input only).")
+    parser.add_argument("--output-dir", default=None, help="Directory for prediction files.")
+    parser.add_argument("--batch-size", type=int, default=10000, help="Rows per scoring batch.")
+    parser.add_argument("--serve", action="store_true",
+                        help="Stay alive and score each file path read from stdin.")
+    args = parser.parse_args(argv)
+
+    def log(record):
+        print(json.dumps(record), flush=True)
+
+    start = time.perf_counter()
+    pipeline, manifest = load_model_artifact(args.model_dir, args.version)
+    log({"event": "model_loaded", "version": manifest["version"], "sha256": manifest["sha256"],
+         "load_ms": round((time.perf_counter() - start) * 1000, 3)})
+
+    if args.output and len(args.inputs) != 1:
+        parser.error("--output can only be used with a single input file")
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    for filename in args.inputs:
+        output_filename = args.output or default_output_filename(filename, args.output_dir)
+        score_file(pipeline, manifest, filename, output_filename, args.batch_size, log)
+
+    if args.serve:
+        # Long-lived worker: the model is loaded once and reused for every request
+        for line in sys.stdin:
+            filename = line.strip()
+            if not filename:
+                continue
+            try:
+                score_file(pipeline, manifest, filename,
+                           default_output_filename(filename, args.output_dir), args.batch_size, log)
+            except Exception as e:
+                log({"event": "error", "file": filename, "error": str(e)})
+
+
+if __name__ == "__main__":
+    main()
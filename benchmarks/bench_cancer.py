@@ -0,0 +1,70 @@
+# ==============================================
+# Benchmarks: Cancer Dataset Cleaning & Stage 3 Preprocessing, K-Means, PCA
+# ==============================================
+
+import os
+
+import numpy as np
+import pytest
+from sklearn.cluster import KMeans
+from sklearn.impute import SimpleImputer
+from sklearn.preprocessing import StandardScaler
+
+from hackbio.cancer import clean_dataset
+from hackbio.dimensionality_reduction import fit_projection
+from hackbio.importance import feature_groups, permutation_importance
+from hackbio.model_artifacts import build_diagnosis_pipeline
+from hackbio.subclasses import discover_subclasses
+from synthetic import cancer_features, write_raw_cancer_csv
+
+
+def preprocess(X):
+    X_imputed = SimpleImputer(strategy="mean").fit_transform(X)
+    return StandardScaler().fit_transform(X_imputed)
+
+
+@pytest.mark.benchmark(group="cancer")
+def bench_clean_dataset(run, scale, tmp_path):
+    raw_csv = write_raw_cancer_csv(os.path.join(tmp_path, "raw.csv"), scale)
+    df = run(clean_dataset, raw_csv, os.path.join(tmp_path, "cleaned.csv"))
+    assert len(df) == 569 * scale
+
+
+@pytest.mark.benchmark(group="cancer")
+def bench_preprocess(run, scale):
+    X, y = cancer_features(scale)
+    X_scaled = run(preprocess, X)
+    assert not np.isnan(X_scaled).any()
+
+
+@pytest.mark.benchmark(group="cancer")
+def bench_kmeans(run, scale):
+    X_scaled = preprocess(cancer_features(scale)[0])
+
+    def fit_kmeans():
+        return KMeans(n_clusters=2, random_state=42, n_init=10).fit(X_scaled)
+
+    assert run(fit_kmeans, rounds=3).inertia_ > 0
+
+
+@pytest.mark.benchmark(group="cancer")
+def bench_fit_projection(run, scale):
+    X_scaled = preprocess(cancer_features(scale)[0])
+    assert run(fit_projection, X_scaled, n_components=2).n_components_ == 2
+
+
+@pytest.mark.benchmark(group="cancer")
+def bench_discover_subclasses(run, scale):
+    X, y = cancer_features(scale)
+    X_scaled = preprocess(X)
+    result = run(discover_subclasses, X_scaled, y, k_range=range(1, 6), n_jobs=1, rounds=2)
+    assert set(result["groups"]) == {0, 1}
+
+
+@pytest.mark.benchmark(group="cancer")
+def bench_permutation_importance(run, scale):
+    X, y = cancer_features(scale)
+    pipeline = build_diagnosis_pipeline().fit(X, y)
+    groups = feature_groups(list(X.columns))
+    result = run(permutation_importance, pipeline, X, y, groups=groups, n_repeats=3, n_jobs=1, rounds=2)
+    assert len(result["importances"]) == len(groups)
@@ -0,0 +1,45 @@
+# ==============================================
+# Benchmarks: Logistic Growth Curves & Parameter Fitting
+# ==============================================
+
+import random
+
+import pytest
+
+from hackbio.growth import generate_growth_curves, logistic_growth, time_to_80_percent
+from hackbio.growth_fitting import fit_growth_curves, growth_matrix_from_frame
+from synthetic import BASE_SIZES, GROWTH_PARAMS, growth_curves
+
+
+@pytest.mark.benchmark(group="growth")
+def bench_logistic_growth(benchmark):
+    random.seed(0)
+    time, population = benchmark(logistic_growth, **GROWTH_PARAMS)
+    assert len(population) == GROWTH_PARAMS["total_time"]
+
+
+@pytest.mark.benchmark(group="growth")
+def bench_generate_growth_curves(run, scale):
+    num_curves = BASE_SIZES["growth_curves"] * scale
+    random.seed(0)
+    df = run(generate_growth_curves, num_curves, **GROWTH_PARAMS)
+    assert len(df) == num_curves * GROWTH_PARAMS["total_time"]
+
+
+@pytest.mark.benchmark(group="growth")
+def bench_time_to_80_percent(run, scale):
+    curves = growth_curves(BASE_SIZES["growth_curves"] * scale)
+
+    def all_curves():
+        return [time_to_80_percent(time, population, GROWTH_PARAMS["K"]) for time, population in curves]
+
+    assert len(run(all_curves)) == len(curves)
+
+
+@pytest.mark.benchmark(group="growth")
+def bench_fit_growth_curves(run, scale):
+    random.seed(0)
+    wells, time, od = growth_matrix_from_frame(
+        generate_growth_curves(BASE_SIZES["growth_curves"] * scale, **GROWTH_PARAMS))
+    fits = run(fit_growth_curves, time, od, wells=wells, rounds=3)
+    assert len(fits) == len(wells)
@@ -0,0 +1,45 @@
+# ==============================================
+# Benchmarks: SIFT/FoldX Load, Merge, Filter & Frequencies
+# ==============================================
+
+import pytest
+
+from hackbio.mutation_frequencies import mutation_frequencies
+from hackbio.mutations import filter_deleterious_mutations, load_mutation_dataset, merge_mutation_datasets
+from synthetic import BASE_SIZES, FOLDX_CSV, SIFT_CSV, mutation_frames
+
+
+@pytest.mark.benchmark(group="mutations")
+def bench_load_bundled(run):
+    def load_both():
+        return load_mutation_dataset(SIFT_CSV), load_mutation_dataset(FOLDX_CSV)
+
+    sift_df, foldx_df = run(load_both)
+    assert "Protein" in sift_df.columns and "Protein" in foldx_df.columns
+
+
+@pytest.mark.benchmark(group="mutations")
+def bench_merge_bundled(run):
+    sift_df, foldx_df = load_mutation_dataset(SIFT_CSV), load_mutation_dataset(FOLDX_CSV)
+    merged_df = run(merge_mutation_datasets, sift_df, foldx_df)
+    assert len(merged_df) > 0
+
+
+@pytest.mark.benchmark(group="mutations")
+def bench_merge_synthetic(run, scale):
+    sift_df, foldx_df = mutation_frames(BASE_SIZES["mutation_rows"] * scale)
+    assert len(run(merge_mutation_datasets, sift_df, foldx_df)) > 0
+
+
+@pytest.mark.benchmark(group="mutations")
+def bench_filter_deleterious(run, scale):
+    merged_df = merge_mutation_datasets(*mutation_frames(BASE_SIZES["mutation_rows"] * scale))
+    deleterious_mutations = run(filter_deleterious_mutations, merged_df)
+    assert len(deleterious_mutations) < len(merged_df)
+
+
+@pytest.mark.benchmark(group="mutations")
+def bench_mutation_frequencies(run, scale):
+    sift_df, foldx_df = mutation_frames(BASE_SIZES["mutation_rows"] * scale)
+    frequencies = run(mutation_frequencies, sift_df)
+    assert frequencies.total == len(sift_df)
@@ -0,0 +1,51 @@
+# ==============================================
+# Benchmarks: DNA Translation & Sequence Comparison
+# ==============================================
+
+import pytest
+
+from hackbio.kmers import sequence_stats
+from hackbio.sequences import KmerIndex, hamming_distance, levenshtein_distance
+from hackbio.translation import translate_dna_to_protein
+from synthetic import BASE_SIZES, coding_sequence, random_dna, read_set, string_pair
+
+
+@pytest.mark.benchmark(group="translation")
+def bench_translate_short(benchmark):
+    protein = benchmark(translate_dna_to_protein, "ATGGCCATTGTAATGGGCCGCTGAA")
+    assert protein == "MAIVMGR"
+
+
+@pytest.mark.benchmark(group="translation")
+def bench_translate_long(run, scale):
+    dna = coding_sequence(BASE_SIZES["dna_bases"] * scale)
+    protein = run(translate_dna_to_protein, dna)
+    assert len(protein) == len(dna) // 3
+
+
+@pytest.mark.benchmark(group="hamming")
+def bench_hamming_distance(run, scale):
+    first, second = string_pair(BASE_SIZES["hamming_length"] * scale)
+    assert run(hamming_distance, first, second) > 0
+
+
+@pytest.mark.benchmark(group="edit distance")
+def bench_levenshtein_distance(run, scale):
+    first, second = string_pair(BASE_SIZES["edit_length"] * scale)
+    assert run(levenshtein_distance, first, second[1:]) > 0
+
+
+@pytest.mark.benchmark(group="edit distance")
+def bench_kmer_index_search(run, scale):
+    reads = read_set(BASE_SIZES["reads"] * scale)
+    index = KmerIndex(reads, k=5)
+    query = reads[0][:10] + "A" + reads[0][11:]
+    assert run(index.search, query, 2)[0][0] == 0
+
+
+@pytest.mark.benchmark(group="k-mers")
+@pytest.mark.parametrize("k", [6, 21])
+def bench_sequence_stats(run, scale, k):
+    dna = random_dna(BASE_SIZES["dna_bases"] * scale)
+    stats = run(sequence_stats, [dna], k=k)
+    assert stats.kmer_table.sum() == len(dna) - k + 1
@@ -0,0 +1,32 @@
+# ==============================================
+# Benchmarks: Differential Expression Filtering
+# ==============================================
+
+import pytest
+
+from hackbio.transcriptomics import load_transcriptomics_dataset, significant_gene_masks
+from synthetic import BASE_SIZES, TRANSCRIPTOMICS_CSV, transcriptomics_frame
+
+
+def split_significant_genes(df):
+    upregulated, downregulated = significant_gene_masks(df, log2fc_threshold=1, pvalue_threshold=0.01)
+    return df[upregulated], df[downregulated]
+
+
+@pytest.mark.benchmark(group="transcriptomics")
+def bench_load_bundled(run):
+    assert "neg_log10_pvalue" in run(load_transcriptomics_dataset, TRANSCRIPTOMICS_CSV).columns
+
+
+@pytest.mark.benchmark(group="transcriptomics")
+def bench_filter_bundled(run):
+    upregulated_genes, downregulated_genes = run(split_significant_genes,
+                                                 load_transcriptomics_dataset(TRANSCRIPTOMICS_CSV))
+    assert len(upregulated_genes) > 0 and len(downregulated_genes) > 0
+
+
+@pytest.mark.benchmark(group="transcriptomics")
+def bench_filter_synthetic(run, scale):
+    upregulated_genes, downregulated_genes = run(split_significant_genes,
+                                                 transcriptomics_frame(BASE_SIZES["genes"] * scale))
+    assert len(upregulated_genes) > 0 and len(downregulated_genes) > 0
@@ -0,0 +1,147 @@
+# ==============================================
+# Benchmark Runner & Regression Check
+# ==============================================
+#
+# python benchmarks/compare.py run [--save NAME] [--compare]   # run the suite, store JSON
+# python benchmarks/compare.py compare [BASELINE] [CURRENT]    # flag regressions
+#
+# Results are pytest-benchmark JSON files: the latest run is written to
+# benchmarks/results/latest.json and saved baselines to benchmarks/baselines/.
+# Timings are machine-specific, so compare runs from the same machine.
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+benchmarks_dir = os.path.dirname(os.path.abspath(__file__))
+repo_root = os.path.dirname(benchmarks_dir)
+LATEST_RESULTS = os.path.join(benchmarks_dir, "results", "latest.json")
+DEFAULT_BASELINE = os.path.join(benchmarks_dir, "baselines", "baseline.json")
+
+
+def run_suite(output_file, pytest_args=()):
+    """
+    Runs the benchmark suite and writes the pytest-benchmark JSON results.
+
+    Parameters:
+        output_file (str): JSON results path.
+        pytest_args (list): Extra pytest arguments (e.g. -k translate).
+
+    Returns:
+        returncode (int): pytest's exit code.
+    """
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    command = [sys.executable, "-m", "pytest", "-c", os.path.join(benchmarks_dir, "pytest.ini"),
+               benchmarks_dir, f"--benchmark-json={output_file}", *pytest_args]
+    print(f"🔄 Running: {' '.join(command)}")
+    return subprocess.call(command, cwd=repo_root)
+
+
+def load_stats(filename, stat="min"):
+    """
+    Reads one statistic per benchmark from a pytest-benchmark JSON file.
+
+    Parameters:
+        filename (str): JSON results path.
+        stat (str): Statistic to compare (min, median, mean).
+
+    Returns:
+        stats (dict): Benchmark full name -> seconds.
+    """
+    with open(filename) as f:
+        data = json.load(f)
+    return {bench["fullname"]: bench["stats"][stat] for bench in data["benchmarks"]}
+
+
+def compare_results(baseline_file, current_file, threshold=10.0, stat="min"):
+    """
+    Compares two result files and prints one line per benchmark.
+
+    Parameters:
+        baseline_file (str): Baseline JSON results.
+        current_file (str): Current JSON results.
+        threshold (float): Slowdown in percent above which a benchmark is a regression.
+        stat (str): Statistic to compare (min, median, mean).
+
+    Returns:
+        regressions (list): Full names of the benchmarks slower than the threshold allows.
+    """
+    baseline = load_stats(baseline_file, stat)
+    current = load_stats(current_file, stat)
+
+    regressions = []
+    print(f"\n📊 {stat} time, current vs {os.path.relpath(baseline_file, repo_root)} "
+          f"(regression threshold {threshold:.0f}%):")
+    for name in sorted(set(baseline) | set(current)):
+        if name not in current:
+            print(f"  ⚠️ {name:<70} missing from the current run")
+            continue
+        if name not in baseline:
+            print(f"  🆕 {name:<70} {current[name] * 1000:12.3f} ms (no baseline)")
+            continue
+
+        change = (current[name] - baseline[name]) / baseline[name] * 100
+        if change > threshold:
+            icon = "❌"
+            regressions.append(name)
+        elif change < -threshold:
+            icon = "⚡"
+        else:
+            icon = "✅"
+        print(f"  {icon} {name:<70} {baseline[name] * 1000:12.3f} ms -> {current[name] * 1000:12.3f} ms "
+              f"({change:+6.1f}%)")
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} benchmark(s) regressed by more than {threshold:.0f}%")
+    else:
+        print("\n✅ No regressions")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the benchmark suite and compare it against a baseline.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the suite and write benchmarks/results/latest.json.")
+    run_parser.add_argument("--save", metavar="NAME", help="Also store the results as baselines/NAME.json.")
+    run_parser.add_argument("--compare", action="store_true", help="Compare against the default baseline afterwards.")
+    run_parser.add_argument("--threshold", type=float, default=10.0, help="Regression threshold in percent.")
+    run_parser.add_argument("--stat", default="min", choices=["min", "median", "mean"])
+    run_parser.add_argument("pytest_args", nargs=argparse.REMAINDER, help="Extra pytest arguments after --.")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two result files.")
+    compare_parser.add_argument("baseline", nargs="?", default=DEFAULT_BASELINE)
+    compare_parser.add_argument("current", nargs="?", default=LATEST_RESULTS)
+    compare_parser.add_argument("--threshold", type=float, default=10.0, help="Regression threshold in percent.")
+    compare_parser.add_argument("--stat", default="min", choices=["min", "median", "mean"])
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        pytest_args = [arg for arg in args.pytest_args if arg != "--"]
+        returncode = run_suite(LATEST_RESULTS, pytest_args)
+        if returncode != 0:
+            return returncode
+        if args.save:
+            baseline_file = os.path.join(benchmarks_dir, "baselines", f"{args.save}.json")
+            os.makedirs(os.path.dirname(baseline_file), exist_ok=True)
+            shutil.copyfile(LATEST_RESULTS, baseline_file)
+            print(f"💾 Baseline saved to: {baseline_file}")
+        if not args.compare:
+            return 0
+        baseline_file, current_file = DEFAULT_BASELINE, LATEST_RESULTS
+    else:
+        baseline_file, current_file = args.baseline, args.current
+
+    for filename in (baseline_file, current_file):
+        if not os.path.exists(filename):
+            print(f"❌ Error: '{filename}' not found. Run `python benchmarks/compare.py run --save baseline` first.")
+            return 2
+
+    return 1 if compare_results(baseline_file, current_file, args.threshold, args.stat) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
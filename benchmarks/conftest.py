@@ -0,0 +1,38 @@
+# ==============================================
+# Benchmark Fixtures: Input Scales & Round Counts
+# ==============================================
+#
+# HACKBIO_BENCH_SCALES  comma-separated input scales (default 1,10,100)
+# HACKBIO_BENCH_ROUNDS  timed rounds per benchmark (default 5)
+
+import os
+import sys
+
+import pytest
+
+benchmarks_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(benchmarks_dir))  # hackbio package
+sys.path.insert(0, benchmarks_dir)                   # synthetic input generators
+
+SCALES = tuple(int(scale) for scale in os.getenv("HACKBIO_BENCH_SCALES", "1,10,100").split(","))
+ROUNDS = int(os.getenv("HACKBIO_BENCH_ROUNDS", "5"))
+
+
+def pytest_generate_tests(metafunc):
+    """Runs every benchmark that takes a `scale` argument once per input scale."""
+    if "scale" in metafunc.fixturenames:
+        metafunc.parametrize("scale", SCALES, ids=[f"{scale}x" for scale in SCALES])
+
+
+@pytest.fixture
+def run(benchmark):
+    """
+    Times func(*args, **kwargs) for a fixed number of single-call rounds.
+
+    Large inputs take long enough per call that pytest-benchmark's automatic
+    calibration would waste time; the result of the last call is returned.
+    """
+    def run(func, *args, rounds=None, **kwargs):
+        return benchmark.pedantic(func, args=args, kwargs=kwargs, rounds=rounds or ROUNDS, iterations=1)
+
+    return run
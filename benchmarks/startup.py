@@ -0,0 +1,91 @@
+# ==============================================
+# Startup Benchmark: import hackbio + one translation
+# ==============================================
+#
+# python benchmarks/startup.py [--budget-ms 50] [--runs 5]
+#
+# Runs a fresh interpreter with `-X importtime`, imports the package, translates
+# one sequence and reports the time spent plus the slowest imports. Fails if the
+# median exceeds the budget or if a heavy plotting/ML module was imported.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("numpy", "pandas", "matplotlib", "seaborn", "sklearn", "scipy", "requests")
+
+SNIPPET = """
+import time
+start = time.perf_counter()
+import hackbio
+protein = hackbio.translate_dna_to_protein("ATGGCCATTGTAATGGGCCGCTGAA")
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def parse_importtime(stderr):
+    """
+    Parses `-X importtime` output into (module, self_us, cumulative_us) rows.
+
+    Parameters:
+        stderr (str): Standard error of the benchmarked interpreter.
+
+    Returns:
+        rows (list): One tuple per imported module.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def run_once():
+    """Runs the snippet in a fresh interpreter; returns (elapsed ms, importtime rows)."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", SNIPPET],
+                            cwd=repo_root, capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1]), parse_importtime(result.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure `import hackbio` + one translation.")
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="Maximum allowed median time.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters to time.")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to list.")
+    args = parser.parse_args(argv)
+
+    timings = []
+    rows = []
+    for _ in range(args.runs):
+        elapsed_ms, rows = run_once()
+        timings.append(elapsed_ms)
+
+    median_ms = statistics.median(timings)
+    print(f"⏱️ import hackbio + translate_dna_to_protein: median {median_ms:.2f} ms "
+          f"(min {min(timings):.2f} ms, max {max(timings):.2f} ms, {args.runs} runs)")
+
+    print("\n🐢 Slowest imports (cumulative, last run):")
+    for module, self_us, cumulative_us in sorted(rows, key=lambda row: row[2], reverse=True)[:args.top]:
+        print(f"  {cumulative_us / 1000:8.2f} ms  (self {self_us / 1000:6.2f} ms)  {module}")
+
+    heavy = sorted({module.split(".")[0] for module, _, _ in rows} & set(HEAVY_MODULES))
+    failed = False
+    if heavy:
+        print(f"\n❌ Heavy modules imported at startup: {', '.join(heavy)}")
+        failed = True
+    if median_ms > args.budget_ms:
+        print(f"\n❌ Median {median_ms:.2f} ms exceeds the {args.budget_ms:.0f} ms budget")
+        failed = True
+    if not failed:
+        print(f"\n✅ Within the {args.budget_ms:.0f} ms budget, no heavy modules imported")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
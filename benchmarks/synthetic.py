@@ -0,0 +1,151 @@
+# ==============================================
+# Synthetic Benchmark Inputs (scaled 1x / 10x / 100x)
+# ==============================================
+#
+# Every generator is deterministic (fixed seeds) and offline. Inputs derived
+# from the bundled datasets tile the real rows so their shape and value
+# distributions stay realistic at every scale.
+
+import functools
+import os
+import random
+
+import numpy as np
+import pandas as pd
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MUTATIONS_DIR = os.path.join(repo_root, "Stage 2 Multi BioProjects", "Amino Acid Mutation Analysis")
+TRANSCRIPTOMICS_CSV = os.path.join(repo_root, "Stage 2 Multi BioProjects", "Compond X Transcriptomics",
+                                   "transcriptomics_data.csv")
+CANCER_DIR = os.path.join(repo_root, "Stage 3 Cancer Classifying & Clusturing")
+SIFT_CSV = os.path.join(MUTATIONS_DIR, "sift_dataset.csv")
+FOLDX_CSV = os.path.join(MUTATIONS_DIR, "foldx_dataset.csv")
+RAW_CANCER_CSV = os.path.join(CANCER_DIR, "cancer_transcriptomics.csv")
+CLEANED_CANCER_CSV = os.path.join(CANCER_DIR, "cancer_transcriptomics_cleaned.csv")
+
+# Stage 1 example parameters
+GROWTH_PARAMS = {"K": 1000, "P0": 10, "r": 0.2, "total_time": 100,
+                 "lag_mean": 10, "lag_std": 2, "exp_mean": 30, "exp_std": 5}
+
+# Size of each input at scale 1
+BASE_SIZES = {
+    "dna_bases": 100_000,        # multi-megabase at 10x and 100x
+    "growth_curves": 100,
+    "hamming_length": 1_000,
+    "edit_length": 200,          # edit distance is quadratic in the length
+    "mutation_rows": 10_000,
+    "genes": 10_000,
+    "reads": 10_000,
+}
+
+AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+
+
+@functools.lru_cache(maxsize=None)
+def random_dna(n_bases, seed=0):
+    """Random ACGT sequence of n_bases."""
+    return "".join(random.Random(seed).choices("ACGT", k=n_bases))
+
+
+@functools.lru_cache(maxsize=None)
+def coding_sequence(n_bases, seed=0):
+    """Random open reading frame: ATG followed by non-stop codons, so translation reads it all."""
+    from hackbio.translation import CODON_TABLE
+
+    sense_codons = [codon for codon, amino_acid in CODON_TABLE.items() if amino_acid != "_"]
+    return "ATG" + "".join(random.Random(seed).choices(sense_codons, k=max(0, n_bases // 3 - 1)))
+
+
+@functools.lru_cache(maxsize=None)
+def growth_curves(n_curves, seed=0):
+    """List of (time, population) tuples simulated with the Stage 1 parameters."""
+    from hackbio.growth import logistic_growth
+
+    random.seed(seed)
+    return [logistic_growth(**GROWTH_PARAMS) for _ in range(n_curves)]
+
+
+@functools.lru_cache(maxsize=None)
+def string_pair(length, mismatch_rate=0.1, seed=0):
+    """Two DNA strings of equal length differing at about mismatch_rate of positions."""
+    rng = random.Random(seed)
+    first = random_dna(length, seed)
+    second = "".join(rng.choice("ACGT") if rng.random() < mismatch_rate else base for base in first)
+    return first, second
+
+
+@functools.lru_cache(maxsize=None)
+def read_set(n_reads, length=30, seed=0):
+    """n_reads random reads of about `length` bases (lengths vary by up to 2)."""
+    rng = random.Random(seed)
+    return tuple("".join(rng.choices("ACGT", k=length + rng.randint(-2, 2))) for _ in range(n_reads))
+
+
+@functools.lru_cache(maxsize=None)
+def mutation_frames(n_rows, overlap=0.5, seed=0):
+    """
+    SIFT and FoldX style tables in the bundled layout (Protein, Amino_Acid, score).
+
+    About `overlap` of the FoldX rows share a (Protein, Amino_Acid) key with a SIFT row.
+    """
+    rng = np.random.default_rng(seed)
+    proteins = np.char.add("P", rng.integers(0, max(1, n_rows // 50), n_rows).astype(str))
+    residues = np.array(list(AMINO_ACIDS))
+    amino_acids = np.char.add(np.char.add(residues[rng.integers(0, 20, n_rows)],
+                                          rng.integers(1, 1000, n_rows).astype(str)),
+                              residues[rng.integers(0, 20, n_rows)])
+    sift_df = pd.DataFrame({"Protein": proteins, "Amino_Acid": amino_acids,
+                            "sift_Score": rng.random(n_rows)})
+
+    shared = rng.random(n_rows) < overlap
+    foldx_amino_acids = np.where(shared, amino_acids, np.char.add(amino_acids, "x"))
+    foldx_df = pd.DataFrame({"Protein": proteins, "Amino_Acid": foldx_amino_acids,
+                             "foldX_Score": rng.normal(1.5, 1.5, n_rows)})
+    return sift_df, foldx_df
+
+
+@functools.lru_cache(maxsize=None)
+def transcriptomics_frame(n_genes, seed=0):
+    """Differential expression table (Gene, log2FoldChange, pvalue, padj, neg_log10_pvalue)."""
+    rng = np.random.default_rng(seed)
+    pvalue = 10 ** -np.abs(rng.normal(0, 1.5, n_genes))
+    df = pd.DataFrame({
+        "Gene": np.char.add("G", np.arange(n_genes).astype(str)),
+        "log2FoldChange": rng.normal(0, 0.6, n_genes),
+        "pvalue": pvalue,
+        "padj": np.minimum(1, pvalue * 10),
+    })
+    df["neg_log10_pvalue"] = -np.log10(df["pvalue"])
+    return df
+
+
+def write_raw_cancer_csv(filename, scale):
+    """Writes the bundled malformed cancer CSV with its data rows repeated `scale` times."""
+    with open(RAW_CANCER_CSV) as f:
+        header, *rows = f.readlines()
+    with open(filename, "w") as f:
+        f.write(header)
+        for _ in range(scale):
+            f.writelines(rows)
+    return filename
+
+
+@functools.lru_cache(maxsize=None)
+def cancer_features(scale, noise=0.01, seed=0):
+    """
+    The cleaned cancer features tiled `scale` times with small Gaussian jitter.
+
+    Returns:
+        X (pd.DataFrame): Numeric features (with the dataset's missing values).
+        y (pd.Series): Diagnosis encoded as 0 (B) / 1 (M).
+    """
+    df = pd.read_csv(CLEANED_CANCER_CSV)
+    df.columns = df.columns.str.strip().str.lower()
+    y = df["diagnosis"].map({"B": 0, "M": 1})
+    X = df.drop(columns=["id", "diagnosis"], errors="ignore").apply(pd.to_numeric, errors="coerce")
+
+    rng = np.random.default_rng(seed)
+    tiled = np.tile(X.to_numpy(dtype=float), (scale, 1))
+    tiled += rng.normal(0, noise, tiled.shape) * np.nanstd(X.to_numpy(dtype=float), axis=0)
+    return pd.DataFrame(tiled, columns=X.columns), pd.Series(np.tile(y.to_numpy(), scale), name="diagnosis")
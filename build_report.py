@@ -0,0 +1,44 @@
+# ==============================================
+# Build the Stage 1-3 Figure Report (headless, parallel, cached)
+# ==============================================
+#
+# python build_report.py                          # every section -> report_output/report.html
+# python build_report.py --pdf --jobs 4           # also report.pdf, 4 render processes
+# python build_report.py --sections cancer        # one section
+#
+# Figures whose builder code and data are unchanged since the last run are not
+# rendered again (see report_output/report_manifest.json).
+
+import argparse
+import os
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")  # Never open windows while building the report
+
+from hackbio.report import build_report
+from hackbio.report_figures import SECTIONS, collect_specs
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render every stage figure into one HTML (and PDF) report.")
+    parser.add_argument("--output-dir", default=os.getenv("HACKBIO_REPORT_DIR", os.path.join(repo_root, "report_output")),
+                        help="Directory for the report, its images and the render manifest.")
+    parser.add_argument("--sections", nargs="+", choices=SECTIONS, default=list(SECTIONS), help="Sections to include.")
+    parser.add_argument("--jobs", type=int, default=None, help="Render processes (default: every CPU).")
+    parser.add_argument("--dpi", type=int, default=150, help="Image resolution.")
+    parser.add_argument("--pdf", action="store_true", help="Also write report.pdf.")
+    parser.add_argument("--force", action="store_true", help="Render every figure even if unchanged.")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    specs = collect_specs(repo_root, args.output_dir, sections=args.sections, n_jobs=args.jobs)
+    build_report(specs, args.output_dir, n_jobs=args.jobs, dpi=args.dpi, force=args.force, pdf=args.pdf)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""
+Reusable functions from the HackBio-Biocoding stage scripts.
+
+Importing the package is cheap: each function is loaded from its submodule
+the first time it is accessed, so `hackbio.translate_dna_to_protein` never
+pulls in pandas, matplotlib, scikit-learn or SciPy.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "CODON_TABLE": "translation",
+    "translate_dna_to_protein": "translation",
+    "logistic_growth": "growth",
+    "generate_growth_curves": "growth",
+    "time_to_80_percent": "growth",
+    "hamming_distance": "sequences",
+    "levenshtein_distance": "sequences",
+    "KmerIndex": "sequences",
+    "download_tsv": "mutations",
+    "download_and_process_dataset": "transcriptomics",
+    "download_dataset": "cancer",
+    "clean_dataset": "cancer",
+    "load_and_debug_dataset": "cancer",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,183 @@
+# ==============================================
+# Breast Cancer Dataset: Download, Clean & Load
+# ==============================================
+
+import io
+import os
+
+import pandas as pd
+
+from .profiling import file_size, instrument
+
+DATASET_URL = "https://raw.githubusercontent.com/PacktPublishing/Machine-Learning-in-Biotechnology-and-Life-Sciences/refs/heads/main/datasets/dataset_wisc_sd.csv"
+
+
+@instrument(count=lambda file_path, *args, **kwargs: {"bytes": file_size(file_path)})
+def download_dataset(url, filename="cancer_transcriptomics.csv", output_dir=None):
+    """
+    Downloads a dataset from a given URL and saves it as a CSV file.
+
+    Parameters:
+        url (str): The dataset URL.
+        filename (str): Name of the file to save the dataset as.
+        output_dir (str or None): Directory to save into (current working directory if None).
+
+    Returns:
+        str: The full path of the saved dataset.
+    """
+    import requests  # Imported lazily; only needed when downloading
+
+    try:
+        file_path = os.path.join(output_dir or os.getcwd(), filename)
+
+        # Download the dataset
+        response = requests.get(url)
+        response.raise_for_status()  # Raise an error for failed downloads
+
+        # Read the dataset into a Pandas DataFrame
+        data = pd.read_csv(io.StringIO(response.text), sep=r"\s+")
+
+        # Save DataFrame as CSV
+        data.to_csv(file_path, index=False)
+
+        print(f"Dataset successfully saved to: {file_path}")
+        return file_path
+
+    except requests.exceptions.RequestException as e:
+        print(f"Error downloading dataset: {e}")
+    except Exception as e:
+        print(f"Error processing dataset: {e}")
+
+
+@instrument(count=lambda df, filename, output_filename: {"rows": len(df), "columns": df.shape[1]})
+def clean_dataset(filename, output_filename):
+    """Fix dataset formatting issues and save a cleaned version."""
+    try:
+        if not os.path.exists(filename):
+            raise FileNotFoundError(f"❌ Error: '{filename}' not found. Please check the file path.")
+
+        # Read file as raw text to process formatting issues
+        with open(filename, "r") as f:
+            lines = f.readlines()
+
+        # Step 1: Clean header. The download splits on whitespace, so names such as
+        # "concave points_mean" arrive as two quoted cells ("concave","points_mean");
+        # rejoin them so every name stays over its own column
+        header = lines[0].strip().replace('","', ' ').replace('"', '')  # Remove quotes
+        header_columns = header.split(",")
+
+        # Step 2: Read first data row to get actual column count
+        first_data_row = lines[1].strip().replace('"', '').rstrip(",")
+        first_data_columns = first_data_row.split(",")
+
+        actual_col_count = len(first_data_columns)
+
+        if len(header_columns) != actual_col_count:
+            print(f"⚠️ Header has {len(header_columns)} columns, but first data row has {actual_col_count} columns.")
+            print("🔄 Adjusting header to match actual column count.")
+
+            if len(header_columns) > actual_col_count:
+                header_columns = header_columns[:actual_col_count]  # Trim extra columns
+            else:
+                header_columns += [f"extra_col_{i}" for i in range(actual_col_count - len(header_columns))]  # Add missing columns
+
+        # Step 3: Clean data rows and ensure alignment
+        cleaned_rows = []
+        for line in lines[1:]:
+            cleaned_line = line.strip().replace('"', '')  # Remove quotes
+            cleaned_line = cleaned_line.rstrip(",")  # Remove trailing commas
+            row_data = cleaned_line.split(",")
+
+            if len(row_data) > actual_col_count:
+                row_data = row_data[:actual_col_count]  # Trim extra columns
+            elif len(row_data) < actual_col_count:
+                row_data += [""] * (actual_col_count - len(row_data))  # Fill missing values
+
+            cleaned_rows.append(row_data)
+
+        # Step 4: Create DataFrame
+        df = pd.DataFrame(cleaned_rows, columns=header_columns)
+
+        # Step 5: Drop completely empty columns (if any)
+        df = df.dropna(axis=1, how="all")
+
+        # Step 6: Rename duplicate columns
+        seen = {}
+        new_columns = []
+        for col in df.columns:
+            if col in seen:
+                seen[col] += 1
+                new_columns.append(f"{col}_{seen[col]}")  # Append suffix to duplicates
+            else:
+                seen[col] = 0
+                new_columns.append(col)
+        df.columns = new_columns
+
+        # Step 7: Save cleaned dataset
+        df.to_csv(output_filename, index=False)
+
+        print(f"✅ Cleaned dataset saved to: {output_filename}")
+        print(f"📊 New dataset shape: {df.shape[0]} rows, {df.shape[1]} columns")
+
+        return df
+
+    except FileNotFoundError as e:
+        print(e)
+        return None
+    except Exception as e:
+        print(f"❌ An error occurred while cleaning the dataset: {e}")
+        return None
+
+
+def load_and_debug_dataset(filename):
+    """
+    Loads the cleaned dataset, standardizes column names and converts features to numbers.
+
+    Parameters:
+        filename (str): Path of the cleaned CSV.
+
+    Returns:
+        df (pd.DataFrame or None): The processed dataset, or None if it could not be loaded.
+    """
+    try:
+        if not os.path.exists(filename):
+            raise FileNotFoundError(f"❌ Error: '{filename}' not found. Please check the file path.")
+
+        # Load dataset
+        df = pd.read_csv(filename)
+        print(f"✅ Dataset successfully loaded from: {filename}")
+        print(f"📊 Dataset Shape: {df.shape[0]} rows, {df.shape[1]} columns")
+
+        # Inspect first few rows
+        print("\n🔍 Raw Data Sample (First 5 rows):")
+        print(df.head())
+
+        # Standardize column names
+        df.columns = df.columns.str.strip().str.lower()
+
+        # Drop 'id' column if it exists (since it's not useful for ML)
+        if 'id' in df.columns:
+            df = df.drop(columns=['id'])
+
+        # Convert numeric columns (excluding diagnosis) to proper types
+        numeric_cols = df.columns.difference(['diagnosis'])
+        df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors='coerce')
+
+        # Display dataset info after conversion
+        print("\n📌 Dataset Info After Processing:")
+        print(df.info())
+
+        return df
+
+    except FileNotFoundError as fnf_error:
+        print(fnf_error)
+        return None
+    except pd.errors.EmptyDataError:
+        print("❌ Error: The file is empty. Please provide a valid dataset.")
+        return None
+    except pd.errors.ParserError:
+        print("❌ Error: The file could not be parsed. Please check the file format.")
+        return None
+    except Exception as e:
+        print(f"❌ An error occurred while processing the dataset: {e}")
+        return None
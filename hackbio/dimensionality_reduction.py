@@ -0,0 +1,182 @@
+# ==============================================
+# Dimensionality Reduction: Fit, Persist & Project
+# ==============================================
+
+import os
+import time
+
+import joblib
+import numpy as np
+from sklearn.decomposition import PCA, IncrementalPCA
+
+from .profiling import instrument
+
+# Above this many samples a full SVD is replaced by a randomized or incremental solver
+LARGE_SAMPLE_THRESHOLD = 10000
+
+# In-memory solvers copy the matrix (centering); above this many bytes of float64
+# data the incremental solver streams it in mini-batches instead
+MEMORY_BUDGET_BYTES = 512 * 1024 ** 2
+
+
+@instrument(count=lambda pca, X_scaled, *args, **kwargs: {"rows": X_scaled.shape[0], "features": X_scaled.shape[1]})
+def fit_projection(X_scaled, n_components=2, method="auto", batch_size=None, random_state=42,
+                   memory_budget=MEMORY_BUDGET_BYTES):
+    """
+    Fits a PCA projection on an already scaled feature matrix.
+
+    Parameters:
+        X_scaled (array-like): Scaled feature matrix (samples x features).
+        n_components (int): Number of principal components to keep.
+        method (str): "full" (exact SVD), "randomized" (randomized SVD),
+            "incremental" (IncrementalPCA over mini-batches) or "auto" (chosen by
+            the matrix size, never by the array type).
+        batch_size (int or None): Mini-batch size used by the incremental solver.
+        random_state (int): Seed for the randomized solver.
+        memory_budget (int): Bytes of float64 data above which "auto" streams the matrix.
+
+    Returns:
+        pca (PCA or IncrementalPCA): The fitted projection.
+    """
+    n_samples, n_features = X_scaled.shape
+
+    if method == "auto":
+        # Matrices beyond the memory budget are streamed; tall ones get the randomized solver
+        if n_samples * n_features * 8 > memory_budget:
+            method = "incremental"
+        elif n_samples <= LARGE_SAMPLE_THRESHOLD:
+            method = "full"
+        else:
+            method = "randomized"
+
+    if method == "incremental":
+        pca = IncrementalPCA(n_components=n_components, batch_size=batch_size)
+        batch_size = pca.batch_size or 5 * X_scaled.shape[1]
+        for start in range(0, n_samples, batch_size):
+            batch = X_scaled[start:start + batch_size]
+            # IncrementalPCA needs at least n_components rows per partial fit
+            if batch.shape[0] >= n_components:
+                pca.partial_fit(batch)
+        return pca
+
+    if method in ("full", "randomized"):
+        pca = PCA(n_components=n_components, svd_solver=method, random_state=random_state)
+        pca.fit(X_scaled)
+        return pca
+
+    raise ValueError(f"Unknown PCA method: {method}")
+
+
+def save_projection(projection, filename):
+    """
+    Saves a fitted projection (imputer, scaler and PCA) to disk.
+
+    Parameters:
+        projection (dict): Dictionary with "imputer", "scaler" and "pca" entries.
+        filename (str): Path of the file to write.
+    """
+    joblib.dump(projection, filename)
+    print(f"💾 Projection model saved to: {filename}")
+
+
+def load_projection(filename, n_features=None, feature_names=None):
+    """
+    Loads a previously saved projection, if one exists.
+
+    Parameters:
+        filename (str): Path of the saved projection.
+        n_features (int or None): Expected number of input features. A saved
+            projection with a different feature count is ignored.
+        feature_names (list or None): Expected feature names. A saved projection
+            fitted on other column names is ignored.
+
+    Returns:
+        projection (dict or None): The saved projection, or None if unavailable.
+    """
+    if not os.path.exists(filename):
+        return None
+
+    try:
+        projection = joblib.load(filename)
+    except Exception as e:
+        print(f"⚠️ Could not load projection model from {filename}: {e}")
+        return None
+
+    if n_features is not None and projection["pca"].n_features_in_ != n_features:
+        print(f"⚠️ Saved projection expects {projection['pca'].n_features_in_} features, got {n_features}. Refitting.")
+        return None
+
+    fitted_names = getattr(projection.get("imputer") or projection["scaler"], "feature_names_in_", None)
+    if feature_names is not None and fitted_names is not None and list(fitted_names) != list(feature_names):
+        print("⚠️ Saved projection was fitted on different feature names. Refitting.")
+        return None
+
+    print(f"✅ Projection model loaded from: {filename}")
+    return projection
+
+
+def project_samples(projection, X):
+    """
+    Projects new (unscaled) samples into an existing PCA space without refitting.
+
+    Parameters:
+        projection (dict): Dictionary with "imputer", "scaler" and "pca" entries.
+        X (array-like): Raw feature matrix, possibly with missing values.
+
+    Returns:
+        X_projected (np.ndarray): Samples expressed in principal components.
+    """
+    if projection.get("imputer") is not None:
+        X = projection["imputer"].transform(X)
+    X_scaled = projection["scaler"].transform(X)
+    return projection["pca"].transform(X_scaled)
+
+
+def benchmark_projection(X_scaled, n_components=2, methods=("full", "randomized", "incremental"), repeats=3):
+    """
+    Measures fit and transform throughput of each PCA solver.
+
+    Parameters:
+        X_scaled (array-like): Scaled feature matrix used for the benchmark.
+        n_components (int): Number of principal components to keep.
+        methods (tuple): Solvers to compare; "full" is the reference path.
+        repeats (int): Number of timed repetitions per solver (best time is kept).
+
+    Returns:
+        results (list): One dictionary per solver with timings and samples/second.
+    """
+    n_samples = X_scaled.shape[0]
+    results = []
+
+    for method in methods:
+        fit_times = []
+        transform_times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            pca = fit_projection(X_scaled, n_components=n_components, method=method)
+            fit_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            pca.transform(X_scaled)
+            transform_times.append(time.perf_counter() - start)
+
+        fit_time = min(fit_times)
+        transform_time = min(transform_times)
+        results.append({
+            "method": method,
+            "fit_seconds": fit_time,
+            "transform_seconds": transform_time,
+            "fit_samples_per_second": n_samples / fit_time if fit_time > 0 else float("inf"),
+            "transform_samples_per_second": n_samples / transform_time if transform_time > 0 else float("inf"),
+            "explained_variance": float(np.sum(pca.explained_variance_ratio_)),
+        })
+
+    print(f"\n⏱️ PCA Benchmark ({n_samples} samples, {X_scaled.shape[1]} features):")
+    for result in results:
+        print(f"{result['method']:<12} fit {result['fit_seconds'] * 1000:8.2f} ms "
+              f"({result['fit_samples_per_second']:,.0f} samples/s)  "
+              f"transform {result['transform_seconds'] * 1000:8.2f} ms "
+              f"({result['transform_samples_per_second']:,.0f} samples/s)  "
+              f"explained variance {result['explained_variance']:.4f}")
+
+    return results
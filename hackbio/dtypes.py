@@ -0,0 +1,161 @@
+# ==============================================
+# Compact DataFrames: float32, Categoricals & Parsed Mutation Codes
+# ==============================================
+#
+# Floats are stored as float32 only when every value converts back to exactly
+# the same float64 (e.g. 0.5 or 3.0, but not 0.1), unless a relative tolerance
+# is given explicitly. Thresholds are cast to the column's dtype before
+# comparing, so filters on lossy float32 columns keep the same rows. Repeated
+# strings become categoricals; mostly-unique ones are left as they are.
+
+import numpy as np
+import pandas as pd
+
+from .mutation_frequencies import RESIDUE_LABELS, parse_mutation_codes
+
+# String columns with at most this fraction of distinct values become categoricals
+MAX_UNIQUE_RATIO = 0.5
+
+
+def memory_usage(df):
+    """Total memory of a DataFrame in bytes, including string contents."""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def float32_safe(values, tolerance=0.0):
+    """
+    Checks whether float64 values can be stored as float32 without changing them.
+
+    Parameters:
+        values (pd.Series or np.ndarray): Float values (NaN allowed).
+        tolerance (float): Accepted relative error (0 requires the float32 value to
+            convert back to exactly the same float64; float32 rounding is at most 2**-24).
+
+    Returns:
+        safe (bool): True if every value survives float64 -> float32 -> float64
+            unchanged (or within the tolerance).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    with np.errstate(over="ignore"):
+        widened = values.astype(np.float32).astype(np.float64)
+    if tolerance:
+        return bool(np.allclose(widened, values, rtol=tolerance, atol=0, equal_nan=True))
+    return bool(np.array_equal(widened, values, equal_nan=True))
+
+
+def threshold_for(values, threshold):
+    """
+    Casts a threshold to the dtype of a float column.
+
+    A float32 value of 0.01 is slightly below the float64 0.01, so comparing
+    a float32 column (read as float32, or compacted with a tolerance) with an
+    uncast threshold could move rows across it.
+
+    Parameters:
+        values (pd.Series): The compared column.
+        threshold (float): The threshold.
+
+    Returns:
+        threshold (np.floating or float): The threshold in the column's float type.
+    """
+    dtype = getattr(values, "dtype", None)
+    return dtype.type(threshold) if pd.api.types.is_float_dtype(dtype) else threshold
+
+
+def compact_frame(df, parse_mutations=None, exclude=(), max_unique_ratio=MAX_UNIQUE_RATIO, float_tolerance=0.0):
+    """
+    Returns a memory-compact copy of a DataFrame.
+
+    Float columns go to float32 when float32_safe, integer columns to the
+    smallest integer type, and string columns with repeated values to
+    categoricals.
+
+    Parameters:
+        df (pd.DataFrame): The frame to compact.
+        parse_mutations (str or None): Column with codes like "K60Q" to split into
+            wild_type / position / mutant fields (see parse_mutation_fields).
+        exclude (iterable): Columns left untouched.
+        max_unique_ratio (float): Highest distinct/rows ratio converted to a categorical.
+        float_tolerance (float): Relative error accepted for float32 (0 keeps values exact).
+
+    Returns:
+        compact_df (pd.DataFrame): The compacted copy (same columns and, with the default
+            tolerance, values equal to the original float64 ones).
+    """
+    compact_df = df.copy()
+    exclude = set(exclude)
+
+    for column in compact_df.columns:
+        if column in exclude:
+            continue
+        values = compact_df[column]
+        if pd.api.types.is_float_dtype(values) and values.dtype != np.float32:
+            if float32_safe(values, float_tolerance):
+                compact_df[column] = values.astype(np.float32)
+        elif pd.api.types.is_integer_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            compact_df[column] = pd.to_numeric(values, downcast="integer")
+        elif pd.api.types.is_string_dtype(values) or values.dtype == object:
+            if len(values) and values.nunique(dropna=False) <= max_unique_ratio * len(values):
+                compact_df[column] = values.astype("category")
+
+    if parse_mutations is not None:
+        compact_df = parse_mutation_fields(compact_df, parse_mutations)
+    return compact_df
+
+
+def parse_mutation_fields(df, column="Amino_Acid"):
+    """
+    Adds compact wild_type, position and mutant fields parsed from mutation codes.
+
+    The residues are categoricals over the 20 amino acids plus 'X' (one byte per
+    row) and the position uses the smallest integer type (-1 where unparsable).
+    The original column is kept, so existing analysis code still finds it.
+
+    Parameters:
+        df (pd.DataFrame): Frame with a mutation code column.
+        column (str): Column with codes like "K60Q".
+
+    Returns:
+        df (pd.DataFrame): A copy with '<column>_wild_type', '<column>_position' and '<column>_mutant'.
+    """
+    wild_type, position, mutant = parse_mutation_codes(df[column])
+    df = df.copy()
+    df[f"{column}_wild_type"] = pd.Categorical.from_codes(wild_type, categories=RESIDUE_LABELS)
+    df[f"{column}_position"] = pd.to_numeric(pd.Series(position, index=df.index), downcast="integer")
+    df[f"{column}_mutant"] = pd.Categorical.from_codes(mutant, categories=RESIDUE_LABELS)
+    return df
+
+
+def memory_report(frames):
+    """
+    Before/after memory of compacted datasets.
+
+    Parameters:
+        frames (dict): Dataset name -> (original DataFrame, compacted DataFrame).
+
+    Returns:
+        report (pd.DataFrame): rows, columns, memory before/after (MB) and the saving per dataset.
+    """
+    rows = []
+    for name, (before, after) in frames.items():
+        before_bytes, after_bytes = memory_usage(before), memory_usage(after)
+        rows.append({
+            "dataset": name,
+            "rows": len(before),
+            "columns": before.shape[1],
+            "before_mb": before_bytes / 1e6,
+            "after_mb": after_bytes / 1e6,
+            "saved_percent": 100 * (1 - after_bytes / before_bytes) if before_bytes else 0.0,
+            "float32_columns": int((after.dtypes == np.float32).sum()),
+            "categorical_columns": int(sum(isinstance(dtype, pd.CategoricalDtype) for dtype in after.dtypes)),
+        })
+    return pd.DataFrame(rows)
+
+
+def print_memory_report(report):
+    """Prints a memory_report table."""
+    print("\n💾 Memory before -> after compaction:")
+    for row in report.itertuples():
+        print(f"  {row.dataset:<24} {row.rows:>8} rows  {row.before_mb:8.2f} MB -> {row.after_mb:8.2f} MB "
+              f"({row.saved_percent:5.1f}% saved; {row.float32_columns} float32, "
+              f"{row.categorical_columns} categorical columns)")
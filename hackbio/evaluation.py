@@ -0,0 +1,210 @@
+# ==============================================
+# Evaluation Harness: Cross-Validation & Hyperparameter Search
+# ==============================================
+
+import os
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, confusion_matrix, f1_score, precision_score, recall_score
+from sklearn.model_selection import ParameterGrid, ParameterSampler, RepeatedStratifiedKFold, StratifiedKFold
+from sklearn.preprocessing import StandardScaler
+
+# Only valid solver/penalty pairs are combined. saga is left out by default because it
+# needs thousands of iterations to converge on this data; add it for large datasets.
+DEFAULT_PARAM_GRID = [
+    {"solver": ["lbfgs"], "penalty": ["l2"], "C": [0.01, 0.1, 1.0, 10.0, 100.0],
+     "class_weight": [None, "balanced"], "max_iter": [1000]},
+    {"solver": ["liblinear"], "penalty": ["l1", "l2"], "C": [0.01, 0.1, 1.0, 10.0, 100.0],
+     "class_weight": [None, "balanced"], "max_iter": [1000]},
+]
+
+METRIC_COLUMNS = ["accuracy", "precision", "recall", "f1"]
+METRIC_LABELS = {"accuracy": "Accuracy", "precision": "Precision", "recall": "Recall", "f1": "F1"}
+
+
+def prepare_folds(X, y, n_splits=5, n_repeats=1, random_state=42):
+    """
+    Splits the data into stratified folds and fits the imputer and scaler once per fold.
+
+    Parameters:
+        X (array-like): Raw feature matrix, possibly with missing values.
+        y (array-like): Binary target labels.
+        n_splits (int): Number of folds.
+        n_repeats (int): Number of times the k-fold split is repeated with new shuffles.
+        random_state (int): Seed for the fold shuffling.
+
+    Returns:
+        folds (list): One dictionary per fold with preprocessed train/test arrays.
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y)
+
+    if n_repeats > 1:
+        splitter = RepeatedStratifiedKFold(n_splits=n_splits, n_repeats=n_repeats, random_state=random_state)
+    else:
+        splitter = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+
+    folds = []
+    for fold_index, (train_idx, test_idx) in enumerate(splitter.split(X, y)):
+        start = time.perf_counter()
+        imputer = SimpleImputer(strategy="mean")
+        scaler = StandardScaler()
+        X_train = scaler.fit_transform(imputer.fit_transform(X[train_idx]))
+        X_test = scaler.transform(imputer.transform(X[test_idx]))
+
+        folds.append({
+            "fold": fold_index % n_splits,
+            "repeat": fold_index // n_splits,
+            "X_train": X_train,
+            "y_train": y[train_idx],
+            "X_test": X_test,
+            "y_test": y[test_idx],
+            "preprocess_seconds": time.perf_counter() - start,
+        })
+
+    return folds
+
+
+def _evaluate_candidate(candidate_index, params, fold):
+    """Fits one hyperparameter candidate on one preprocessed fold and scores it."""
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+
+    with warnings.catch_warnings():
+        # Convergence and deprecation warnings would be repeated for every fold and candidate
+        warnings.simplefilter("ignore")
+        model = LogisticRegression(**params)
+        model.fit(fold["X_train"], fold["y_train"])
+        y_pred = model.predict(fold["X_test"])
+
+    y_test = fold["y_test"]
+    tn, fp, fn, tp = confusion_matrix(y_test, y_pred, labels=[0, 1]).ravel()
+
+    return {
+        "candidate": candidate_index,
+        "params": params,
+        "repeat": fold["repeat"],
+        "fold": fold["fold"],
+        "accuracy": accuracy_score(y_test, y_pred),
+        "precision": precision_score(y_test, y_pred, zero_division=0),
+        "recall": recall_score(y_test, y_pred, zero_division=0),
+        "f1": f1_score(y_test, y_pred, zero_division=0),
+        "tn": int(tn), "fp": int(fp), "fn": int(fn), "tp": int(tp),
+        "fit_seconds": time.perf_counter() - start_wall,
+        "cpu_seconds": time.process_time() - start_cpu,
+    }
+
+
+def evaluate_classifier(X, y, param_grid=None, search="grid", n_iter=20, n_splits=5, n_repeats=1,
+                        scoring="f1", n_jobs=None, random_state=42):
+    """
+    Runs (repeated) stratified k-fold cross-validation over a hyperparameter search.
+
+    Preprocessing is fitted once per fold and shared by every candidate; the
+    candidate x fold fits are spread across process workers.
+
+    Parameters:
+        X (array-like): Raw feature matrix, possibly with missing values.
+        y (array-like): Binary target labels (0 = benign, 1 = malignant).
+        param_grid (dict or list or None): LogisticRegression parameters to search.
+            Defaults to DEFAULT_PARAM_GRID (C, penalty, solver, class_weight).
+        search (str): "grid" for exhaustive search or "random" for random sampling.
+        n_iter (int): Number of sampled candidates when search="random".
+        n_splits (int): Number of folds.
+        n_repeats (int): Number of repeated k-fold splits.
+        scoring (str): Metric used to rank candidates (accuracy, precision, recall or f1).
+        n_jobs (int or None): Number of worker processes (all cores if None).
+        random_state (int): Seed for fold shuffling and random search.
+
+    Returns:
+        report (dict): Per-fold results, per-candidate summary, best parameters, the scoring
+            metric and timings.
+    """
+    start_total = time.perf_counter()
+    param_grid = DEFAULT_PARAM_GRID if param_grid is None else param_grid
+
+    if search == "grid":
+        candidates = list(ParameterGrid(param_grid))
+    elif search == "random":
+        candidates = list(ParameterSampler(param_grid, n_iter=n_iter, random_state=random_state))
+    else:
+        raise ValueError(f"Unknown search strategy: {search}")
+    if scoring not in METRIC_COLUMNS:
+        raise ValueError(f"Unknown scoring metric: {scoring}")
+
+    folds = prepare_folds(X, y, n_splits=n_splits, n_repeats=n_repeats, random_state=random_state)
+    preprocess_seconds = sum(fold["preprocess_seconds"] for fold in folds)
+
+    start_search = time.perf_counter()
+    rows = Parallel(n_jobs=n_jobs or os.cpu_count())(
+        delayed(_evaluate_candidate)(candidate_index, params, fold)
+        for candidate_index, params in enumerate(candidates)
+        for fold in folds
+    )
+    search_seconds = time.perf_counter() - start_search
+
+    results = pd.DataFrame(rows)
+    summary = results.groupby("candidate")[METRIC_COLUMNS + ["fit_seconds"]].agg(["mean", "std"])
+    summary.columns = [f"{metric}_{stat}" for metric, stat in summary.columns]
+    summary["params"] = [candidates[i] for i in summary.index]
+    summary = summary.sort_values(f"{scoring}_mean", ascending=False)
+
+    best_candidate = summary.index[0]
+    timing = {
+        "candidates": len(candidates),
+        "folds": len(folds),
+        "fits": len(rows),
+        "preprocess_seconds": preprocess_seconds,
+        "search_wall_seconds": search_seconds,
+        "fit_seconds_total": float(results["fit_seconds"].sum()),
+        "cpu_seconds_total": float(results["cpu_seconds"].sum()),
+        "total_wall_seconds": time.perf_counter() - start_total,
+    }
+
+    return {
+        "results": results,
+        "summary": summary,
+        "best_params": candidates[best_candidate],
+        "best_results": results[results["candidate"] == best_candidate],
+        "scoring": scoring,
+        "timing": timing,
+    }
+
+
+def print_evaluation(report, top=5):
+    """
+    Prints the cross-validation report in the same terms as Section 5.
+
+    Parameters:
+        report (dict): Output of evaluate_classifier.
+        top (int): Number of best candidates to list.
+    """
+    timing = report["timing"]
+    print(f"\n🔁 Cross-Validation: {timing['candidates']} candidates x {timing['folds']} folds "
+          f"= {timing['fits']} fits")
+
+    # Candidates are ranked by the scoring metric; the second column is accuracy (or F1 when ranking by accuracy)
+    scoring = report.get("scoring", "f1")
+    other = "f1" if scoring == "accuracy" else "accuracy"
+    print(f"\n🏆 Top {top} candidates by {METRIC_LABELS[scoring]}:")
+    for _, row in report["summary"].head(top).iterrows():
+        print(f"  {METRIC_LABELS[scoring]} {row[f'{scoring}_mean']:.4f} ± {row[f'{scoring}_std']:.4f}  "
+              f"{METRIC_LABELS[other]} {row[f'{other}_mean']:.4f}  {row['params']}")
+
+    print(f"\n📋 Per-fold metrics for best parameters {report['best_params']}:")
+    for _, row in report["best_results"].iterrows():
+        print(f"  Repeat {row['repeat']} Fold {row['fold']}: "
+              f"Accuracy: {row['accuracy']:.4f}  Precision: {row['precision']:.4f}  "
+              f"Recall: {row['recall']:.4f}  F1 Score: {row['f1']:.4f}  "
+              f"Confusion Matrix: [[{row['tn']} {row['fp']}] [{row['fn']} {row['tp']}]]")
+
+    print(f"\n⏱️ Preprocessing (once per fold): {timing['preprocess_seconds']:.2f} s")
+    print(f"⏱️ Search wall-clock: {timing['search_wall_seconds']:.2f} s "
+          f"(summed fit time {timing['fit_seconds_total']:.2f} s, CPU {timing['cpu_seconds_total']:.2f} s)")
+    print(f"⏱️ Total: {timing['total_wall_seconds']:.2f} s")
@@ -0,0 +1,110 @@
+# ==============================================
+# Logistic Population Growth
+# ==============================================
+
+import random
+
+from .profiling import instrument
+
+# Function to simulate logistic growth with randomized lag and exponential phases
+
+@instrument(count=lambda result, *args, **kwargs: {"points": len(result[0])})
+def logistic_growth(K, P0, r, total_time, lag_mean, lag_std, exp_mean, exp_std):
+    """
+    Simulates logistic population growth with randomized lag and exponential phases.
+
+    Parameters:
+        K (float): Carrying capacity.
+        P0 (float): Initial population size.
+        r (float): Growth rate.
+        total_time (int): Total simulation time.
+        lag_mean (float): Mean duration of the lag phase.
+        lag_std (float): Standard deviation of the lag phase.
+        exp_mean (float): Mean duration of the exponential phase.
+        exp_std (float): Standard deviation of the exponential phase.
+
+    Returns:
+        time (list): List of time points.
+        population (list): List of population sizes (OD) at each time point.
+    """
+    # Step 1: Randomize lag and exponential phases
+    lag_duration = max(0, int(random.gauss(lag_mean, lag_std)))  # Ensure lag is non-negative
+    exp_duration = max(0, int(random.gauss(exp_mean, exp_std)))  # Ensure exp is non-negative
+
+    # Step 2: Initialize variables
+    time = list(range(total_time))  # Time points
+    population = [P0] * total_time  # Population sizes (OD) at each time point
+
+    # Step 3: Simulate logistic growth
+    for t in range(1, total_time):
+        if t < lag_duration:
+            # Lag phase: slow growth
+            population[t] = population[t - 1]
+        elif t < lag_duration + exp_duration:
+            # Exponential phase: rapid growth
+            delta_population = r * population[t - 1] * (1 - population[t - 1] / K)
+            population[t] = population[t - 1] + delta_population
+        else:
+            # Stationary phase: growth levels off
+            population[t] = K
+
+    return time, population
+
+# Function to generate multiple logistic growth curves and store them in a DataFrame
+
+@instrument(count=lambda df, *args, **kwargs: {"rows": len(df)})
+def generate_growth_curves(num_curves, K, P0, r, total_time, lag_mean, lag_std, exp_mean, exp_std):
+    """
+    Generates multiple logistic growth curves and stores them in a DataFrame.
+
+    Parameters:
+        num_curves (int): Number of growth curves to generate.
+        K (float): Carrying capacity.
+        P0 (float): Initial population size.
+        r (float): Growth rate.
+        total_time (int): Total simulation time.
+        lag_mean (float): Mean duration of the lag phase.
+        lag_std (float): Standard deviation of the lag phase.
+        exp_mean (float): Mean duration of the exponential phase.
+        exp_std (float): Standard deviation of the exponential phase.
+
+    Returns:
+        df (pd.DataFrame): DataFrame containing time and population data for all curves.
+    """
+    import pandas as pd  # Imported lazily so simulating single curves stays lightweight
+
+    # Collect every curve first and build the DataFrame once (no repeated concatenation)
+    curve_ids = []
+    times = []
+    populations = []
+    for curve_id in range(1, num_curves + 1):
+        time, population = logistic_growth(K, P0, r, total_time, lag_mean, lag_std, exp_mean, exp_std)
+        curve_ids.extend([curve_id] * len(time))
+        times.extend(time)
+        populations.extend(population)
+
+    return pd.DataFrame({
+        "curve_id": curve_ids,
+        "time": times,
+        "population": populations
+    })
+
+# Function to determine the time to reach 80% of the carrying capacity
+
+def time_to_80_percent(time, population, K):
+    """
+    Determines the time to reach 80% of the carrying capacity.
+
+    Parameters:
+        time (list): List of time points.
+        population (list): List of population sizes (OD) at each time point.
+        K (float): Carrying capacity.
+
+    Returns:
+        t_80 (int or None): Time to reach 80% of carrying capacity, or None if not reached.
+    """
+    target_population = 0.8 * K
+    for t, pop in zip(time, population):
+        if pop >= target_population:
+            return t
+    return None
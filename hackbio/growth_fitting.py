@@ -0,0 +1,355 @@
+# ==============================================
+# Growth Curve Fitting: Lag-Logistic Parameters per Well
+# ==============================================
+#
+# Fits the lag / exponential / stationary logistic model to every row of a
+# wells x time OD matrix:
+#
+#   P(t) = P0                                           for t < lag
+#   P(t) = K / (1 + (K - P0) / P0 * exp(-r (t - lag)))  for t >= lag
+#
+# All wells are fitted together: initial guesses are computed with array
+# operations and a batched Levenberg-Marquardt solver updates every well in
+# each iteration (parameters are optimised on log P0, log K, log r and lag, so
+# they stay positive; steps and bounds on log K and log r keep the solver off
+# flat, zero-gradient models). Chunks of wells can be spread over worker processes.
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .profiling import instrument
+
+PARAMETER_NAMES = ("P0", "K", "r", "lag")
+
+# Largest change of log P0, log K or log r in one Levenberg-Marquardt step
+MAX_LOG_STEP = 1.0
+
+# K may not exceed this multiple of a well's highest measured OD
+MAX_K_FACTOR = 10.0
+
+# Fits below this growth (r x measurement window) or outside these K / P0 are degenerate
+# (with almost no rise, r and lag are not identifiable)
+MIN_GROWTH_SPAN = 1.0
+MIN_FOLD_CHANGE = 1.1
+MAX_FOLD_CHANGE = 1e6
+
+
+def growth_matrix_from_frame(df, well_column="curve_id", time_column="time", value_column="population"):
+    """
+    Pivots long-format growth data (like generate_growth_curves output) into a wells x time matrix.
+
+    Parameters:
+        df (pd.DataFrame): One row per well and time point.
+        well_column (str): Well / curve identifier column.
+        time_column (str): Time column.
+        value_column (str): OD / population column.
+
+    Returns:
+        wells (pd.Index): Well identifiers (matrix rows).
+        time (np.ndarray): Time points (matrix columns).
+        od (np.ndarray): wells x time values (NaN where a well has no measurement).
+    """
+    matrix = df.pivot_table(index=well_column, columns=time_column, values=value_column, aggfunc="mean")
+    return matrix.index, matrix.columns.to_numpy(dtype=float), matrix.to_numpy(dtype=float)
+
+
+def threshold_times(time, od, K, fraction=0.8):
+    """
+    First time each well reaches fraction * K (the vectorized form of time_to_80_percent).
+
+    Parameters:
+        time (array-like): Time points.
+        od (np.ndarray): wells x time values.
+        K (float or array-like): Carrying capacity (one value or one per well).
+        fraction (float): Fraction of K to reach.
+
+    Returns:
+        t_threshold (np.ndarray): Time per well, NaN where the threshold is never reached.
+    """
+    time = np.asarray(time, dtype=float)
+    target = fraction * np.broadcast_to(np.asarray(K, dtype=float), (od.shape[0],))
+    reached = od >= target[:, None]
+    first = reached.argmax(axis=1)
+    return np.where(reached.any(axis=1), time[first], np.nan)
+
+
+def lag_logistic(time, P0, K, r, lag):
+    """
+    Evaluates the lag-logistic model for every well.
+
+    Parameters:
+        time (np.ndarray): Time points.
+        P0, K, r, lag (np.ndarray): One parameter value per well.
+
+    Returns:
+        od (np.ndarray): wells x time model values.
+    """
+    elapsed = np.maximum(time[None, :] - lag[:, None], 0.0)
+    return K[:, None] / (1 + (K / P0 - 1)[:, None] * np.exp(-r[:, None] * elapsed))
+
+
+def crossing_times(time, od, level):
+    """
+    First time each well rises to a level, interpolated between the bracketing measurements.
+
+    Parameters:
+        time (np.ndarray): Time points.
+        od (np.ndarray): wells x time values (NaN allowed; missing points are skipped).
+        level (np.ndarray): One level per well.
+
+    Returns:
+        t_cross (np.ndarray): Time per well, NaN where the level is never reached.
+    """
+    # Carry the last measurement over missing points so the bracket uses measured values
+    measured = np.isfinite(od)
+    last_index = np.maximum.accumulate(np.where(measured, np.arange(od.shape[1]), 0), axis=1)
+    filled = np.take_along_axis(np.where(measured, od, -np.inf), last_index, axis=1)
+
+    reached = filled >= level[:, None]
+    first = reached.argmax(axis=1)
+    rows = np.arange(len(od))
+    before = last_index[rows, np.maximum(first - 1, 0)]
+    od_before, od_after = filled[rows, np.maximum(first - 1, 0)], filled[rows, first]
+    rising = (first > 0) & np.isfinite(od_before) & (od_after > od_before)
+    fraction = np.where(rising, (level - od_before) / np.where(rising, od_after - od_before, 1), 0.0)
+    t_cross = np.where(rising, time[before] + fraction * (time[first] - time[before]), time[first])
+    return np.where(reached.any(axis=1), t_cross, np.nan)
+
+
+def _logit(fraction):
+    fraction = np.clip(fraction, 1e-6, 1 - 1e-6)
+    return np.log(fraction / (1 - fraction))
+
+
+def initial_guesses(time, od, t80_seeds=None):
+    """
+    Vectorized starting values for every well.
+
+    Parameters:
+        time (np.ndarray): Time points.
+        od (np.ndarray): wells x time values (NaN allowed).
+        t80_seeds (array-like or None): Observed times to 80% of K (e.g. from
+            time_to_80_percent or threshold_times); used to place the lag.
+
+    Returns:
+        guesses (np.ndarray): wells x 4 array of P0, K, r, lag.
+    """
+    n_points = max(1, min(3, od.shape[1] // 10))
+    start = od[:, :n_points]
+    # Wells missing every early point start from their first measurement
+    first_measured = np.nan_to_num(od[np.arange(len(od)), np.isfinite(od).argmax(axis=1)], nan=1e-6)
+    start = np.where(np.isfinite(start).any(axis=1)[:, None], start, first_measured[:, None])
+    P0 = np.maximum(np.nanmedian(start, axis=1), 1e-6)
+    K = np.nanmax(od, axis=1)
+    K = np.where(K > P0 * 1.01, K, P0 * 1.01)
+
+    # r from the 20% and 80% crossings of the rise: a logistic needs
+    # (logit(y80) - logit(y20)) / r to climb between them, whatever the noise on the plateau
+    low, high = P0 + 0.2 * (K - P0), P0 + 0.8 * (K - P0)
+    t_low, t_high = crossing_times(time, od, low), crossing_times(time, od, high)
+    logit_low, logit_high = _logit(low / K), _logit(high / K)
+    rise = t_high - t_low
+    r = np.where(rise > 0, (logit_high - logit_low) / np.where(rise > 0, rise, 1), np.nan)
+    r = np.clip(np.nan_to_num(r, nan=0.1), 1e-3, 10.0)
+
+    # Lag: the time that puts the model's 20% crossing where it was observed ...
+    lag = t_low - (logit_low - _logit(P0 / K)) / r
+    # ... or the last time point still within 10% of the initial OD when the rise is never seen
+    still_lagging = np.nan_to_num(od) <= P0[:, None] * 1.1
+    lag = np.where(np.isfinite(lag), lag, time[np.maximum(np.cumprod(still_lagging, axis=1).sum(axis=1) - 1, 0)])
+
+    # ... or, when 80% times are given, the lag that puts the model's t80 there
+    if t80_seeds is not None:
+        t80_seeds = np.asarray(t80_seeds, dtype=float)
+        seeded_lag = t80_seeds - np.log(4 * (K / P0 - 1)) / r
+        lag = np.where(np.isfinite(seeded_lag), seeded_lag, lag)
+
+    lag = np.clip(lag, time[0], time[-1])
+    return np.column_stack([P0, K, r, lag])
+
+
+def _residuals_and_jacobian(time, od, weights, u):
+    """Weighted residuals and Jacobian with respect to (log P0, log K, log r, lag)."""
+    P0, K, r, lag = np.exp(u[:, 0]), np.exp(u[:, 1]), np.exp(u[:, 2]), u[:, 3]
+    elapsed = time[None, :] - lag[:, None]
+    growing = elapsed >= 0
+    elapsed = np.where(growing, elapsed, 0.0)
+
+    A = (K / P0 - 1)[:, None]
+    E = np.exp(-r[:, None] * elapsed)
+    D = 1 + A * E
+    model = K[:, None] / D
+    residuals = (model - od) * weights
+
+    KD2 = K[:, None] / D ** 2
+    jacobian = np.empty(od.shape + (4,))
+    # d/dlogP0 = P0 * dP/dP0; before the lag the model is P0 itself
+    jacobian[..., 0] = np.where(growing, KD2 * E * K[:, None] / P0[:, None], P0[:, None])
+    jacobian[..., 1] = np.where(growing, K[:, None] * (1 / D - KD2 * E / P0[:, None]), 0.0)
+    jacobian[..., 2] = np.where(growing, KD2 * A * elapsed * E * r[:, None], 0.0)
+    jacobian[..., 3] = np.where(growing, -KD2 * A * E * r[:, None], 0.0)
+    jacobian *= weights[..., None]
+    return residuals, jacobian
+
+
+def fit_lag_logistic(time, od, t80_seeds=None, max_iter=200, tol=1e-10):
+    """
+    Fits the lag-logistic model to every well with batched Levenberg-Marquardt.
+
+    Parameters:
+        time (array-like): Time points.
+        od (np.ndarray): wells x time values (NaN for missing measurements).
+        t80_seeds (array-like or None): Optional 80% threshold times used as lag seeds.
+        max_iter (int): Maximum iterations.
+        tol (float): Relative cost change below which a well has converged.
+
+    Returns:
+        params (np.ndarray): wells x 4 array of P0, K, r, lag.
+        iterations (np.ndarray): Iterations used per well.
+        converged (np.ndarray): True for wells that met the tolerance with a non-degenerate
+            curve (r x window >= MIN_GROWTH_SPAN, MIN_FOLD_CHANGE <= K / P0 <= MAX_FOLD_CHANGE).
+    """
+    time = np.asarray(time, dtype=float)
+    od = np.asarray(od, dtype=float)
+    weights = np.isfinite(od).astype(float)
+    od = np.nan_to_num(od)
+
+    guesses = initial_guesses(time, np.where(weights > 0, od, np.nan), t80_seeds)
+    u = np.column_stack([np.log(guesses[:, :3]), guesses[:, 3]])
+    damping = np.full(len(u), 1e-3)
+    iterations = np.zeros(len(u), dtype=int)
+    converged = np.zeros(len(u), dtype=bool)
+
+    # Box bounds on (log K, log r) keep the solver away from flat, zero-gradient models
+    span = max(time[-1] - time[0], 1e-12)
+    r_bounds = np.log([1e-3 / span, 50 / max(np.diff(time).min(initial=span), 1e-12)])
+    log_K_max = np.log(np.maximum(guesses[:, 1], 1e-12) * MAX_K_FACTOR)
+    u[:, 1] = np.minimum(u[:, 1], log_K_max)
+    u[:, 2] = np.clip(u[:, 2], *r_bounds)
+
+    residuals, jacobian = _residuals_and_jacobian(time, od, weights, u)
+    cost = (residuals ** 2).sum(axis=1)
+    scale = np.maximum(cost, 1e-300)
+
+    for _ in range(max_iter):
+        active = ~converged
+        if not active.any():
+            break
+
+        J, res = jacobian[active], residuals[active]
+        JTJ = np.einsum("wti,wtj->wij", J, J)
+        gradient = np.einsum("wti,wt->wi", J, res)
+        diagonal = np.einsum("wii->wi", JTJ)
+        lhs = JTJ + (damping[active, None] * np.maximum(diagonal, 1e-12))[:, :, None] * np.eye(4)
+        step = -np.linalg.solve(lhs, gradient[..., None])[..., 0]
+
+        step[:, :3] = np.clip(step[:, :3], -MAX_LOG_STEP, MAX_LOG_STEP)  # trust region on the log parameters
+        trial = u[active] + step
+        trial[:, 1] = np.clip(trial[:, 1], trial[:, 0] + 1e-6, np.maximum(log_K_max[active], trial[:, 0] + 1e-6))
+        trial[:, 2] = np.clip(trial[:, 2], *r_bounds)
+        trial[:, 3] = np.clip(trial[:, 3], time[0], time[-1])          # lag inside the measurement window
+        trial_residuals, trial_jacobian = _residuals_and_jacobian(time, od[active], weights[active], trial)
+        trial_cost = (trial_residuals ** 2).sum(axis=1)
+
+        improved = trial_cost < cost[active]
+        indices = np.flatnonzero(active)
+        accepted = indices[improved]
+        change = (cost[accepted] - trial_cost[improved]) / scale[accepted]
+
+        u[accepted] = trial[improved]
+        residuals[accepted] = trial_residuals[improved]
+        jacobian[accepted] = trial_jacobian[improved]
+        cost[accepted] = trial_cost[improved]
+        damping[accepted] = np.maximum(damping[accepted] / 10, 1e-12)
+        damping[indices[~improved]] *= 10
+        iterations[active] += 1
+
+        converged[accepted[change < tol]] = True
+        converged[indices[~improved][damping[indices[~improved]] > 1e12]] = True  # No further progress possible
+
+    params = np.column_stack([np.exp(u[:, :3]), u[:, 3]])
+
+    # A flat curve (no growth within the window) or a runaway K / P0 is a failed fit, not a converged one
+    P0, K, r = params[:, 0], params[:, 1], params[:, 2]
+    fold_change = K / P0
+    degenerate = ((r * span < MIN_GROWTH_SPAN) | (fold_change < MIN_FOLD_CHANGE) | (fold_change > MAX_FOLD_CHANGE)
+                  | ~np.isfinite(params).all(axis=1))
+    converged &= ~degenerate
+    return params, iterations, converged
+
+
+def _fit_chunk(arguments):
+    """Fits one chunk of wells (module-level so worker processes can import it)."""
+    time, od, t80_seeds, max_iter, tol = arguments
+    return fit_lag_logistic(time, od, t80_seeds, max_iter, tol)
+
+
+@instrument(count=lambda fits, time, od, *args, **kwargs: {"wells": len(od), "time_points": len(time)})
+def fit_growth_curves(time, od, wells=None, t80_seeds=None, n_jobs=1, chunk_size=2000, max_iter=200, tol=1e-10):
+    """
+    Estimates P0, K, r, lag and t80 for every well, with fit diagnostics.
+
+    Parameters:
+        time (array-like): Time points.
+        od (array-like): wells x time OD matrix (NaN for missing measurements).
+        wells (array-like or None): Well identifiers (0..n-1 if None).
+        t80_seeds (array-like or None): Observed 80% threshold times used as lag seeds
+            (None entries from time_to_80_percent are ignored).
+        n_jobs (int or None): Worker processes (None uses every CPU, 1 fits in this process).
+        chunk_size (int): Wells per worker task.
+        max_iter (int): Maximum Levenberg-Marquardt iterations.
+        tol (float): Relative cost change that counts as converged.
+
+    Returns:
+        fits (pd.DataFrame): One row per well with P0, K, r, lag, t80, doubling_time,
+            rmse, r2, iterations and converged.
+    """
+    time = np.asarray(time, dtype=float)
+    od = np.atleast_2d(np.asarray(od, dtype=float))
+    if t80_seeds is not None:
+        t80_seeds = np.array([np.nan if seed is None else seed for seed in t80_seeds], dtype=float)
+
+    chunks = [(time, od[start:start + chunk_size],
+               None if t80_seeds is None else t80_seeds[start:start + chunk_size], max_iter, tol)
+              for start in range(0, len(od), chunk_size)]
+
+    n_jobs = os.cpu_count() if n_jobs is None else n_jobs
+    if n_jobs > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(chunks))) as executor:
+            results = list(executor.map(_fit_chunk, chunks))
+    else:
+        results = [_fit_chunk(chunk) for chunk in chunks]
+
+    params = np.vstack([result[0] for result in results])
+    iterations = np.concatenate([result[1] for result in results])
+    converged = np.concatenate([result[2] for result in results])
+    P0, K, r, lag = params.T
+
+    # Fit diagnostics over the measured points
+    mask = np.isfinite(od)
+    errors = np.where(mask, lag_logistic(time, P0, K, r, lag) - od, 0.0)
+    n_measured = np.maximum(mask.sum(axis=1), 1)
+    means = np.where(mask, od, 0.0).sum(axis=1) / n_measured
+    total = np.where(mask, od - means[:, None], 0.0)
+    ss_res, ss_tot = (errors ** 2).sum(axis=1), (total ** 2).sum(axis=1)
+
+    fits = pd.DataFrame({
+        "well": np.arange(len(od)) if wells is None else np.asarray(wells),
+        "P0": P0,
+        "K": K,
+        "r": r,
+        "lag": lag,
+        "t80": lag + np.log(4 * (K / P0 - 1)) / r,  # Model time to reach 80% of K
+        "doubling_time": math.log(2) / r,
+        "rmse": np.sqrt(ss_res / n_measured),
+        "r2": np.where(ss_tot > 0, 1 - ss_res / np.where(ss_tot > 0, ss_tot, 1), np.nan),
+        "iterations": iterations,
+        "converged": converged,
+    })
+    print(f"✅ Fitted {len(fits)} growth curves ({int(converged.sum())} converged, "
+          f"median R² {np.nanmedian(fits['r2']):.4f})")
+    return fits
@@ -0,0 +1,142 @@
+# ==============================================
+# Hierarchical Clustering: One Linkage for Labels & Dendrogram
+# ==============================================
+
+import time
+
+import numpy as np
+from scipy.cluster.hierarchy import dendrogram, fcluster, linkage
+from sklearn.cluster import AgglomerativeClustering
+from sklearn.neighbors import kneighbors_graph
+
+from .profiling import instrument
+
+try:
+    import fastcluster  # Optional: O(n) memory linkage on raw observation vectors
+except ImportError:
+    fastcluster = None
+
+# Above this many samples the full tree is built on a sparse k-nearest-neighbour graph
+CONNECTIVITY_THRESHOLD = 20000
+
+# Without fastcluster, exact linkage needs the condensed distance matrix
+# (n(n-1)/2 float64s, about 100 MB at 5,000 samples); larger inputs use the graph
+CONDENSED_THRESHOLD = 5000
+
+# Methods fastcluster can link straight from the observation vectors
+VECTOR_METHODS = ("ward", "centroid", "median", "single")
+
+
+def linkage_from_children(children, distances, n_samples):
+    """
+    Converts scikit-learn's merge tree into a SciPy linkage matrix.
+
+    Parameters:
+        children (np.ndarray): Merge pairs (n_samples - 1 x 2) in merge order.
+        distances (np.ndarray): Merge distances, one per row of children.
+        n_samples (int): Number of leaves.
+
+    Returns:
+        linkage_matrix (np.ndarray): SciPy-style linkage matrix (n_samples - 1 x 4).
+    """
+    counts = np.zeros(children.shape[0])
+    for i, (left, right) in enumerate(children):
+        counts[i] = ((1 if left < n_samples else counts[left - n_samples])
+                     + (1 if right < n_samples else counts[right - n_samples]))
+
+    # Connectivity constraints can produce slightly non-monotonic heights; fcluster and
+    # dendrogram expect each merge to be at least as high as the merges below it
+    heights = np.maximum.accumulate(distances)
+    return np.column_stack([children, heights, counts]).astype(float)
+
+
+def hierarchical_linkage(X, method="ward", backend="auto", n_neighbors=10):
+    """
+    Builds the hierarchical clustering tree once.
+
+    Parameters:
+        X (array-like): Scaled feature matrix (samples x features).
+        method (str): Linkage method ("ward", "average", "complete" or "single").
+        backend (str): "nn_chain" (exact, fastcluster's O(n) memory linkage on the
+            observation vectors), "condensed" (exact, SciPy on the O(n^2) condensed
+            distance matrix), "connectivity" (k-nearest-neighbour graph constrained)
+            or "auto" (nn_chain when fastcluster supports the method, condensed up to
+            CONDENSED_THRESHOLD samples otherwise, connectivity above the thresholds).
+        n_neighbors (int): Neighbours per sample in the connectivity graph.
+
+    Returns:
+        linkage_matrix (np.ndarray): SciPy-style linkage matrix.
+        backend (str): The backend that was used.
+    """
+    n_samples = X.shape[0]
+    vector_linkage = fastcluster is not None and method in VECTOR_METHODS
+    if backend == "auto":
+        if vector_linkage and n_samples <= CONNECTIVITY_THRESHOLD:
+            backend = "nn_chain"
+        elif n_samples <= CONDENSED_THRESHOLD:
+            backend = "condensed"
+        else:
+            backend = "connectivity"
+
+    if backend == "nn_chain":
+        if not vector_linkage:
+            raise ValueError(f"The nn_chain backend needs fastcluster and a method in {VECTOR_METHODS} "
+                             f"(method: {method}, fastcluster installed: {fastcluster is not None})")
+        return fastcluster.linkage_vector(X, method=method), "nn_chain (fastcluster)"
+
+    if backend == "condensed":
+        # SciPy computes all pairwise distances first (nearest-neighbour chain on that matrix)
+        return linkage(X, method=method), "condensed (scipy)"
+
+    if backend == "connectivity":
+        connectivity = kneighbors_graph(X, n_neighbors=n_neighbors, include_self=False)
+        model = AgglomerativeClustering(n_clusters=None, distance_threshold=0, linkage=method,
+                                        connectivity=connectivity, compute_full_tree=True)
+        model.fit(X)
+        return linkage_from_children(model.children_, model.distances_, n_samples), "connectivity"
+
+    raise ValueError(f"Unknown hierarchical clustering backend: {backend}")
+
+
+@instrument(count=lambda result, X, *args, **kwargs: {"rows": X.shape[0]})
+def hierarchical_clustering(X, n_clusters=2, method="ward", backend="auto", n_neighbors=10):
+    """
+    Runs hierarchical clustering once and derives flat labels from the same tree.
+
+    Parameters:
+        X (array-like): Scaled feature matrix (samples x features).
+        n_clusters (int): Number of flat clusters to cut the tree into.
+        method (str): Linkage method.
+        backend (str): Linkage backend (see hierarchical_linkage).
+        n_neighbors (int): Neighbours per sample in the connectivity graph.
+
+    Returns:
+        result (dict): "linkage" matrix, zero-based flat "labels", "backend" and "seconds".
+    """
+    start = time.perf_counter()
+    linkage_matrix, used_backend = hierarchical_linkage(X, method=method, backend=backend,
+                                                        n_neighbors=n_neighbors)
+    labels = fcluster(linkage_matrix, t=n_clusters, criterion="maxclust") - 1
+    seconds = time.perf_counter() - start
+
+    print(f"🌳 Hierarchical clustering ({used_backend}) on {X.shape[0]} samples: {seconds:.2f} s")
+    return {"linkage": linkage_matrix, "labels": labels, "backend": used_backend, "seconds": seconds}
+
+
+def plot_truncated_dendrogram(linkage_matrix, p=30, truncate_mode="lastp", ax=None):
+    """
+    Draws only the top of the dendrogram so the plot cost does not grow with the sample count.
+
+    Parameters:
+        linkage_matrix (np.ndarray): SciPy-style linkage matrix.
+        p (int): Number of final merges ("lastp") or tree levels ("level") to show.
+        truncate_mode (str): "lastp" or "level".
+        ax (matplotlib.axes.Axes or None): Axes to draw on (current axes if None).
+
+    Returns:
+        tree (dict): The dendrogram data returned by SciPy.
+    """
+    import matplotlib.pyplot as plt  # Imported lazily; clustering itself does not need plotting
+
+    ax = ax if ax is not None else plt.gca()
+    return dendrogram(linkage_matrix, p=p, truncate_mode=truncate_mode, show_contracted=True, ax=ax)
@@ -0,0 +1,206 @@
+# ==============================================
+# Permutation Feature Importance (model-agnostic)
+# ==============================================
+#
+# The feature matrix is placed in shared memory once; each worker process
+# attaches to it read-only, keeps one private scratch copy and one copy of the
+# model, and per task permutes a group of columns in the scratch copy, scores
+# the model and restores the columns. The baseline score is computed once.
+
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+from scipy.cluster.hierarchy import fcluster, linkage
+from scipy.spatial.distance import squareform
+from sklearn.metrics import get_scorer
+
+from .profiling import instrument
+
+# Breast cancer feature triplets: radius_mean / radius_se / radius_worst
+FEATURE_SUFFIX_PATTERN = r"_(mean|se|worst)$"
+
+_worker = {}  # Per-process state set by _init_worker
+
+
+def feature_groups(feature_names, X=None, correlation_threshold=None, suffix_pattern=FEATURE_SUFFIX_PATTERN):
+    """
+    Groups features that should be permuted together.
+
+    Features sharing a base name (the name without a `_mean`/`_se`/`_worst`
+    suffix) form one group; with a correlation threshold, groups whose features
+    are correlated at least that strongly are merged as well.
+
+    Parameters:
+        feature_names (list): Column names.
+        X (array-like or None): Feature matrix (needed for correlation grouping).
+        correlation_threshold (float or None): Minimum absolute Pearson correlation for merging groups.
+        suffix_pattern (str or None): Regex removed from names to get the base name (None: one feature per group).
+
+    Returns:
+        groups (dict): Group name -> list of column indices.
+    """
+    groups = {}
+    for index, name in enumerate(feature_names):
+        base = re.sub(suffix_pattern, "", str(name)) if suffix_pattern else str(name)
+        groups.setdefault(base, []).append(index)
+
+    if correlation_threshold is None or len(groups) < 2:
+        return groups
+    if X is None:
+        raise ValueError("❌ Error: correlation grouping needs the feature matrix X.")
+
+    # Group-to-group similarity: strongest absolute correlation between their features
+    correlation = np.abs(pd.DataFrame(np.asarray(X, dtype=float)).corr().to_numpy())
+    correlation = np.nan_to_num(correlation)
+    names = list(groups)
+    similarity = np.array([[correlation[np.ix_(groups[a], groups[b])].max() for b in names] for a in names])
+    distance = np.clip(1 - similarity, 0, None)
+    np.fill_diagonal(distance, 0)
+
+    # Single linkage: groups chained by correlations >= threshold end up together
+    clusters = fcluster(linkage(squareform(distance, checks=False), method="single"),
+                        t=1 - correlation_threshold, criterion="distance")
+    merged = {}
+    for name, cluster in zip(names, clusters):
+        merged.setdefault(cluster, []).append(name)
+    return {"+".join(members): sorted(index for member in members for index in groups[member])
+            for members in merged.values()}
+
+
+def _init_worker(X, y, model, scoring, columns):
+    """
+    Keeps this worker's feature matrix view, scratch copy and model.
+
+    X is either the array itself (in-process) or (shared memory name, shape, dtype).
+    """
+    memory = None
+    if isinstance(X, tuple):
+        memory_name, shape, dtype = X
+        # Workers share the parent's resource tracker; the parent unlinks the block
+        memory = shared_memory.SharedMemory(name=memory_name)
+        X = np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+    _worker.update({
+        "memory": memory,
+        "X": X,
+        "scratch": X.copy(),
+        "y": y,
+        "model": model,
+        "scorer": get_scorer(scoring),
+        "columns": columns,
+    })
+
+
+def _score(X):
+    if _worker["columns"] is not None:
+        X = pd.DataFrame(X, columns=_worker["columns"], copy=False)
+    return _worker["scorer"](_worker["model"], X, _worker["y"])
+
+
+def _baseline_score():
+    return _score(_worker["X"])
+
+
+def _permuted_scores(task):
+    """Scores the model with one group of columns permuted (same row shuffle for the whole group)."""
+    group_index, columns, repeats, seed = task
+    X, scratch = _worker["X"], _worker["scratch"]
+    rng = np.random.default_rng(seed)
+
+    scores = []
+    for _ in range(repeats):
+        scratch[:, columns] = X[np.ix_(rng.permutation(len(X)), columns)]
+        scores.append(_score(scratch))
+    scratch[:, columns] = X[:, columns]
+    return group_index, scores
+
+
+@instrument(count=lambda result, model, X, *args, **kwargs: {"rows": len(X), "evaluations": result["timing"]["evaluations"]})
+def permutation_importance(model, X, y, groups=None, n_repeats=10, scoring="accuracy", confidence=0.95,
+                           baseline_score=None, n_jobs=1, random_state=42):
+    """
+    Permutation importance of features or feature groups for any fitted model.
+
+    Parameters:
+        model: Fitted estimator or pipeline (scored with sklearn's `scoring`).
+        X (array-like): Held-out feature matrix (DataFrame column names are kept for the model).
+        y (array-like): True labels.
+        groups (dict or None): Group name -> column indices (feature_groups); None permutes each column alone.
+        n_repeats (int): Permutations per group.
+        scoring (str): sklearn scorer name (accuracy, f1, roc_auc, ...).
+        confidence (float): Confidence level of the interval around the mean importance.
+        baseline_score (float or None): Unpermuted score, if already known.
+        n_jobs (int or None): Worker processes (None uses every CPU, 1 runs in this process).
+        random_state (int): Seed of the permutations.
+
+    Returns:
+        result (dict): "importances" (one row per group: mean drop in score, std and
+            confidence interval, most important first), "scores" (group x repeat
+            permuted scores), "baseline_score" and "timing".
+    """
+    start_total = time.perf_counter()
+    columns = list(X.columns) if isinstance(X, pd.DataFrame) and hasattr(model, "feature_names_in_") else None
+    X = np.ascontiguousarray(np.asarray(X, dtype=float))
+    y = np.asarray(y)
+    if groups is None:
+        groups = {str(name): [index] for index, name in enumerate(columns or range(X.shape[1]))}
+    names = list(groups)
+
+    seeds = np.random.SeedSequence(random_state).generate_state(len(names))
+    tasks = [(index, np.asarray(groups[name]), n_repeats, int(seeds[index])) for index, name in enumerate(names)]
+    n_jobs = os.cpu_count() if n_jobs is None else n_jobs
+
+    scores = np.empty((len(names), n_repeats))
+    memory = None
+    try:
+        if n_jobs > 1 and len(tasks) > 1:
+            memory = shared_memory.SharedMemory(create=True, size=max(X.nbytes, 1))
+            np.ndarray(X.shape, dtype=X.dtype, buffer=memory.buf)[:] = X
+            initargs = ((memory.name, X.shape, X.dtype), y, model, scoring, columns)
+            with ProcessPoolExecutor(max_workers=min(n_jobs, len(tasks)), initializer=_init_worker,
+                                     initargs=initargs) as executor:
+                if baseline_score is None:
+                    baseline_score = executor.submit(_baseline_score).result()
+                for group_index, group_scores in executor.map(_permuted_scores, tasks):
+                    scores[group_index] = group_scores
+        else:
+            _init_worker(X, y, model, scoring, columns)
+            if baseline_score is None:
+                baseline_score = _baseline_score()
+            for group_index, group_scores in map(_permuted_scores, tasks):
+                scores[group_index] = group_scores
+    finally:
+        _worker.clear()
+        if memory is not None:
+            memory.close()
+            memory.unlink()
+
+    drops = baseline_score - scores
+    mean = drops.mean(axis=1)
+    std = drops.std(axis=1, ddof=1) if n_repeats > 1 else np.zeros(len(names))
+    margin = stats.t.ppf((1 + confidence) / 2, max(n_repeats - 1, 1)) * std / np.sqrt(n_repeats)
+
+    importances = pd.DataFrame({
+        "group": names,
+        "features": [len(groups[name]) for name in names],
+        "importance_mean": mean,
+        "importance_std": std,
+        "ci_low": mean - margin,
+        "ci_high": mean + margin,
+    }).sort_values("importance_mean", ascending=False, kind="stable").reset_index(drop=True)
+
+    return {
+        "importances": importances,
+        "scores": pd.DataFrame(scores, index=pd.Index(names, name="group")),
+        "baseline_score": float(baseline_score),
+        "timing": {
+            "evaluations": len(names) * n_repeats + 1,
+            "total_wall_seconds": time.perf_counter() - start_total,
+        },
+    }
+
@@ -0,0 +1,347 @@
+# ==============================================
+# K-mer Spectra, Codon Usage & GC Content
+# ==============================================
+#
+# Bases are encoded as 2-bit codes (A=0, C=1, G=2, T=3; anything else is
+# treated as N and breaks k-mers), k-mers are rolled into integers with NumPy
+# shifts and counted with np.bincount (dense table, small k) or a sorted
+# key/count table (large k). Counts from sequence pieces, FASTA chunks or
+# worker processes are combined with merge().
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .profiling import instrument
+from .translation import CODON_TABLE
+
+BASES = "ACGT"
+N_CODE = 4
+DENSE_MAX_K = 10  # 4**10 counters (8 MB); larger k uses the sparse table
+MAX_K = 31        # 62 bits fit into int64
+
+# ASCII byte -> 2-bit base code lookup table
+_BYTE_TO_CODE = np.full(256, N_CODE, dtype=np.uint8)
+for _code, _base in enumerate(BASES):
+    _BYTE_TO_CODE[ord(_base)] = _code
+    _BYTE_TO_CODE[ord(_base.lower())] = _code
+
+# Codon integer (16 * first + 4 * second + third) -> codon string
+CODONS = np.array([a + b + c for a in BASES for b in BASES for c in BASES])
+
+
+def encode_dna(sequence):
+    """
+    Encodes a DNA string as uint8 base codes (0-3 for ACGT, 4 for anything else).
+
+    Parameters:
+        sequence (str or bytes): DNA sequence (case-insensitive; U is not converted).
+
+    Returns:
+        codes (np.ndarray): One uint8 code per base.
+    """
+    if isinstance(sequence, str):
+        sequence = sequence.encode("ascii", "replace")
+    return _BYTE_TO_CODE[np.frombuffer(sequence, dtype=np.uint8)]
+
+
+def rolling_kmers(codes, k):
+    """
+    Integer code of every k-mer window that contains only A, C, G and T.
+
+    Parameters:
+        codes (np.ndarray): Base codes from encode_dna.
+        k (int): k-mer length (1 to 31).
+
+    Returns:
+        kmers (np.ndarray): int64 k-mer codes (2 bits per base, first base highest).
+    """
+    if not 1 <= k <= MAX_K:
+        raise ValueError(f"❌ Error: k must be between 1 and {MAX_K}, got {k}.")
+    n_windows = len(codes) - k + 1
+    if n_windows <= 0:
+        return np.zeros(0, dtype=np.int64)
+
+    kmers = np.zeros(n_windows, dtype=np.int64)
+    for offset in range(k):
+        kmers = (kmers << 2) | (codes[offset:offset + n_windows] & 3)
+
+    # Drop windows that contain an N (running count of N bases over the window)
+    n_before = np.concatenate([[0], np.cumsum(codes == N_CODE)])
+    clean = n_before[k:] - n_before[:n_windows] == 0
+    return kmers[clean]
+
+
+def decode_kmers(kmers, k):
+    """Turns integer k-mer codes back into strings."""
+    kmers = np.asarray(kmers, dtype=np.int64)
+    letters = np.array(list(BASES))
+    shifts = 2 * np.arange(k - 1, -1, -1)
+    digits = (kmers[:, None] >> shifts[None, :]) & 3
+    return ["".join(row) for row in letters[digits]]
+
+
+class SequenceStats:
+    """
+    Accumulated k-mer spectrum, codon usage and base composition.
+
+    Sequences can be added whole or in pieces. A piece carries `overlap` bases
+    from the end of the previous piece of the same record, so k-mers and codons
+    spanning the boundary are counted exactly once.
+
+    Parameters:
+        k (int): k-mer length.
+    """
+
+    def __init__(self, k=6):
+        if not 1 <= k <= MAX_K:
+            raise ValueError(f"❌ Error: k must be between 1 and {MAX_K}, got {k}.")
+        self.k = k
+        self.dense = k <= DENSE_MAX_K
+        # Dense: count per k-mer code. Sparse: counts aligned with the sorted kmer_keys
+        self.kmer_table = np.zeros(4 ** k if self.dense else 0, dtype=np.int64)
+        self.kmer_keys = np.zeros(0, dtype=np.int64)
+        self.codon_table = np.zeros(64, dtype=np.int64)
+        self.base_table = np.zeros(N_CODE + 1, dtype=np.int64)
+        self.sequences = 0
+
+    @property
+    def overlap(self):
+        """Bases a piece must repeat from the previous piece (k - 1 for k-mers, 2 for codons)."""
+        return max(self.k - 1, 2)
+
+    def update(self, sequence, start=0, overlap=0):
+        """
+        Adds a sequence or a piece of one.
+
+        Parameters:
+            sequence (str or bytes): The bases; a piece starts with `overlap` bases
+                repeated from the previous piece.
+            start (int): Offset of the first new base within its record (sets the codon frame).
+            overlap (int): Number of leading bases already counted with the previous piece.
+
+        Returns:
+            self (SequenceStats): For chaining.
+        """
+        codes = encode_dna(sequence)
+        if start == 0:
+            self.sequences += 1
+        self.base_table += np.bincount(codes[overlap:], minlength=N_CODE + 1)
+
+        # k-mers ending in the new bases
+        kmers = rolling_kmers(codes[max(overlap - self.k + 1, 0):], self.k)
+        self._add_kmers(kmers)
+
+        # In-frame codons (record offsets divisible by 3) ending in the new bases
+        piece_start = start - overlap
+        first_codon = max(-(-(start - 2) // 3) * 3, 0) - piece_start
+        codon_bases = codes[first_codon:]
+        codon_bases = codon_bases[:len(codon_bases) - len(codon_bases) % 3].reshape(-1, 3)
+        codon_bases = codon_bases[(codon_bases != N_CODE).all(axis=1)].astype(np.int64)
+        self.codon_table += np.bincount(codon_bases[:, 0] * 16 + codon_bases[:, 1] * 4 + codon_bases[:, 2],
+                                        minlength=64)
+        return self
+
+    def _add_kmers(self, kmers, counts=None):
+        if self.dense:
+            self.kmer_table += np.bincount(kmers, weights=counts, minlength=len(self.kmer_table)).astype(np.int64)
+            return
+
+        # Sparse: merge sorted unique keys and their counts
+        keys, inverse = np.unique(np.concatenate([self.kmer_keys, kmers]), return_inverse=True)
+        weights = np.concatenate([self.kmer_table, np.ones(len(kmers), dtype=np.int64) if counts is None else counts])
+        self.kmer_keys = keys
+        self.kmer_table = np.bincount(inverse, weights=weights, minlength=len(keys)).astype(np.int64)
+
+    def merge(self, other):
+        """
+        Adds the counts of another SequenceStats (e.g. from a worker process).
+
+        Parameters:
+            other (SequenceStats): Counts with the same k.
+
+        Returns:
+            self (SequenceStats): For chaining.
+        """
+        if other.k != self.k:
+            raise ValueError(f"❌ Error: cannot merge k={other.k} counts into k={self.k} counts.")
+        if self.dense:
+            self.kmer_table += other.kmer_table
+        else:
+            self._add_kmers(other.kmer_keys, other.kmer_table)
+        self.codon_table += other.codon_table
+        self.base_table += other.base_table
+        self.sequences += other.sequences
+        return self
+
+    def kmer_counts(self, top=None):
+        """
+        The k-mer spectrum.
+
+        Parameters:
+            top (int or None): Only the most frequent k-mers.
+
+        Returns:
+            counts (pd.Series): k-mer -> count for every k-mer seen, most frequent first.
+        """
+        if self.dense:
+            keys = np.flatnonzero(self.kmer_table)
+            counts = self.kmer_table[keys]
+        else:
+            keys, counts = self.kmer_keys, self.kmer_table
+        order = np.argsort(-counts, kind="stable")
+        if top is not None:
+            order = order[:top]
+        return pd.Series(counts[order], index=pd.Index(decode_kmers(keys[order], self.k), name="kmer"), name="count")
+
+    def base_counts(self):
+        """Counts of A, C, G, T and N (any other character)."""
+        return pd.Series(self.base_table, index=list(BASES) + ["N"], name="count")
+
+    @property
+    def gc_content(self):
+        """Fraction of G and C among the A/C/G/T bases."""
+        acgt = self.base_table[:N_CODE].sum()
+        return float(self.base_table[1] + self.base_table[2]) / acgt if acgt else float("nan")
+
+    def codon_usage(self):
+        """
+        Codon usage and relative synonymous codon usage (RSCU) keyed by CODON_TABLE.
+
+        RSCU is a codon's count divided by the mean count of the codons coding for
+        the same amino acid (1.0 = no bias); it is NaN for amino acids never seen.
+
+        Returns:
+            usage (pd.DataFrame): Indexed by codon, with amino_acid, count,
+                per_thousand and rscu columns.
+        """
+        counts = pd.Series(self.codon_table, index=CODONS)
+        usage = pd.DataFrame({"amino_acid": pd.Series(CODON_TABLE)})
+        usage["count"] = counts.reindex(usage.index).to_numpy()
+        total = usage["count"].sum()
+        usage["per_thousand"] = usage["count"] / total * 1000 if total else np.nan
+
+        synonymous_mean = usage.groupby("amino_acid")["count"].transform("mean")
+        usage["rscu"] = usage["count"] / synonymous_mean.where(synonymous_mean > 0)
+        usage.index.name = "codon"
+        return usage
+
+
+def iter_fasta(filename, piece_size=1 << 22, overlap=2):
+    """
+    Streams a FASTA file as sequence pieces, without loading whole records.
+
+    Parameters:
+        filename (str): FASTA file.
+        piece_size (int): New bases per piece.
+        overlap (int): Bases repeated from the previous piece of the same record
+            (SequenceStats.overlap).
+
+    Yields:
+        piece (tuple): (record header, start offset of the new bases, overlap, sequence).
+    """
+    header, start, carry, buffer = None, 0, "", []
+    buffered = 0
+
+    def flush():
+        sequence = carry + "".join(buffer)
+        return (header, start, len(carry), sequence), sequence[-overlap:] if overlap else ""
+
+    with open(filename) as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith(">"):
+                if header is not None and (buffered or start == 0):
+                    yield flush()[0]
+                header, start, carry, buffer, buffered = line[1:], 0, "", [], 0
+                continue
+            if not line:
+                continue
+            buffer.append(line)
+            buffered += len(line)
+            if buffered >= piece_size:
+                piece, carry = flush()
+                yield piece
+                start += buffered
+                buffer, buffered = [], 0
+
+    if header is not None and (buffered or start == 0):
+        yield flush()[0]
+
+
+def _count_pieces(k, pieces):
+    """Counts a batch of (start, overlap, sequence) pieces (module-level for worker processes)."""
+    stats = SequenceStats(k)
+    for start, overlap, sequence in pieces:
+        stats.update(sequence, start, overlap)
+    return stats
+
+
+def _batches(pieces, batch_bases):
+    batch, size = [], 0
+    for piece in pieces:
+        batch.append(piece)
+        size += len(piece[2])
+        if size >= batch_bases:
+            yield batch
+            batch, size = [], 0
+    if batch:
+        yield batch
+
+
+def _count_parallel(k, pieces, n_jobs, batch_bases):
+    stats = SequenceStats(k)
+    n_jobs = os.cpu_count() if n_jobs is None else n_jobs
+    if n_jobs <= 1:
+        for batch in _batches(pieces, batch_bases):
+            stats.merge(_count_pieces(k, batch))
+        return stats
+
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        pending = []
+        for batch in _batches(pieces, batch_bases):
+            pending.append(executor.submit(_count_pieces, k, batch))
+            if len(pending) >= 2 * n_jobs:  # Bound the number of pieces held in memory
+                stats.merge(pending.pop(0).result())
+        for future in pending:
+            stats.merge(future.result())
+    return stats
+
+
+@instrument(count=lambda stats, *args, **kwargs: {"bases": int(stats.base_table.sum()), "sequences": stats.sequences})
+def sequence_stats(sequences, k=6, n_jobs=1, batch_bases=1 << 22):
+    """
+    K-mer spectrum, codon usage and GC content of a collection of sequences.
+
+    Parameters:
+        sequences (iterable): DNA strings (each read in frame 0, like translate_dna_to_protein).
+        k (int): k-mer length.
+        n_jobs (int or None): Worker processes (None uses every CPU).
+        batch_bases (int): Bases per worker task.
+
+    Returns:
+        stats (SequenceStats): The merged counts.
+    """
+    return _count_parallel(k, ((0, 0, sequence) for sequence in sequences), n_jobs, batch_bases)
+
+
+@instrument(count=lambda stats, *args, **kwargs: {"bases": int(stats.base_table.sum()), "sequences": stats.sequences})
+def fasta_stats(filename, k=6, n_jobs=1, piece_size=1 << 22):
+    """
+    K-mer spectrum, codon usage and GC content of a FASTA file, streamed in pieces.
+
+    Parameters:
+        filename (str): FASTA file.
+        k (int): k-mer length.
+        n_jobs (int or None): Worker processes (None uses every CPU).
+        piece_size (int): Bases per piece (and per worker task).
+
+    Returns:
+        stats (SequenceStats): The merged counts.
+    """
+    overlap = SequenceStats(k).overlap
+    pieces = ((start, carried, sequence)
+              for _, start, carried, sequence in iter_fasta(filename, piece_size, overlap))
+    return _count_parallel(k, pieces, n_jobs, piece_size)
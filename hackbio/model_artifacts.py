@@ -0,0 +1,197 @@
+# ==============================================
+# Model Artifacts: Build, Version & Load the Diagnosis Pipeline
+# ==============================================
+
+import glob
+import hashlib
+import json
+import os
+import re
+import time
+
+import joblib
+import numpy as np
+import sklearn
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+MODEL_NAME = "diagnosis_model"
+LABEL_MAP = {"B": 0, "M": 1}
+
+
+def build_diagnosis_pipeline(**classifier_params):
+    """
+    Builds the SimpleImputer -> StandardScaler -> LogisticRegression chain as one object.
+
+    Parameters:
+        **classifier_params: Keyword arguments forwarded to LogisticRegression.
+
+    Returns:
+        pipeline (Pipeline): Unfitted scikit-learn pipeline.
+    """
+    return Pipeline([
+        ("imputer", SimpleImputer(strategy="mean")),
+        ("scaler", StandardScaler()),
+        ("classifier", LogisticRegression(**classifier_params)),
+    ])
+
+
+def file_sha256(filename):
+    """Returns the SHA-256 hex digest of a file, read in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _hash_value(digest, value):
+    """Feeds a parameter or fitted attribute into a digest in a pickle-independent form."""
+    if hasattr(value, "tolist") and not isinstance(value, np.ndarray):
+        value = np.asarray(value)  # pandas Index / Series
+    if isinstance(value, np.ndarray):
+        array = value.astype(str) if value.dtype == object else np.ascontiguousarray(value)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.tobytes())
+    else:
+        digest.update(repr(value).encode())
+
+
+def model_fingerprint(pipeline, feature_names, training_data_hash=None):
+    """
+    Hash of what a fitted pipeline computes, independent of how it pickles.
+
+    Covers every step's parameters and fitted attributes (coefficients, scaler
+    statistics, imputer fill values, ...), the feature names and, if given, a
+    hash of the training data.
+
+    Parameters:
+        pipeline (Pipeline): Fitted pipeline.
+        feature_names (list): Ordered feature columns.
+        training_data_hash (str or None): Identifies the training data (e.g. the preprocessing cache key).
+
+    Returns:
+        digest (str): SHA-256 hex digest.
+    """
+    digest = hashlib.sha256()
+    for step_name, step in pipeline.steps:
+        digest.update(f"{step_name}:{type(step).__module__}.{type(step).__qualname__}".encode())
+        for key, value in sorted(step.get_params(deep=False).items()):
+            digest.update(key.encode())
+            _hash_value(digest, value)
+        fitted = {key: value for key, value in vars(step).items() if key.endswith("_") and not key.startswith("_")}
+        for key, value in sorted(fitted.items()):
+            digest.update(key.encode())
+            _hash_value(digest, value)
+    _hash_value(digest, [str(name) for name in feature_names])
+    _hash_value(digest, training_data_hash)
+    return digest.hexdigest()
+
+
+def _list_manifests(model_dir, name):
+    """Returns (version, manifest path) pairs for every saved version, oldest first."""
+    pattern = re.compile(rf"{re.escape(name)}-v(\d+)\.json$")
+    manifests = []
+    for path in glob.glob(os.path.join(model_dir, f"{name}-v*.json")):
+        match = pattern.search(os.path.basename(path))
+        if match:
+            manifests.append((int(match.group(1)), path))
+    return sorted(manifests)
+
+
+def save_model_artifact(pipeline, model_dir, feature_names, metrics=None, name=MODEL_NAME, training_data_hash=None):
+    """
+    Serializes a fitted pipeline with a content hash and an incrementing version.
+
+    If the newest saved version has the same model fingerprint (parameters,
+    fitted values, feature names and training data), no new version is written;
+    the file hash is only used to verify the saved file on load.
+
+    Parameters:
+        pipeline (Pipeline): Fitted pipeline to persist.
+        model_dir (str): Directory holding the versioned artifacts.
+        feature_names (list): Ordered feature columns expected by the pipeline.
+        metrics (dict or None): Evaluation metrics stored alongside the model.
+        name (str): Artifact base name.
+        training_data_hash (str or None): Identifies the training data (part of the fingerprint).
+
+    Returns:
+        manifest (dict): Metadata of the saved (or reused) artifact.
+    """
+    os.makedirs(model_dir, exist_ok=True)
+    manifests = _list_manifests(model_dir, name)
+
+    fingerprint = model_fingerprint(pipeline, feature_names, training_data_hash)
+    if manifests:
+        with open(manifests[-1][1]) as f:
+            latest = json.load(f)
+        if latest.get("model_fingerprint") == fingerprint:
+            print(f"✅ Model unchanged, reusing {name} v{latest['version']} ({fingerprint[:12]})")
+            return latest
+
+    temp_filename = os.path.join(model_dir, f".{name}.tmp")
+    joblib.dump(pipeline, temp_filename)
+    content_hash = file_sha256(temp_filename)
+
+    version = manifests[-1][0] + 1 if manifests else 1
+    model_filename = os.path.join(model_dir, f"{name}-v{version}.joblib")
+    os.replace(temp_filename, model_filename)
+
+    manifest = {
+        "name": name,
+        "version": version,
+        "sha256": content_hash,
+        "model_fingerprint": fingerprint,
+        "training_data_hash": training_data_hash,
+        "model_file": os.path.basename(model_filename),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "sklearn_version": sklearn.__version__,
+        "feature_names": list(feature_names),
+        "label_map": LABEL_MAP,
+        "metrics": metrics or {},
+    }
+    with open(os.path.join(model_dir, f"{name}-v{version}.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    print(f"💾 Saved {name} v{version} ({fingerprint[:12]}) to: {model_filename}")
+    return manifest
+
+
+def load_model_artifact(model_dir, version=None, name=MODEL_NAME):
+    """
+    Loads a versioned pipeline and verifies its content hash.
+
+    Parameters:
+        model_dir (str): Directory holding the versioned artifacts.
+        version (int or None): Version to load; the newest one if None.
+        name (str): Artifact base name.
+
+    Returns:
+        pipeline (Pipeline): The fitted pipeline.
+        manifest (dict): Metadata of the loaded artifact.
+    """
+    manifests = dict(_list_manifests(model_dir, name))
+    if not manifests:
+        raise FileNotFoundError(f"❌ Error: no '{name}' artifacts found in '{model_dir}'.")
+
+    version = max(manifests) if version is None else int(version)
+    if version not in manifests:
+        raise FileNotFoundError(f"❌ Error: {name} v{version} not found in '{model_dir}'.")
+
+    with open(manifests[version]) as f:
+        manifest = json.load(f)
+
+    model_filename = os.path.join(model_dir, manifest["model_file"])
+    content_hash = file_sha256(model_filename)
+    if content_hash != manifest["sha256"]:
+        raise ValueError(f"❌ Error: {model_filename} does not match its recorded hash "
+                         f"({content_hash[:12]} != {manifest['sha256'][:12]}).")
+
+    if manifest["sklearn_version"] != sklearn.__version__:
+        print(f"⚠️ Model was saved with scikit-learn {manifest['sklearn_version']}, "
+              f"running {sklearn.__version__}.")
+
+    pipeline = joblib.load(model_filename)
+    return pipeline, manifest
@@ -0,0 +1,262 @@
+# ==============================================
+# Mutation Frequencies: Residue & Substitution Counts
+# ==============================================
+#
+# Mutation codes such as "K60Q" (wild type, position, mutant) are parsed with
+# NumPy byte arithmetic, residues are encoded as uint8 codes (0-19 for the
+# standard amino acids, 20 for anything else) and every count is built with
+# np.bincount in one pass. Counts can be accumulated chunk by chunk.
+
+import numpy as np
+import pandas as pd
+
+AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+UNKNOWN_CODE = len(AMINO_ACIDS)  # Non-standard residues
+N_CODES = len(AMINO_ACIDS) + 1
+RESIDUE_LABELS = np.array(list(AMINO_ACIDS) + ["X"])
+
+# ASCII byte -> residue code lookup table
+_BYTE_TO_CODE = np.full(256, UNKNOWN_CODE, dtype=np.uint8)
+for _code, _residue in enumerate(AMINO_ACIDS):
+    _BYTE_TO_CODE[ord(_residue)] = _code
+    _BYTE_TO_CODE[ord(_residue.lower())] = _code
+
+
+def encode_residues(residues):
+    """
+    Encodes one-letter amino acids as uint8 codes.
+
+    Parameters:
+        residues (array-like or str): One-letter residues (a string is encoded per character).
+
+    Returns:
+        codes (np.ndarray): uint8 codes, UNKNOWN_CODE for non-standard letters.
+    """
+    if isinstance(residues, str):
+        return _BYTE_TO_CODE[np.frombuffer(residues.encode("ascii", "replace"), dtype=np.uint8)]
+    first_bytes = np.asarray(residues, dtype="S1").view(np.uint8)
+    return _BYTE_TO_CODE[first_bytes]
+
+
+def parse_mutation_codes(mutation_codes):
+    """
+    Splits mutation codes like "K60Q" into wild-type residue, position and mutant residue.
+
+    Missing values and malformed codes (no position, a digit where a residue
+    belongs, ...) get position -1 and the unknown residue code for both residues.
+
+    Parameters:
+        mutation_codes (array-like): Mutation codes (strings, object or categorical values).
+
+    Returns:
+        wild_type (np.ndarray): uint8 residue codes of the wild-type residue.
+        position (np.ndarray): int64 residue positions (-1 where the code is missing or unparsable).
+        mutant (np.ndarray): uint8 residue codes of the mutant residue.
+    """
+    series = pd.Series(mutation_codes, copy=False)
+    missing = series.isna().to_numpy()
+
+    # Fixed-width byte matrix: one row per code, one column per character (missing codes are empty)
+    codes = np.asarray(series.astype(str).to_numpy(), dtype="S")
+    codes[missing] = b""
+    n_codes = len(codes)
+    width = max(codes.dtype.itemsize, 1)
+    chars = codes.view(np.uint8).reshape(n_codes, width)
+    lengths = (chars != 0).sum(axis=1)
+
+    first = chars[:, 0]
+    last = chars[np.arange(n_codes), np.maximum(lengths - 1, 0)]
+    wild_type = _BYTE_TO_CODE[first]
+    mutant = _BYTE_TO_CODE[last]
+
+    # Accumulate the digits between the first and the last character, column by column
+    position = np.zeros(n_codes, dtype=np.int64)
+    has_digits = np.zeros(n_codes, dtype=bool)
+    valid = (lengths >= 3) & ~_is_digit(first) & ~_is_digit(last)
+    for column in range(1, width - 1):
+        digits = chars[:, column].astype(np.int64) - ord("0")
+        inside = column < lengths - 1
+        is_digit = (digits >= 0) & (digits <= 9)
+        valid &= ~inside | is_digit
+        position = np.where(inside & is_digit, position * 10 + digits, position)
+        has_digits |= inside & is_digit
+
+    invalid = ~(valid & has_digits)
+    position[invalid] = -1
+    wild_type[invalid] = UNKNOWN_CODE
+    mutant[invalid] = UNKNOWN_CODE
+    return wild_type, position, mutant
+
+
+def _is_digit(chars):
+    return (chars >= ord("0")) & (chars <= ord("9"))
+
+
+class MutationFrequencies:
+    """
+    Residue, substitution, position and per-protein mutation counts.
+
+    Call update() once with a full dataset or repeatedly with chunks; the counts
+    are the same either way.
+    """
+
+    def __init__(self):
+        self.substitutions = np.zeros((N_CODES, N_CODES), dtype=np.int64)
+        self.position_counts = np.zeros(0, dtype=np.int64)
+        self.proteins = {}  # Protein -> row in the per-protein arrays
+        self.protein_wild_type = np.zeros((0, N_CODES), dtype=np.int64)
+        self.protein_mutant = np.zeros((0, N_CODES), dtype=np.int64)
+        self.unparsed = 0
+
+    def update(self, mutation_codes, proteins=None):
+        """
+        Adds a batch of mutations to the counts.
+
+        Parameters:
+            mutation_codes (array-like): Mutation codes like "K60Q".
+            proteins (array-like or None): Protein of each mutation (enables per-protein summaries).
+
+        Returns:
+            self (MutationFrequencies): For chaining.
+        """
+        wild_type, position, mutant = parse_mutation_codes(mutation_codes)
+
+        # Missing and malformed codes are only counted as unparsed
+        parsed = position >= 0
+        self.unparsed += int((~parsed).sum())
+        wild_type, position, mutant = wild_type[parsed], position[parsed], mutant[parsed]
+
+        # 21 x 21 wild type -> mutant matrix from one bincount over combined codes
+        pair_codes = wild_type.astype(np.int64) * N_CODES + mutant
+        self.substitutions += np.bincount(pair_codes, minlength=N_CODES * N_CODES).reshape(N_CODES, N_CODES)
+
+        position_counts = np.bincount(position, minlength=len(self.position_counts))
+        position_counts[:len(self.position_counts)] += self.position_counts
+        self.position_counts = position_counts
+
+        if proteins is not None:
+            self._update_proteins(np.asarray(proteins)[parsed], wild_type, mutant)
+        return self
+
+    def _update_proteins(self, proteins, wild_type, mutant):
+        chunk_codes, chunk_proteins = pd.factorize(proteins)
+
+        # Map this chunk's protein codes to rows shared across chunks
+        rows = np.empty(len(chunk_proteins), dtype=np.int64)
+        for index, protein in enumerate(chunk_proteins):
+            rows[index] = self.proteins.setdefault(protein, len(self.proteins))
+
+        n_proteins = len(self.proteins)
+        if n_proteins > len(self.protein_wild_type):
+            padding = np.zeros((n_proteins - len(self.protein_wild_type), N_CODES), dtype=np.int64)
+            self.protein_wild_type = np.vstack([self.protein_wild_type, padding])
+            self.protein_mutant = np.vstack([self.protein_mutant, padding])
+
+        protein_rows = rows[chunk_codes]
+        size = n_proteins * N_CODES
+        self.protein_wild_type += np.bincount(protein_rows * N_CODES + wild_type, minlength=size).reshape(-1, N_CODES)
+        self.protein_mutant += np.bincount(protein_rows * N_CODES + mutant, minlength=size).reshape(-1, N_CODES)
+
+    @property
+    def total(self):
+        """Number of parsed mutations counted (unparsed codes are in `unparsed`)."""
+        return int(self.substitutions.sum())
+
+    def wild_type_frequencies(self, include_unknown=False):
+        """
+        Counts of each wild-type residue, most frequent first (residues never seen are left out).
+
+        Returns:
+            counts (pd.Series): Residue letter -> count.
+        """
+        return self._residue_series(self.substitutions.sum(axis=1), include_unknown, "wild_type")
+
+    def mutant_frequencies(self, include_unknown=False):
+        """
+        Counts of each mutant residue, most frequent first.
+
+        Returns:
+            counts (pd.Series): Residue letter -> count.
+        """
+        return self._residue_series(self.substitutions.sum(axis=0), include_unknown, "mutant")
+
+    @staticmethod
+    def _residue_series(counts, include_unknown, name):
+        labels = RESIDUE_LABELS if include_unknown else RESIDUE_LABELS[:UNKNOWN_CODE]
+        series = pd.Series(counts[:len(labels)], index=labels, name=name)
+        series = series[series > 0]
+        # Stable sort keeps alphabetical order between equal counts
+        return series.iloc[np.argsort(-series.to_numpy(), kind="stable")]
+
+    def substitution_matrix(self, include_unknown=False):
+        """
+        Wild type -> mutant substitution counts.
+
+        Returns:
+            matrix (pd.DataFrame): 20 x 20 counts (21 x 21 with the unknown residue 'X').
+        """
+        n = N_CODES if include_unknown else UNKNOWN_CODE
+        return pd.DataFrame(self.substitutions[:n, :n], index=pd.Index(RESIDUE_LABELS[:n], name="wild_type"),
+                            columns=pd.Index(RESIDUE_LABELS[:n], name="mutant"))
+
+    def position_frequencies(self):
+        """
+        Mutations per residue position (positions without mutations are left out).
+
+        Returns:
+            counts (pd.Series): Position -> count.
+        """
+        positions = np.flatnonzero(self.position_counts)
+        return pd.Series(self.position_counts[positions], index=pd.Index(positions, name="position"), name="mutations")
+
+    def protein_summary(self):
+        """
+        Per-protein mutation counts with the most frequent wild-type and mutant residues.
+
+        Returns:
+            summary (pd.DataFrame): One row per protein, most mutated first.
+        """
+        summary = pd.DataFrame({
+            "protein": list(self.proteins),
+            "mutations": self.protein_wild_type.sum(axis=1),
+            "top_wild_type": RESIDUE_LABELS[self.protein_wild_type.argmax(axis=1)],
+            "top_mutant": RESIDUE_LABELS[self.protein_mutant.argmax(axis=1)],
+        })
+        return summary.sort_values("mutations", ascending=False, kind="stable").reset_index(drop=True)
+
+
+def mutation_frequencies(df, mutation_column="Amino_Acid", protein_column="Protein"):
+    """
+    Counts residues and substitutions of a complete dataset.
+
+    Parameters:
+        df (pd.DataFrame): Mutations (e.g. the merged or filtered SIFT/FoldX table).
+        mutation_column (str): Column with codes like "K60Q".
+        protein_column (str or None): Protein column for per-protein summaries.
+
+    Returns:
+        frequencies (MutationFrequencies): The filled counter.
+    """
+    proteins = df[protein_column] if protein_column else None
+    return MutationFrequencies().update(df[mutation_column], proteins)
+
+
+def mutation_frequencies_from_csv(filename, mutation_column="Amino_Acid", protein_column="Protein",
+                                  chunksize=100000):
+    """
+    Counts residues and substitutions of a CSV without loading it at once.
+
+    Parameters:
+        filename (str): CSV with a mutation code column.
+        mutation_column (str): Column with codes like "K60Q".
+        protein_column (str or None): Protein column for per-protein summaries.
+        chunksize (int): Rows read per chunk.
+
+    Returns:
+        frequencies (MutationFrequencies): The filled counter.
+    """
+    frequencies = MutationFrequencies()
+    for chunk in pd.read_csv(filename, chunksize=chunksize):
+        chunk.columns = chunk.columns.str.strip()
+        frequencies.update(chunk[mutation_column], chunk[protein_column] if protein_column else None)
+    return frequencies
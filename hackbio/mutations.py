@@ -0,0 +1,126 @@
+# ==============================================
+# Amino Acid Mutation Datasets (SIFT & FoldX)
+# ==============================================
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from .dtypes import threshold_for
+from .profiling import file_size, instrument
+
+SIFT_URL = "https://raw.githubusercontent.com/HackBio-Internship/public_datasets/main/R/datasets/sift.tsv"
+FOLDX_URL = "https://raw.githubusercontent.com/HackBio-Internship/public_datasets/main/R/datasets/foldX.tsv"
+
+
+@instrument(count=lambda result, url, filename: {"bytes": file_size(filename)})
+def download_tsv(url, filename):
+    """
+    Downloads a TSV file from a given URL and saves it to the specified path.
+
+    Parameters:
+        url (str): The URL of the TSV dataset.
+        filename (str): The full path to save the file.
+    """
+    import requests  # Imported lazily; only needed when downloading
+
+    try:
+        response = requests.get(url)
+        response.raise_for_status()
+
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(filename, "wb") as file:
+            file.write(response.content)
+
+        print(f"File saved: {filename}")
+
+    except requests.exceptions.RequestException as e:
+        print(f"Error downloading {filename}: {e}")
+
+
+def load_mutation_dataset(filename):
+    """
+    Loads a SIFT or FoldX CSV and strips stray spaces from its column names.
+
+    Parameters:
+        filename (str): Path of the CSV file.
+
+    Returns:
+        df (pd.DataFrame): The loaded dataset.
+    """
+    df = pd.read_csv(filename)
+    df.columns = df.columns.str.strip()
+    return df
+
+
+def _shared_codes(left, right):
+    """
+    Codes of two key columns over one shared set of values (-1 for missing values).
+
+    Categorical columns (from hackbio.dtypes.compact_frame) are recoded from their
+    categories, without converting the rows to strings.
+    """
+    if isinstance(left.dtype, pd.CategoricalDtype) and isinstance(right.dtype, pd.CategoricalDtype):
+        shared = left.cat.categories.union(right.cat.categories)
+        left_codes = left.cat.set_categories(shared).cat.codes.to_numpy(np.int64)
+        right_codes = right.cat.set_categories(shared).cat.codes.to_numpy(np.int64)
+        return left_codes, right_codes, len(shared)
+
+    codes, uniques = pd.factorize(pd.concat([left, right], ignore_index=True))
+    codes = codes.astype(np.int64)
+    return codes[:len(left)], codes[len(left):], len(uniques)
+
+
+@instrument(count=lambda merged_df, sift_df, foldx_df: {"rows": len(merged_df), "sift_rows": len(sift_df),
+                                                       "foldx_rows": len(foldx_df)})
+def merge_mutation_datasets(sift_df, foldx_df):
+    """
+    Merges the SIFT and FoldX datasets on protein and amino acid substitution.
+
+    Rows with a missing protein or substitution match nothing.
+
+    Parameters:
+        sift_df (pd.DataFrame): SIFT scores (Protein, Amino_Acid, sift_Score).
+        foldx_df (pd.DataFrame): FoldX scores (Protein, Amino_Acid, foldX_Score).
+
+    Returns:
+        merged_df (pd.DataFrame): One row per mutation present in both datasets, with the
+            'specific_Protein_aa' key ("<Protein>_<Amino_Acid>").
+    """
+    # Integer key per (Protein, Amino_Acid) pair, built from shared category codes
+    sift_protein, foldx_protein, _ = _shared_codes(sift_df["Protein"], foldx_df["Protein"])
+    sift_aa, foldx_aa, n_aa = _shared_codes(sift_df["Amino_Acid"], foldx_df["Amino_Acid"])
+    sift_key = np.where((sift_protein >= 0) & (sift_aa >= 0), sift_protein * n_aa + sift_aa, -1)
+    foldx_key = np.where((foldx_protein >= 0) & (foldx_aa >= 0), foldx_protein * n_aa + foldx_aa, -1)
+
+    merged_df = pd.merge(sift_df.assign(_pair_key=sift_key)[sift_key >= 0],
+                         foldx_df.assign(_pair_key=foldx_key)[foldx_key >= 0],
+                         on="_pair_key", suffixes=('_sift', '_foldx'))
+
+    # The readable key is only built for the matched rows
+    specific_protein_aa = merged_df["Protein_sift"].astype(str) + "_" + merged_df["Amino_Acid_sift"].astype(str)
+    merged_df.insert(merged_df.columns.get_loc("_pair_key"), "specific_Protein_aa", specific_protein_aa)
+    return merged_df.drop(columns="_pair_key")
+
+
+def filter_deleterious_mutations(merged_df, sift_threshold=0.05, foldx_threshold=2):
+    """
+    Keeps mutations that are deleterious in both function (SIFT) and structure (FoldX).
+
+    Parameters:
+        merged_df (pd.DataFrame): Output of merge_mutation_datasets.
+        sift_threshold (float): SIFT scores below this are damaging.
+        foldx_threshold (float): FoldX ddG values above this are destabilising.
+
+    Returns:
+        deleterious_mutations (pd.DataFrame): A copy of the matching rows.
+    """
+    sift_scores, foldx_scores = merged_df["sift_Score"], merged_df["foldX_Score"]
+    return merged_df[
+        (sift_scores < threshold_for(sift_scores, sift_threshold))
+        & (foldx_scores > threshold_for(foldx_scores, foldx_threshold))
+    ].copy()
@@ -0,0 +1,356 @@
+# ==============================================
+# Pipeline Runner: Cached DAG of Stage Steps
+# ==============================================
+
+import ast
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import sys
+import textwrap
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class Node:
+    """
+    One pipeline step with explicit input and output files.
+
+    The step is called as func(*inputs, *outputs, **params). A node depends on
+    every node that produces one of its inputs.
+
+    Parameters:
+        name (str): Unique node name.
+        func (callable): The step to run.
+        inputs (list): Files the step reads.
+        outputs (list): Files the step writes.
+        params (dict or None): Extra keyword arguments; they are part of the cache key.
+        external (bool): True for download steps. Their existing outputs are reused
+            unless the run asks to refresh external data.
+        version (str or int or None): Part of the cache key; bump it when the step depends on
+            something the code fingerprint cannot see (code outside the package, tools, ...).
+    """
+
+    def __init__(self, name, func, inputs=(), outputs=(), params=None, external=False, version=None):
+        self.name = name
+        self.func = func
+        self.inputs = [os.path.abspath(path) for path in inputs]
+        self.outputs = [os.path.abspath(path) for path in outputs]
+        self.params = params or {}
+        self.external = external
+        self.version = version
+
+    def __repr__(self):
+        return f"Node({self.name!r})"
+
+
+class _FileHasher:
+    """SHA-256 of files, memoized on (path, size, mtime) for the duration of a run."""
+
+    def __init__(self):
+        self._hashes = {}
+
+    def __call__(self, path):
+        stat = os.stat(path)
+        key = (path, stat.st_size, stat.st_mtime_ns)
+        if key not in self._hashes:
+            digest = hashlib.sha256()
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+            self._hashes[key] = digest.hexdigest()
+        return self._hashes[key]
+
+
+def _module_file(module_name):
+    """Source file of a module, found without importing it (None if there is none)."""
+    module = sys.modules.get(module_name)
+    filename = getattr(module, "__file__", None)
+    if filename is None:
+        top_level = sys.modules.get(module_name.split(".")[0])
+        if getattr(top_level, "__path__", None) is None:
+            return None
+        path = os.path.join(list(top_level.__path__)[0], *module_name.split(".")[1:])
+        filename = path + ".py" if os.path.exists(path + ".py") else os.path.join(path, "__init__.py")
+    return filename if filename.endswith(".py") and os.path.exists(filename) else None
+
+
+def _imported_modules(tree, module_name, package):
+    """Absolute names of the modules of `package` imported anywhere in an AST."""
+    filename = _module_file(module_name) or ""
+    base = module_name if filename.endswith("__init__.py") else module_name.rpartition(".")[0]
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            candidates = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            try:
+                target = importlib.util.resolve_name("." * node.level + (node.module or ""), base) \
+                    if node.level else node.module
+            except (ImportError, ValueError):
+                continue
+            # `from . import x` may import submodules
+            candidates = [target] + [f"{target}.{alias.name}" for alias in node.names]
+        else:
+            continue
+        modules.update(name for name in candidates
+                       if name.split(".")[0] == package and _module_file(name) is not None)
+    return modules
+
+
+def _module_closure(module_names, package):
+    """The given modules plus every package module they import (at any depth)."""
+    closure, stack = set(), list(module_names)
+    while stack:
+        name = stack.pop()
+        if name in closure:
+            continue
+        closure.add(name)
+        with open(_module_file(name), encoding="utf-8") as f:
+            stack.extend(_imported_modules(ast.parse(f.read()), name, package) - closure)
+    return closure
+
+
+def _function_fingerprint(func):
+    """
+    Identifies a step's code, so editing it invalidates its cache.
+
+    Covers the function's source, the same-module functions and constants it
+    references (recursively) and the full source of every module of its
+    package that any of those import, directly or through other modules.
+    """
+    module_name = getattr(func, "__module__", "") or ""
+    module = sys.modules.get(module_name)
+    package = module_name.split(".")[0]
+    module_globals = vars(module) if module is not None else {}
+
+    digest = hashlib.sha256()
+    seen, stack, imported = set(), [func], set()
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        try:
+            source = textwrap.dedent(inspect.getsource(current))
+            tree = ast.parse(source)
+        except (OSError, TypeError, SyntaxError):
+            digest.update(repr(current).encode())
+            continue
+        digest.update(source.encode())
+        if not module_globals:
+            continue
+        imported |= _imported_modules(tree, module_name, package)
+
+        # Module-level names the code uses: local helpers are followed, imports and constants hashed
+        for name in sorted({node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}):
+            value = module_globals.get(name)
+            if value is None or value is current:
+                continue
+            value_module = getattr(value, "__module__", None) if callable(value) else None
+            if inspect.ismodule(value):
+                if value.__name__.split(".")[0] == package:
+                    imported.add(value.__name__)
+            elif callable(value) and value_module == module_name:
+                stack.append(value)
+            elif callable(value) and value_module and value_module.split(".")[0] == package:
+                imported.add(value_module)
+            elif isinstance(value, (str, int, float, bool, tuple, list, dict, frozenset, set)):
+                digest.update(f"{name}={value!r}".encode())
+
+    imported.discard(module_name)
+    for name in sorted(_module_closure(imported, package)):
+        with open(_module_file(name), "rb") as f:
+            digest.update(name.encode() + b"\0" + f.read())
+
+    return f"{module_name}.{getattr(func, '__qualname__', repr(func))}:{digest.hexdigest()}"
+
+
+def _node_key(node, file_hash):
+    """Cache key of a node: its code, version, parameters and the content of its inputs."""
+    payload = json.dumps({
+        "func": _function_fingerprint(node.func),
+        "version": node.version,
+        "params": node.params,
+        "inputs": {path: file_hash(path) for path in node.inputs},
+        "outputs": node.outputs,
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def build_graph(nodes):
+    """
+    Resolves node dependencies from matching input/output paths.
+
+    Parameters:
+        nodes (list): Node objects.
+
+    Returns:
+        dependencies (dict): Node name -> set of upstream node names.
+    """
+    producers = {}
+    for node in nodes:
+        for path in node.outputs:
+            if path in producers:
+                raise ValueError(f"❌ Error: '{path}' is produced by both {producers[path]} and {node.name}.")
+            producers[path] = node.name
+
+    dependencies = {node.name: {producers[path] for path in node.inputs if path in producers}
+                    for node in nodes}
+
+    # Reject cycles up front (Kahn's algorithm)
+    remaining = {name: set(upstream) for name, upstream in dependencies.items()}
+    while remaining:
+        ready = [name for name, upstream in remaining.items() if not upstream]
+        if not ready:
+            raise ValueError(f"❌ Error: pipeline has a cycle between {sorted(remaining)}.")
+        for name in ready:
+            del remaining[name]
+        for upstream in remaining.values():
+            upstream.difference_update(ready)
+
+    return dependencies
+
+
+def select_nodes(nodes, targets):
+    """Returns the target nodes plus everything upstream of them, in the original order."""
+    if not targets:
+        return list(nodes)
+
+    by_name = {node.name: node for node in nodes}
+    unknown = set(targets) - set(by_name)
+    if unknown:
+        raise ValueError(f"❌ Error: unknown pipeline nodes: {', '.join(sorted(unknown))}")
+
+    dependencies = build_graph(nodes)
+    selected = set()
+    stack = list(targets)
+    while stack:
+        name = stack.pop()
+        if name not in selected:
+            selected.add(name)
+            stack.extend(dependencies[name])
+    return [node for node in nodes if node.name in selected]
+
+
+def run_pipeline(nodes, state_file, max_workers=4, force=False, refresh_external=False, targets=None):
+    """
+    Runs the pipeline, skipping nodes whose inputs, code and parameters are unchanged.
+
+    Independent branches run concurrently on a thread pool.
+
+    Parameters:
+        nodes (list): Node objects.
+        state_file (str): JSON file recording the cache key of every completed node.
+        max_workers (int): Maximum number of nodes running at once.
+        force (bool): Rerun every node regardless of the cache.
+        refresh_external (bool): Re-download external inputs even if they exist.
+        targets (list or None): Node names to run (with their upstream nodes); all if None.
+
+    Returns:
+        report (list): One dictionary per node with status, seconds and cache key.
+    """
+    nodes = select_nodes(nodes, targets)
+    dependencies = build_graph(nodes)
+    by_name = {node.name: node for node in nodes}
+
+    state = {}
+    if os.path.exists(state_file):
+        with open(state_file) as f:
+            state = json.load(f)
+
+    file_hash = _FileHasher()
+    results = {}
+    start_run = time.perf_counter()
+
+    def is_fresh(node, key):
+        if force or not all(os.path.exists(path) for path in node.outputs):
+            return False
+        if node.external:
+            return not refresh_external
+        recorded = state.get(node.name, {})
+        return (recorded.get("key") == key
+                and all(recorded.get("outputs", {}).get(path) == file_hash(path) for path in node.outputs))
+
+    def execute(node):
+        start = time.perf_counter()
+        for path in node.outputs:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Outputs left over from an earlier run must not hide a step that wrote nothing
+        # (e.g. a refresh whose download failed)
+        previous = {path: os.stat(path).st_mtime_ns for path in node.outputs if os.path.exists(path)}
+        node.func(*node.inputs, *node.outputs, **node.params)
+        missing = [path for path in node.outputs
+                   if not os.path.exists(path) or os.stat(path).st_mtime_ns == previous.get(path)]
+        if missing:
+            raise RuntimeError(f"did not write {', '.join(missing)}")
+        return time.perf_counter() - start
+
+    pending = dict(dependencies)
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            # Start every node whose upstream nodes have all finished
+            for name in [name for name, upstream in pending.items() if upstream <= set(results)]:
+                del pending[name]
+                node = by_name[name]
+
+                failed_upstream = [up for up in dependencies[name] if results[up]["status"] in ("failed", "blocked")]
+                if failed_upstream:
+                    results[name] = {"node": name, "status": "blocked", "seconds": 0.0,
+                                     "detail": f"upstream failed: {', '.join(sorted(failed_upstream))}"}
+                    continue
+
+                # A missing or unreadable input fails this node only; the rest of the run
+                # continues and completed nodes are still recorded in the state file
+                try:
+                    key = _node_key(node, file_hash)
+                    fresh = is_fresh(node, key)
+                except Exception as e:
+                    results[name] = {"node": name, "status": "failed", "seconds": 0.0, "detail": str(e)}
+                    continue
+                if fresh:
+                    results[name] = {"node": name, "status": "cached", "seconds": 0.0, "key": key}
+                    continue
+
+                running[executor.submit(execute, node)] = (name, key)
+
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, key = running.pop(future)
+                node = by_name[name]
+                try:
+                    seconds = future.result()
+                except Exception as e:
+                    results[name] = {"node": name, "status": "failed", "seconds": 0.0, "detail": str(e)}
+                    continue
+
+                results[name] = {"node": name, "status": "ran", "seconds": seconds, "key": key}
+                state[name] = {"key": key, "outputs": {path: file_hash(path) for path in node.outputs},
+                               "seconds": seconds}
+
+    os.makedirs(os.path.dirname(os.path.abspath(state_file)), exist_ok=True)
+    with open(state_file, "w") as f:
+        json.dump(state, f, indent=2)
+
+    report = [results[node.name] for node in nodes]
+    print_report(report, time.perf_counter() - start_run)
+    return report
+
+
+def print_report(report, total_seconds):
+    """Prints per-node status and timings."""
+    icons = {"ran": "✅", "cached": "⚡", "failed": "❌", "blocked": "⏭️"}
+    print("\n📋 Pipeline Report:")
+    for entry in report:
+        detail = f"  ({entry['detail']})" if entry.get("detail") else ""
+        print(f"  {icons[entry['status']]} {entry['node']:<32} {entry['status']:<8} {entry['seconds']:8.2f} s{detail}")
+
+    cached = sum(entry["status"] == "cached" for entry in report)
+    print(f"⏱️ Total: {total_seconds:.2f} s, {cached}/{len(report)} nodes served from cache")
@@ -0,0 +1,213 @@
+# ==============================================
+# Plotting: Headless Figure Output & Density Rendering
+# ==============================================
+#
+# HACKBIO_HEADLESS=1 (or --headless on the command line) switches to the
+# non-interactive Agg backend: show_figure() then writes each figure to
+# HACKBIO_FIGURE_DIR (default ./figures) as HACKBIO_FIGURE_FORMATS (default png)
+# instead of blocking on plt.show().
+
+import os
+import re
+import sys
+
+import matplotlib
+import numpy as np
+
+# Above this many points, scatter plots switch to 2-D density layers
+DENSITY_THRESHOLD = 20000
+
+
+def is_headless():
+    """Returns True when figures should be written to disk instead of shown."""
+    return os.getenv("HACKBIO_HEADLESS", "").lower() in ("1", "true", "yes") or "--headless" in sys.argv
+
+
+if is_headless():
+    matplotlib.use("Agg")
+
+
+def figure_filename(name):
+    """Turns a figure title into a safe file name ('PCA Visualization' -> 'pca_visualization')."""
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+
+
+def show_figure(name, fig=None, output_dir=None, formats=None, dpi=150):
+    """
+    Shows the figure interactively, or writes it to disk in headless mode.
+
+    Parameters:
+        name (str): Figure name, used for the file name.
+        fig (matplotlib.figure.Figure or None): Figure to output (current figure if None).
+        output_dir (str or None): Directory for written figures (HACKBIO_FIGURE_DIR or ./figures).
+        formats (list or None): File formats, e.g. ["png", "svg"] (HACKBIO_FIGURE_FORMATS or png).
+        dpi (int): Resolution of raster formats.
+
+    Returns:
+        paths (list): Written file paths (empty when shown interactively).
+    """
+    import matplotlib.pyplot as plt
+
+    if not is_headless():
+        plt.show()
+        return []
+
+    fig = fig if fig is not None else plt.gcf()
+    output_dir = output_dir or os.getenv("HACKBIO_FIGURE_DIR", os.path.join(os.getcwd(), "figures"))
+    formats = formats or os.getenv("HACKBIO_FIGURE_FORMATS", "png").split(",")
+    os.makedirs(output_dir, exist_ok=True)
+
+    paths = []
+    for fmt in formats:
+        path = os.path.join(output_dir, f"{figure_filename(name)}.{fmt.strip()}")
+        fig.savefig(path, dpi=dpi, bbox_inches="tight")
+        paths.append(path)
+    plt.close(fig)
+
+    print(f"🖼️ Figure saved: {', '.join(paths)}")
+    return paths
+
+
+def _outlier_mask(x, y, quantile):
+    """Flags points outside the central quantile range on either axis."""
+    x_low, x_high = np.quantile(x, [quantile, 1 - quantile])
+    y_low, y_high = np.quantile(y, [quantile, 1 - quantile])
+    return (x < x_low) | (x > x_high) | (y < y_low) | (y > y_high)
+
+
+def density_scatter(ax, x, y, highlight=None, colors=None, threshold=DENSITY_THRESHOLD, gridsize=150,
+                    cmap="Greys", outlier_quantile=0.0005, **scatter_kwargs):
+    """
+    Scatter plot whose render cost stays flat as the number of points grows.
+
+    Up to `threshold` points are drawn individually. Beyond that, the background
+    points are aggregated into a hexbin density layer and only highlighted
+    (e.g. significant) and outlying points are drawn as markers.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): Axes to draw on.
+        x, y (array-like): Point coordinates.
+        highlight (array-like or None): Boolean mask of points always drawn individually.
+        colors (array-like or str or None): Marker colors (per point or one color).
+        threshold (int): Point count above which density rendering is used.
+        gridsize (int): Number of hexagons across the x axis.
+        cmap (str): Colormap of the density layer.
+        outlier_quantile (float): Points beyond this quantile on either axis stay individual.
+        **scatter_kwargs: Passed to ax.scatter.
+
+    Returns:
+        artists (list): The created matplotlib artists.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    highlight = np.zeros(len(x), dtype=bool) if highlight is None else np.asarray(highlight, dtype=bool)
+
+    if len(x) <= threshold:
+        return [ax.scatter(x, y, c=colors, **scatter_kwargs)]
+
+    individual = highlight | _outlier_mask(x, y, outlier_quantile)
+    background = ~individual
+    artists = [ax.hexbin(x[background], y[background], gridsize=gridsize, bins="log", mincnt=1, cmap=cmap)]
+
+    if isinstance(colors, (list, tuple, np.ndarray)) and len(colors) == len(x):
+        colors = np.asarray(colors)[individual]
+    artists.append(ax.scatter(x[individual], y[individual], c=colors, **scatter_kwargs))
+    return artists
+
+
+def _mode(values):
+    """Most frequent value (the smallest one on ties); hexbin reducer for class labels."""
+    classes, counts = np.unique(values, return_counts=True)
+    return classes[np.argmax(counts)]
+
+
+def _class_colors(classes, cmap):
+    """Discrete colormap and norm giving each class value one color band."""
+    from matplotlib.colors import BoundaryNorm, ListedColormap
+
+    colors = matplotlib.colormaps[cmap](np.linspace(0, 1, len(classes)))
+    if len(classes) > 1:
+        midpoints = (classes[1:] + classes[:-1]) / 2
+        edges = np.concatenate([[2 * classes[0] - midpoints[0]], midpoints, [2 * classes[-1] - midpoints[-1]]])
+    else:
+        edges = np.array([classes[0] - 0.5, classes[0] + 0.5])
+    return ListedColormap(colors), BoundaryNorm(edges, len(classes))
+
+
+def class_density_scatter(ax, x, y, labels, cmap="coolwarm", threshold=DENSITY_THRESHOLD, gridsize=120,
+                          highlight=None, outlier_quantile=0.0005, **scatter_kwargs):
+    """
+    Scatter plot colored by a class label, with density rendering for large inputs.
+
+    Beyond `threshold` points, each hexagon takes the color of the most common
+    class among its samples (one discrete color per class); highlighted and
+    outlying points are still drawn individually on top.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): Axes to draw on.
+        x, y (array-like): Point coordinates.
+        labels (array-like): Numeric label of each point (e.g. diagnosis or cluster).
+        cmap (str): Colormap.
+        threshold (int): Point count above which density rendering is used.
+        gridsize (int): Number of hexagons across the x axis.
+        highlight (array-like or None): Boolean mask of points always drawn individually.
+        outlier_quantile (float): Points beyond this quantile on either axis stay individual.
+        **scatter_kwargs: Passed to ax.scatter.
+
+    Returns:
+        mappable: Artist to pass to plt.colorbar.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    labels = np.asarray(labels, dtype=float)
+
+    if len(x) <= threshold:
+        return ax.scatter(x, y, c=labels, cmap=cmap, **scatter_kwargs)
+
+    class_cmap, norm = _class_colors(np.unique(labels), cmap)
+    highlight = np.zeros(len(x), dtype=bool) if highlight is None else np.asarray(highlight, dtype=bool)
+    individual = highlight | _outlier_mask(x, y, outlier_quantile)
+    background = ~individual
+
+    density = ax.hexbin(x[background], y[background], C=labels[background], reduce_C_function=_mode,
+                        gridsize=gridsize, cmap=class_cmap, norm=norm, mincnt=1)
+    ax.scatter(x[individual], y[individual], c=labels[individual], cmap=class_cmap, norm=norm, **scatter_kwargs)
+    return density
+
+
+def volcano_plot(ax, log2_fold_change, neg_log10_pvalue, upregulated, downregulated,
+                 log2fc_threshold=1, pvalue_threshold=0.01, threshold=DENSITY_THRESHOLD):
+    """
+    Volcano plot drawn once: non-significant genes as gray markers (or a density
+    layer for large inputs) and significant genes as red/blue markers.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): Axes to draw on.
+        log2_fold_change (array-like): log2 fold change per gene.
+        neg_log10_pvalue (array-like): -log10(p-value) per gene.
+        upregulated, downregulated (array-like): Boolean masks of significant genes.
+        log2fc_threshold (float): Fold change threshold line.
+        pvalue_threshold (float): p-value threshold line.
+        threshold (int): Point count above which density rendering is used.
+    """
+    upregulated = np.asarray(upregulated, dtype=bool)
+    downregulated = np.asarray(downregulated, dtype=bool)
+    colors = np.where(upregulated, "red", np.where(downregulated, "blue", "gray"))
+
+    density_scatter(ax, log2_fold_change, neg_log10_pvalue, highlight=upregulated | downregulated,
+                    colors=colors, threshold=threshold, alpha=0.7, s=12)
+
+    ax.axhline(-np.log10(pvalue_threshold), linestyle="dashed", color="black", alpha=0.7)  # p-value threshold line
+    ax.axvline(log2fc_threshold, linestyle="dashed", color="black", alpha=0.7)   # log2FC threshold for upregulation
+    ax.axvline(-log2fc_threshold, linestyle="dashed", color="black", alpha=0.7)  # log2FC threshold for downregulation
+    ax.set_xlabel("Log2 Fold Change")
+    ax.set_ylabel("-log10(p-value)")
+
+    from matplotlib.lines import Line2D
+
+    legend_handles = [
+        Line2D([], [], marker="o", linestyle="", color="gray", label="Not significant"),
+        Line2D([], [], marker="o", linestyle="", color="red", label=f"Upregulated (log2FC > {log2fc_threshold})"),
+        Line2D([], [], marker="o", linestyle="", color="blue", label=f"Downregulated (log2FC < -{log2fc_threshold})"),
+    ]
+    ax.legend(handles=legend_handles, title=f"p-value < {pvalue_threshold}", loc="upper right")
@@ -0,0 +1,150 @@
+# ==============================================
+# Preprocessing Cache: Reuse Imputed & Scaled Features Between Runs
+# ==============================================
+
+import hashlib
+import json
+import os
+import shutil
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.impute import SimpleImputer
+from sklearn.preprocessing import StandardScaler
+
+from .model_artifacts import LABEL_MAP, file_sha256
+
+# Bump when the preprocessing steps change so old cache entries are ignored
+PREPROCESSING_VERSION = 2
+
+
+def preprocessing_key(filename, params):
+    """
+    Builds the cache key from the input file's content hash and the preprocessing parameters.
+
+    Parameters:
+        filename (str): Path of the input CSV.
+        params (dict): Parameters that affect the preprocessing output.
+
+    Returns:
+        key (str): Short hex key identifying the cache entry.
+    """
+    payload = json.dumps({
+        "file_sha256": file_sha256(filename),
+        "params": params,
+        "version": PREPROCESSING_VERSION,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def _load_entry(entry_dir, mmap=False):
+    """
+    Loads a cache entry with the same types a cache miss returns.
+
+    X_raw and y keep their index and dtypes; the scaled matrix is an ordinary
+    array unless mmap asks for a read-only memory map.
+    """
+    with open(os.path.join(entry_dir, "meta.json")) as f:
+        meta = json.load(f)
+
+    imputer, scaler = joblib.load(os.path.join(entry_dir, "preprocessors.joblib"))
+    X_raw = pd.read_pickle(os.path.join(entry_dir, "X_raw.pkl"))
+    return {
+        "X_raw": X_raw,
+        "X_scaled": np.load(os.path.join(entry_dir, "X_scaled.npy"), mmap_mode="r" if mmap else None),
+        "y": pd.read_pickle(os.path.join(entry_dir, "y.pkl")),
+        "imputer": imputer,
+        "scaler": scaler,
+        "feature_names": X_raw.columns,
+        "meta": meta,
+    }
+
+
+def preprocess_cached(filename, loader, cache_dir, target="diagnosis", label_map=LABEL_MAP,
+                      strategy="mean", use_cache=True, mmap=False):
+    """
+    Loads, imputes and scales a dataset, reusing a cached result when the input is unchanged.
+
+    Parameters:
+        filename (str): Path of the cleaned CSV.
+        loader (callable): Function returning the loaded DataFrame (e.g. load_and_debug_dataset).
+        cache_dir (str): Directory holding the cache entries.
+        target (str): Name of the target column.
+        label_map (dict): Mapping from target labels to integer codes.
+        strategy (str): SimpleImputer strategy.
+        use_cache (bool): Set to False to always recompute (the result is still stored).
+        mmap (bool): Return X_scaled as a read-only memory map on cache hits (for
+            matrices too large to load; otherwise hits and misses return the same types).
+
+    Returns:
+        result (dict): X_raw, X_scaled, y, the fitted imputer and scaler,
+            feature_names and cache metadata.
+    """
+    start = time.perf_counter()
+    params = {"target": target, "label_map": label_map, "strategy": strategy}
+    key = preprocessing_key(filename, params)
+    entry_dir = os.path.join(cache_dir, key)
+
+    if use_cache and os.path.exists(os.path.join(entry_dir, "meta.json")):
+        try:
+            result = _load_entry(entry_dir, mmap=mmap)
+        except Exception as e:
+            print(f"⚠️ Preprocessing cache entry {key} is unreadable ({e}), recomputing.")
+        else:
+            load_seconds = time.perf_counter() - start
+            saved = result["meta"]["compute_seconds"] - load_seconds
+            print(f"⚡ Preprocessing cache hit ({key}): loaded in {load_seconds * 1000:.1f} ms, "
+                  f"saved ~{max(saved, 0) * 1000:.1f} ms")
+            result["meta"]["cache_hit"] = True
+            return result
+
+    print(f"🔄 Preprocessing cache miss ({key}): loading and preprocessing {filename}")
+    df = loader(filename)
+    if df is None:
+        raise ValueError(f"❌ Error: could not load '{filename}' for preprocessing.")
+
+    X_raw = df.drop(target, axis=1)
+    y = df[target].map(label_map)
+
+    imputer = SimpleImputer(strategy=strategy)
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(imputer.fit_transform(X_raw))
+    compute_seconds = time.perf_counter() - start
+
+    meta = {
+        "key": key,
+        "source": os.path.abspath(filename),
+        "params": params,
+        "target": target,
+        "feature_names": list(X_raw.columns),
+        "shape": list(X_scaled.shape),
+        "compute_seconds": compute_seconds,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+    # Write into a temporary directory first so a crash never leaves a half-written entry
+    temp_dir = entry_dir + ".tmp"
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    os.makedirs(temp_dir)
+    X_raw.to_pickle(os.path.join(temp_dir, "X_raw.pkl"))  # Pickled frames keep index and dtypes
+    np.save(os.path.join(temp_dir, "X_scaled.npy"), X_scaled)
+    y.to_pickle(os.path.join(temp_dir, "y.pkl"))
+    joblib.dump((imputer, scaler), os.path.join(temp_dir, "preprocessors.joblib"))
+    with open(os.path.join(temp_dir, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+    shutil.rmtree(entry_dir, ignore_errors=True)
+    os.replace(temp_dir, entry_dir)
+
+    print(f"💾 Preprocessing cached in {compute_seconds * 1000:.1f} ms: {entry_dir}")
+    meta["cache_hit"] = False
+    return {
+        "X_raw": X_raw,
+        "X_scaled": X_scaled,
+        "y": y,
+        "imputer": imputer,
+        "scaler": scaler,
+        "feature_names": X_raw.columns,
+        "meta": meta,
+    }
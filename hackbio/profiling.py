@@ -0,0 +1,338 @@
+# ==============================================
+# Profiling: Opt-in Timing & Memory Instrumentation
+# ==============================================
+#
+# Enable with HACKBIO_PROFILE=1 or the --profile command-line flag.
+#
+#   HACKBIO_PROFILE_REPORT   report file, .json or .csv (default hackbio_profile.json)
+#   HACKBIO_PROFILE_MEMORY   1 to also trace Python allocations with tracemalloc
+#   HACKBIO_PROFILE_CPROFILE directory for cProfile dumps (one .prof file per function)
+#
+# When disabled, an instrumented function costs one flag check per call.
+# Only the standard library is used, so importing this module stays cheap.
+
+import atexit
+import functools
+import os
+import sys
+import threading
+import time
+
+try:
+    import resource  # Not available on Windows
+except ImportError:
+    resource = None
+
+_ENABLED = False
+_settings = {"report_file": None, "trace_memory": False, "cprofile_dir": None}
+_records = []
+_profilers = {}
+_lock = threading.Lock()
+_local = threading.local()
+_traced_active = 0  # Open memory measurements in any thread (guarded by _lock)
+
+
+def is_enabled():
+    """Returns True when instrumentation is recording."""
+    return _ENABLED
+
+
+def enable(report_file=None, trace_memory=False, cprofile_dir=None):
+    """
+    Starts recording instrumented calls; the report is written at interpreter exit.
+
+    Parameters:
+        report_file (str or None): JSON or CSV report path (hackbio_profile.json if None).
+        trace_memory (bool): Record Python allocation peaks with tracemalloc.
+        cprofile_dir (str or None): Directory for per-function cProfile dumps.
+    """
+    global _ENABLED
+
+    _settings["report_file"] = report_file or "hackbio_profile.json"
+    _settings["trace_memory"] = trace_memory
+    _settings["cprofile_dir"] = cprofile_dir
+
+    if trace_memory:
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    if not _ENABLED:
+        atexit.register(_write_report_at_exit)
+    _ENABLED = True
+
+
+def disable():
+    """Stops recording; calls recorded so far are kept."""
+    global _ENABLED
+    _ENABLED = False
+
+
+def reset():
+    """Discards every recorded call and cProfile statistic."""
+    with _lock:
+        _records.clear()
+        _profilers.clear()
+
+
+def file_size(path):
+    """Size of a file in bytes, or None if it does not exist (for download counters)."""
+    return os.path.getsize(path) if path and os.path.exists(path) else None
+
+
+def _peak_rss_kb():
+    """Peak resident set size of the process in KiB (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # macOS reports bytes
+
+
+class _Measurement:
+    """Collects the timings and memory figures of one instrumented call or block."""
+
+    def __init__(self, name):
+        self.name = name
+        self.counts = {}
+
+    def start(self):
+        global _traced_active
+
+        # Only the outermost instrumented call is profiled (cProfile cannot nest)
+        depth = getattr(_local, "depth", 0)
+        _local.depth = depth + 1
+        self.profiler = None
+        if _settings["cprofile_dir"] and depth == 0:
+            import cProfile
+            with _lock:
+                self.profiler = _profilers.setdefault(self.name, cProfile.Profile())
+            try:
+                self.profiler.enable()
+            except ValueError:  # Another profiler is already active
+                self.profiler = None
+
+        self.traced_start = None
+        if _settings["trace_memory"]:
+            import tracemalloc
+            if tracemalloc.is_tracing():
+                # The tracemalloc peak is process-wide: reset it only when no other
+                # measurement is open, so outer and concurrent calls keep their peaks
+                # (nested calls then report an upper bound)
+                with _lock:
+                    if _traced_active == 0:
+                        tracemalloc.reset_peak()
+                    _traced_active += 1
+                    self.traced_start = tracemalloc.get_traced_memory()[0]
+
+        self.rss_start = _peak_rss_kb()
+        self.cpu_start = time.process_time()
+        self.wall_start = time.perf_counter()
+
+    def stop(self, error=None):
+        global _traced_active
+
+        wall = time.perf_counter() - self.wall_start
+        cpu = time.process_time() - self.cpu_start
+        rss_peak = _peak_rss_kb()
+
+        if self.profiler is not None:
+            self.profiler.disable()
+        _local.depth -= 1
+
+        record = {
+            "name": self.name,
+            "wall_s": wall,
+            "cpu_s": cpu,
+            "peak_rss_kb": rss_peak,
+            "peak_rss_delta_kb": None if rss_peak is None else rss_peak - self.rss_start,
+            "traced_peak_kb": None,
+            "thread": threading.current_thread().name,
+            "error": error,
+        }
+        if self.traced_start is not None:
+            import tracemalloc
+            with _lock:
+                record["traced_peak_kb"] = (tracemalloc.get_traced_memory()[1] - self.traced_start) / 1024
+                _traced_active -= 1
+        record.update(self.counts)
+
+        with _lock:
+            _records.append(record)
+
+
+def instrument(name=None, count=None):
+    """
+    Decorator recording wall time, CPU time and memory of every call while profiling is enabled.
+
+    Parameters:
+        name (str or None): Name used in the report (the function's qualified name if None).
+        count (callable or None): Called as count(result, *args, **kwargs); returns a dict
+            of sizes to record with the call, e.g. {"rows": len(result)}.
+
+    Returns:
+        decorator: Wraps the function; it can also be applied without arguments (@instrument).
+    """
+    def decorator(func):
+        label = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _ENABLED:
+                return func(*args, **kwargs)
+
+            measurement = _Measurement(label)
+            measurement.start()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                measurement.stop(error=type(e).__name__)
+                raise
+            if count is not None:
+                try:
+                    measurement.counts = count(result, *args, **kwargs) or {}
+                except Exception:  # A failing counter must never break the analysis
+                    measurement.counts = {}
+            measurement.stop()
+            return result
+
+        return wrapper
+
+    if callable(name):  # Used as @instrument without parentheses
+        func, name = name, None
+        return decorator(func)
+    return decorator
+
+
+class profile_block:
+    """
+    Context manager recording a block of code like an instrumented call.
+
+    Example:
+        with profile_block("kmeans.fit", rows=len(X)) as counts:
+            kmeans.fit(X)
+            counts["iterations"] = kmeans.n_iter_
+
+    Parameters:
+        name (str): Name used in the report.
+        **counts: Sizes to record with the block (rows, bases, ...).
+    """
+
+    def __init__(self, name, **counts):
+        self.name = name
+        self.counts = dict(counts)
+        self.measurement = None
+
+    def __enter__(self):
+        if _ENABLED:
+            self.measurement = _Measurement(self.name)
+            self.measurement.start()
+        return self.counts
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.measurement is not None:
+            self.measurement.counts = self.counts
+            self.measurement.stop(error=exc_type.__name__ if exc_type else None)
+        return False
+
+
+def records():
+    """Returns a copy of the recorded calls."""
+    with _lock:
+        return [dict(record) for record in _records]
+
+
+def summarize():
+    """
+    Aggregates the recorded calls per name.
+
+    Returns:
+        summary (list): One dictionary per name (calls, total/mean/max wall time,
+            total CPU time, largest peak RSS and traced peak), slowest first.
+    """
+    groups = {}
+    for record in records():
+        groups.setdefault(record["name"], []).append(record)
+
+    summary = []
+    for group_name, calls in groups.items():
+        walls = [call["wall_s"] for call in calls]
+        rss = [call["peak_rss_kb"] for call in calls if call["peak_rss_kb"] is not None]
+        traced = [call["traced_peak_kb"] for call in calls if call["traced_peak_kb"] is not None]
+        summary.append({
+            "name": group_name,
+            "calls": len(calls),
+            "total_wall_s": sum(walls),
+            "mean_wall_s": sum(walls) / len(walls),
+            "max_wall_s": max(walls),
+            "total_cpu_s": sum(call["cpu_s"] for call in calls),
+            "max_peak_rss_kb": max(rss) if rss else None,
+            "max_traced_peak_kb": max(traced) if traced else None,
+            "errors": sum(call["error"] is not None for call in calls),
+        })
+    return sorted(summary, key=lambda row: row["total_wall_s"], reverse=True)
+
+
+def write_report(filename=None):
+    """
+    Writes the recorded calls to JSON (calls + summary) or CSV (one row per call),
+    and dumps the cProfile statistics if enabled.
+
+    Parameters:
+        filename (str or None): Report path; the extension selects the format.
+
+    Returns:
+        filename (str): The written report path.
+    """
+    filename = filename or _settings["report_file"] or "hackbio_profile.json"
+    directory = os.path.dirname(os.path.abspath(filename))
+    os.makedirs(directory, exist_ok=True)
+    calls = records()
+
+    if filename.endswith(".csv"):
+        import csv
+        fieldnames = []
+        for record in calls:
+            fieldnames.extend(key for key in record if key not in fieldnames)
+        with open(filename, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(calls)
+    else:
+        import json
+        with open(filename, "w") as f:
+            json.dump({"argv": sys.argv, "calls": calls, "summary": summarize()}, f, indent=2)
+
+    if _settings["cprofile_dir"]:
+        os.makedirs(_settings["cprofile_dir"], exist_ok=True)
+        with _lock:
+            profilers = dict(_profilers)
+        for profile_name, profiler in profilers.items():
+            profiler.dump_stats(os.path.join(_settings["cprofile_dir"], f"{profile_name}.prof"))
+
+    return filename
+
+
+def print_summary(top=10):
+    """Prints the slowest instrumented functions."""
+    print("\n⏱️ Profile Summary (slowest first):")
+    for row in summarize()[:top]:
+        rss = f"{row['max_peak_rss_kb'] / 1024:8.1f} MiB" if row["max_peak_rss_kb"] is not None else "     n/a"
+        print(f"  {row['name']:<45} {row['calls']:6d} calls  {row['total_wall_s']:9.3f} s wall  "
+              f"{row['total_cpu_s']:9.3f} s CPU  peak RSS {rss}")
+
+
+def _write_report_at_exit():
+    if not _records:
+        return
+    try:
+        filename = write_report()
+        print_summary()
+        print(f"💾 Profile report saved to: {filename}")
+    except Exception as e:
+        print(f"❌ Error writing profile report: {e}")
+
+
+if os.getenv("HACKBIO_PROFILE", "").lower() in ("1", "true", "yes") or "--profile" in sys.argv:
+    enable(report_file=os.getenv("HACKBIO_PROFILE_REPORT"),
+           trace_memory=os.getenv("HACKBIO_PROFILE_MEMORY", "").lower() in ("1", "true", "yes"),
+           cprofile_dir=os.getenv("HACKBIO_PROFILE_CPROFILE"))
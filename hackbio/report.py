@@ -0,0 +1,250 @@
+# ==============================================
+# Report Builder: Parallel Headless Figure Rendering & HTML/PDF Output
+# ==============================================
+#
+# Every figure is declared first as a FigureSpec (a module-level builder
+# function plus the data it draws), then rendered across a process pool on
+# plain Agg figures (no pyplot, no window), and finally embedded into one
+# self-contained HTML file (and optionally a PDF). A manifest remembers the
+# hash of each figure's builder code (with the package modules it uses) and
+# data; unchanged figures are not rendered again.
+
+import base64
+import hashlib
+import html
+import json
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .pipeline import _function_fingerprint
+from .plotting import figure_filename
+
+MANIFEST_NAME = "report_manifest.json"
+
+
+class FigureSpec:
+    """
+    One report figure: what to draw and with which data.
+
+    Parameters:
+        name (str): Figure title (also the image file name).
+        builder (callable): Module-level function builder(fig, **data) that draws on a matplotlib Figure.
+        data (dict): Keyword arguments for the builder (must be picklable).
+        section (str): Report section heading.
+        caption (str): Text shown under the figure.
+        figsize (tuple): Figure size in inches.
+    """
+
+    def __init__(self, name, builder, data, section="", caption="", figsize=(8, 6)):
+        self.name = name
+        self.builder = builder
+        self.data = data
+        self.section = section
+        self.caption = caption
+        self.figsize = figsize
+
+    def __repr__(self):
+        return f"FigureSpec({self.name!r})"
+
+
+def spec_hash(spec, dpi):
+    """
+    Hash of everything that decides a figure's pixels: builder code, data, size and dpi.
+
+    The builder code includes the hackbio modules it imports (e.g. the plotting
+    helpers), so editing them renders the figure again.
+
+    Parameters:
+        spec (FigureSpec): The figure.
+        dpi (int): Render resolution.
+
+    Returns:
+        digest (str): SHA-256 hex digest.
+    """
+    digest = hashlib.sha256()
+    digest.update(_function_fingerprint(spec.builder).encode())
+    digest.update(repr((spec.figsize, dpi)).encode())
+    digest.update(pickle.dumps(spec.data, protocol=4))
+    return digest.hexdigest()
+
+
+def render_figure(spec, path, dpi=150):
+    """
+    Draws one figure on a standalone Agg figure and saves it (runs in worker processes).
+
+    Parameters:
+        spec (FigureSpec): The figure.
+        path (str): Output PNG path.
+        dpi (int): Resolution.
+
+    Returns:
+        seconds (float): Render time.
+    """
+    from matplotlib.figure import Figure  # Agg canvas, independent of the pyplot backend
+
+    start = time.perf_counter()
+    fig = Figure(figsize=spec.figsize)
+    spec.builder(fig, **spec.data)
+    fig.savefig(path, dpi=dpi, bbox_inches="tight")
+    return time.perf_counter() - start
+
+
+def _load_manifest(filename):
+    try:
+        with open(filename) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def render_figures(specs, output_dir, n_jobs=None, dpi=150, force=False):
+    """
+    Renders the figures whose hash changed since the last run, in parallel.
+
+    Parameters:
+        specs (list): FigureSpec objects.
+        output_dir (str): Report directory (images go to output_dir/figures).
+        n_jobs (int or None): Worker processes (None uses every CPU).
+        dpi (int): Resolution.
+        force (bool): Render every figure even if unchanged.
+
+    Returns:
+        entries (list): One dict per figure (spec, image path, status "rendered"/"skipped", seconds).
+    """
+    figure_dir = os.path.join(output_dir, "figures")
+    os.makedirs(figure_dir, exist_ok=True)
+    manifest_file = os.path.join(output_dir, MANIFEST_NAME)
+    manifest = _load_manifest(manifest_file)
+
+    entries, pending = [], []
+    for spec in specs:
+        digest = spec_hash(spec, dpi)
+        path = os.path.join(figure_dir, f"{figure_filename(spec.name)}.png")
+        previous = manifest.get(spec.name, {})
+        entry = {"spec": spec, "image": path, "hash": digest, "status": "skipped",
+                 "seconds": previous.get("seconds", 0.0)}
+        if force or previous.get("hash") != digest or not os.path.exists(path):
+            entry["status"] = "rendered"
+            pending.append(entry)
+        entries.append(entry)
+
+    n_jobs = os.cpu_count() if n_jobs is None else n_jobs
+    arguments = ([entry["spec"] for entry in pending], [entry["image"] for entry in pending], [dpi] * len(pending))
+    if n_jobs > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(pending))) as executor:
+            seconds = list(executor.map(render_figure, *arguments))
+    else:
+        seconds = list(map(render_figure, *arguments))
+
+    for entry, render_seconds in zip(pending, seconds):
+        entry["seconds"] = render_seconds
+        manifest[entry["spec"].name] = {"hash": entry["hash"], "image": os.path.relpath(entry["image"], output_dir),
+                                        "seconds": render_seconds}
+
+    with open(manifest_file, "w") as f:
+        json.dump(manifest, f, indent=2)
+    return entries
+
+
+def write_html_report(entries, filename, title="HackBio Biocoding Report"):
+    """
+    Writes one self-contained HTML file with every figure embedded as base64 PNG.
+
+    Parameters:
+        entries (list): Output of render_figures.
+        filename (str): HTML path.
+        title (str): Page title.
+
+    Returns:
+        filename (str): The written path.
+    """
+    parts = [f"<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n<title>{html.escape(title)}</title>",
+             "<style>body{font-family:sans-serif;max-width:1000px;margin:auto;padding:1em}"
+             "figure{margin:2em 0}img{max-width:100%}figcaption{color:#555}</style>\n</head>\n<body>",
+             f"<h1>{html.escape(title)}</h1>",
+             f"<p>Generated {time.strftime('%Y-%m-%d %H:%M:%S')} — {len(entries)} figures.</p>"]
+
+    section = None
+    for entry in entries:
+        spec = entry["spec"]
+        if spec.section != section:
+            section = spec.section
+            parts.append(f"<h2>{html.escape(section)}</h2>")
+        with open(entry["image"], "rb") as f:
+            image = base64.b64encode(f.read()).decode("ascii")
+        parts.append(f"<figure>\n<img alt=\"{html.escape(spec.name)}\" src=\"data:image/png;base64,{image}\">\n"
+                     f"<figcaption><b>{html.escape(spec.name)}.</b> {html.escape(spec.caption)}</figcaption>\n</figure>")
+
+    parts.append("</body>\n</html>\n")
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write("\n".join(parts))
+    return filename
+
+
+def write_pdf_report(entries, filename, title="HackBio Biocoding Report"):
+    """
+    Writes the rendered figures into a PDF, one figure per page.
+
+    Parameters:
+        entries (list): Output of render_figures.
+        filename (str): PDF path.
+        title (str): Document title (PDF metadata).
+
+    Returns:
+        filename (str): The written path.
+    """
+    import matplotlib.image as mpimg
+    from matplotlib.backends.backend_pdf import PdfPages
+    from matplotlib.figure import Figure
+
+    with PdfPages(filename, metadata={"Title": title}) as pdf:
+        for entry in entries:
+            spec = entry["spec"]
+            page = Figure(figsize=(8.27, 11.69))  # A4 portrait
+            ax = page.add_axes([0.05, 0.1, 0.9, 0.8])
+            ax.imshow(mpimg.imread(entry["image"]))
+            ax.axis("off")
+            page.suptitle(f"{spec.section}: {spec.name}", fontsize=12)
+            page.text(0.5, 0.05, spec.caption, ha="center", wrap=True, fontsize=9)
+            pdf.savefig(page)
+    return filename
+
+
+def build_report(specs, output_dir, n_jobs=None, dpi=150, force=False, pdf=False, title="HackBio Biocoding Report"):
+    """
+    Renders the figures and writes report.html (and report.pdf).
+
+    Parameters:
+        specs (list): FigureSpec objects, in report order.
+        output_dir (str): Report directory.
+        n_jobs (int or None): Worker processes for rendering.
+        dpi (int): Resolution.
+        force (bool): Render every figure even if unchanged.
+        pdf (bool): Also write report.pdf.
+        title (str): Report title.
+
+    Returns:
+        report (dict): Written file paths, per-figure entries and timings.
+    """
+    start = time.perf_counter()
+    entries = render_figures(specs, output_dir, n_jobs=n_jobs, dpi=dpi, force=force)
+    render_seconds = time.perf_counter() - start
+
+    paths = [write_html_report(entries, os.path.join(output_dir, "report.html"), title)]
+    if pdf:
+        paths.append(write_pdf_report(entries, os.path.join(output_dir, "report.pdf"), title))
+
+    rendered = [entry for entry in entries if entry["status"] == "rendered"]
+    print(f"\n📋 Report figures ({len(rendered)} rendered, {len(entries) - len(rendered)} unchanged):")
+    for entry in entries:
+        icon = "✅" if entry["status"] == "rendered" else "⚡"
+        print(f"  {icon} {entry['spec'].name:<56} {entry['status']:<9} {entry['seconds']:6.2f} s")
+    print(f"⏱️ Rendering wall-clock: {render_seconds:.2f} s "
+          f"(summed render time {sum(entry['seconds'] for entry in rendered):.2f} s)")
+    for path in paths:
+        print(f"💾 Report saved to: {path}")
+
+    return {"paths": paths, "entries": entries, "render_wall_seconds": render_seconds,
+            "total_wall_seconds": time.perf_counter() - start}
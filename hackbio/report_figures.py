@@ -0,0 +1,336 @@
+# ==============================================
+# Report Figures: Stage 1-3 Figure Specs & Builders
+# ==============================================
+#
+# The collectors compute each stage's results once and return FigureSpecs;
+# the builders are module-level functions builder(fig, **data) so worker
+# processes can unpickle and draw them. Each spec carries only the data its
+# figure shows, so a figure is re-rendered only when that data changes.
+
+import os
+import random
+
+import numpy as np
+import pandas as pd
+
+from .report import FigureSpec
+from .workflows import STAGE_2_MUTATIONS, STAGE_2_TRANSCRIPTOMICS, STAGE_3_CANCER
+
+STAGE_1 = "Stage 1: DNA Translation & Population Growth"
+STAGE_2_MUTATION_SECTION = "Stage 2: Amino Acid Mutation Analysis"
+STAGE_2_TRANSCRIPTOMICS_SECTION = "Stage 2: Compound X Transcriptomics"
+STAGE_3 = "Stage 3: Cancer Classification & Clustering"
+
+AMINO_ACID_NAMES = {
+    "A": "Alanine", "R": "Arginine", "N": "Asparagine", "D": "Aspartic Acid", "C": "Cysteine",
+    "E": "Glutamic Acid", "Q": "Glutamine", "G": "Glycine", "H": "Histidine", "I": "Isoleucine",
+    "L": "Leucine", "K": "Lysine", "M": "Methionine", "F": "Phenylalanine", "P": "Proline",
+    "S": "Serine", "T": "Threonine", "W": "Tryptophan", "Y": "Tyrosine", "V": "Valine",
+}
+
+# Columns of the deleterious mutations table figure
+TABLE_COLUMNS = ["Protein_sift", "Amino_Acid_sift", "sift_Score", "foldX_Score"]
+
+
+# ==============================================
+# Builders
+# ==============================================
+
+def growth_curves_figure(fig, curves):
+    ax = fig.subplots()
+    for time, population in curves:
+        ax.plot(time, population, alpha=0.5)
+    ax.set_xlabel("Time")
+    ax.set_ylabel("Population (OD)")
+    ax.set_title("Logistic Growth Curves")
+
+
+def histogram_figure(fig, values, xlabel, title, bins=20):
+    ax = fig.subplots()
+    ax.hist(values, bins=bins, edgecolor="black")
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel("Frequency")
+    ax.set_title(title)
+
+
+def table_figure(fig, columns, rows, title):
+    """Table image with column widths computed once from the text lengths."""
+    ax = fig.subplots()
+    ax.axis("off")
+    lengths = [max([len(str(column))] + [len(str(row[i])) for row in rows]) for i, column in enumerate(columns)]
+    widths = [length / sum(lengths) for length in lengths]
+    table = ax.table(cellText=rows, colLabels=columns, colWidths=widths, loc="center", cellLoc="center")
+    table.auto_set_font_size(False)
+    table.set_fontsize(8)
+    ax.set_title(title)
+
+
+def amino_acid_bar_figure(fig, residues, counts):
+    import seaborn as sns
+
+    ax = fig.subplots()
+    colors = sns.color_palette("viridis", len(residues))
+    bars = ax.bar(residues, counts, color=colors)
+    ax.set_xlabel("Amino Acid", fontsize=14)
+    ax.set_ylabel("Frequency", fontsize=14)
+    ax.set_title("Frequency of Amino Acids in Deleterious Mutations", fontsize=16)
+    ax.tick_params(axis="x", rotation=45)
+    ax.legend(bars, [f"{aa} - {AMINO_ACID_NAMES.get(aa, aa)}" for aa in residues], title="Amino Acid Key",
+              bbox_to_anchor=(1.05, 1), loc="upper left")
+
+
+def amino_acid_pie_figure(fig, residues, counts):
+    import seaborn as sns
+
+    ax = fig.subplots()
+    total = sum(counts)
+    wedges, _ = ax.pie(counts, labels=residues, colors=sns.color_palette("viridis", len(residues)))
+    ax.set_title("Proportion of Amino Acids in Deleterious Mutations", fontsize=16)
+    ax.legend(wedges, [f"{aa} - {AMINO_ACID_NAMES.get(aa, aa)} ({count / total * 100:.1f}%)"
+                       for aa, count in zip(residues, counts)],
+              title="Amino Acid Key", bbox_to_anchor=(1.05, 1), loc="upper left")
+
+
+def volcano_figure(fig, log2fc, neg_log10_pvalue, upregulated, downregulated, log2fc_threshold, pvalue_threshold):
+    from .plotting import volcano_plot
+
+    ax = fig.subplots()
+    volcano_plot(ax, log2fc, neg_log10_pvalue, upregulated, downregulated, log2fc_threshold, pvalue_threshold)
+    ax.set_title("Volcano Plot")
+
+
+def top_genes_figure(fig, genes, log2fc):
+    ax = fig.subplots()
+    ax.barh(genes, log2fc, color=["red" if value > 0 else "blue" for value in log2fc])
+    ax.axvline(0, color="black", linestyle="--", linewidth=1)
+    ax.set_xlabel("Log2 Fold Change", fontsize=14)
+    ax.set_ylabel("Gene", fontsize=14)
+    ax.set_title("Top 20 Upregulated and Downregulated Genes", fontsize=16)
+    ax.grid(axis="x", linestyle="--", alpha=0.5)
+
+
+def scatter_figure(fig, x, y, labels, cmap, title, colorbar_label):
+    from .plotting import class_density_scatter
+
+    ax = fig.subplots()
+    points = class_density_scatter(ax, x, y, labels, cmap=cmap, alpha=0.7)
+    ax.set_xlabel("Principal Component 1")
+    ax.set_ylabel("Principal Component 2")
+    ax.set_title(title)
+    fig.colorbar(points, ax=ax, label=colorbar_label)
+
+
+def elbow_figure(fig, k_values, wcss, title, chosen_k=None):
+    ax = fig.subplots()
+    ax.plot(k_values, wcss, marker="o", linestyle="--")
+    if chosen_k is not None:
+        ax.axvline(chosen_k, color="grey", linestyle=":", label=f"Chosen K = {chosen_k}")
+        ax.legend()
+    ax.set_xlabel("Number of Clusters (K)")
+    ax.set_ylabel("WCSS")
+    ax.set_title(title)
+
+
+def importance_figure(fig, groups, mean, ci_low, ci_high):
+    import seaborn as sns
+
+    ax = fig.subplots()
+    mean, ci_low, ci_high = np.asarray(mean), np.asarray(ci_low), np.asarray(ci_high)
+    ax.barh(groups, mean, xerr=[mean - ci_low, ci_high - mean], capsize=3,
+            color=sns.color_palette("coolwarm", len(groups)))
+    ax.invert_yaxis()
+    ax.set_xlabel("Permutation Importance (drop in accuracy, 95% CI)")
+    ax.set_ylabel("Feature Group")
+    ax.set_title("Permutation Feature Importance of the Diagnosis Model")
+
+
+def dendrogram_figure(fig, linkage_matrix, p=30):
+    from .hierarchical import plot_truncated_dendrogram
+
+    ax = fig.subplots()
+    plot_truncated_dendrogram(linkage_matrix, p=p, truncate_mode="lastp", ax=ax)
+    ax.set_title("Hierarchical Clustering Dendrogram (Truncated)")
+    ax.set_xlabel("Samples (cluster size in brackets)")
+    ax.set_ylabel("Distance")
+
+
+def cluster_distribution_figure(fig, labels, counts):
+    ax = fig.subplots()
+    ax.bar([str(label) for label in labels], counts, color="steelblue", edgecolor="black")
+    ax.set_title("Distribution of K-Means Clusters")
+    ax.set_xlabel("Cluster Label")
+    ax.set_ylabel("Count")
+
+
+# ==============================================
+# Collectors
+# ==============================================
+
+def stage1_specs(num_curves=100, seed=42):
+    """Growth curves and times to 80% of K (seeded, so reruns hash the same)."""
+    from .growth import generate_growth_curves, time_to_80_percent
+
+    random.seed(seed)
+    growth_df = generate_growth_curves(num_curves, K=1000, P0=10, r=0.2, total_time=100,
+                                       lag_mean=10, lag_std=2, exp_mean=30, exp_std=5)
+    curves = [(curve["time"].to_numpy(), curve["population"].to_numpy())
+              for _, curve in growth_df.groupby("curve_id")]
+    t80 = [time_to_80_percent(list(time), list(population), 1000) for time, population in curves]
+
+    return [
+        FigureSpec("Logistic Growth Curves", growth_curves_figure, {"curves": curves}, STAGE_1,
+                   f"{num_curves} simulated logistic growth curves with random lag and exponential phases.",
+                   figsize=(10, 6)),
+        FigureSpec("Time to 80 Percent Histogram", histogram_figure,
+                   {"values": [t for t in t80 if t is not None], "xlabel": "Time to reach 80% of carrying capacity",
+                    "title": "Histogram of Times to Reach 80% of Carrying Capacity"}, STAGE_1,
+                   "Time each curve needs to reach 80% of the carrying capacity K.", figsize=(10, 6)),
+    ]
+
+
+def mutation_specs(sift_csv, foldx_csv, sift_threshold=0.05, foldx_threshold=2):
+    """Deleterious mutation table and wild-type residue frequencies."""
+    from .dtypes import compact_frame
+    from .mutation_frequencies import mutation_frequencies
+    from .mutations import filter_deleterious_mutations, load_mutation_dataset, merge_mutation_datasets
+
+    sift_df = compact_frame(load_mutation_dataset(sift_csv))
+    foldx_df = compact_frame(load_mutation_dataset(foldx_csv))
+    deleterious = filter_deleterious_mutations(merge_mutation_datasets(sift_df, foldx_df),
+                                               sift_threshold, foldx_threshold)
+    amino_freq = mutation_frequencies(deleterious, "Amino_Acid_sift", protein_column=None).wild_type_frequencies()
+    frequency_data = {"residues": list(amino_freq.index), "counts": [int(count) for count in amino_freq.values]}
+
+    rows = deleterious[TABLE_COLUMNS].head(10).astype(str).values.tolist()
+    caption = f"SIFT < {sift_threshold} and FoldX > {foldx_threshold}: {len(deleterious)} deleterious mutations."
+    return [
+        FigureSpec("Deleterious Mutations Table", table_figure,
+                   {"columns": TABLE_COLUMNS, "rows": rows, "title": "First 10 Deleterious Mutations"},
+                   STAGE_2_MUTATION_SECTION, caption, figsize=(8, 4)),
+        FigureSpec("Amino Acid Frequency", amino_acid_bar_figure, frequency_data, STAGE_2_MUTATION_SECTION,
+                   "Wild-type residues of the deleterious mutations, most frequent first.", figsize=(12, 6)),
+        FigureSpec("Amino Acid Proportion", amino_acid_pie_figure, frequency_data, STAGE_2_MUTATION_SECTION,
+                   "Share of each wild-type residue among the deleterious mutations.", figsize=(10, 10)),
+    ]
+
+
+def transcriptomics_specs(data_csv, log2fc_threshold=1, pvalue_threshold=0.01):
+    """Volcano plot and the strongest up- and downregulated genes."""
+    from .transcriptomics import load_transcriptomics_dataset, significant_gene_masks
+
+    df = load_transcriptomics_dataset(data_csv)
+    upregulated, downregulated = significant_gene_masks(df, log2fc_threshold, pvalue_threshold)
+    top_genes = pd.concat([df[upregulated].nlargest(20, "log2FoldChange"),
+                           df[downregulated].nsmallest(20, "log2FoldChange")]).sort_values("log2FoldChange")
+
+    return [
+        FigureSpec("Volcano Plot", volcano_figure, {
+            "log2fc": df["log2FoldChange"].to_numpy(), "neg_log10_pvalue": df["neg_log10_pvalue"].to_numpy(),
+            "upregulated": upregulated.to_numpy(), "downregulated": downregulated.to_numpy(),
+            "log2fc_threshold": log2fc_threshold, "pvalue_threshold": pvalue_threshold,
+        }, STAGE_2_TRANSCRIPTOMICS_SECTION,
+            f"{int(upregulated.sum())} upregulated and {int(downregulated.sum())} downregulated genes "
+            f"(|log2FC| > {log2fc_threshold}, p < {pvalue_threshold}).", figsize=(10, 6)),
+        FigureSpec("Top Upregulated and Downregulated Genes", top_genes_figure,
+                   {"genes": top_genes["Gene"].astype(str).tolist(), "log2fc": top_genes["log2FoldChange"].tolist()},
+                   STAGE_2_TRANSCRIPTOMICS_SECTION, "Up to 20 significant genes in each direction.", figsize=(12, 8)),
+    ]
+
+
+def cancer_specs(cleaned_csv, cache_dir, n_jobs=None):
+    """PCA, K-Means, subclasses, feature importance and hierarchical clustering."""
+    from sklearn.model_selection import train_test_split
+
+    from .cancer import load_and_debug_dataset
+    from .dimensionality_reduction import fit_projection
+    from .hierarchical import hierarchical_clustering
+    from .importance import feature_groups, permutation_importance
+    from .model_artifacts import build_diagnosis_pipeline
+    from .preprocessing_cache import preprocess_cached
+    from .subclasses import discover_subclasses
+
+    preprocessed = preprocess_cached(cleaned_csv, load_and_debug_dataset, cache_dir=cache_dir)
+    X_raw, X_scaled, y = preprocessed["X_raw"], np.asarray(preprocessed["X_scaled"]), np.asarray(preprocessed["y"])
+    X_pca = fit_projection(X_scaled, n_components=2).transform(X_scaled)
+
+    overall = discover_subclasses(X_scaled, k_range=range(1, 11), n_clusters=2, n_jobs=n_jobs)["groups"]["all"]
+    subclasses = discover_subclasses(X_scaled, labels=y, k_range=range(1, 11), n_jobs=n_jobs)["groups"]
+
+    X_train, X_test, y_train, y_test = train_test_split(X_raw, y, test_size=0.2, random_state=42)
+    pipeline = build_diagnosis_pipeline().fit(X_train, y_train)
+    importances = permutation_importance(pipeline, X_test, y_test, groups=feature_groups(preprocessed["feature_names"]),
+                                         n_repeats=20, n_jobs=1)["importances"]
+    linkage_matrix = hierarchical_clustering(X_scaled, n_clusters=2, method="ward")["linkage"]
+    cluster_labels, cluster_counts = np.unique(overall["labels"], return_counts=True)
+
+    specs = [
+        FigureSpec("PCA Visualization of Cancer Data", scatter_figure, {
+            "x": X_pca[:, 0], "y": X_pca[:, 1], "labels": y, "cmap": "coolwarm",
+            "title": "PCA Visualization of Cancer Data", "colorbar_label": "Diagnosis (0=Benign, 1=Malignant)",
+        }, STAGE_3, "First two principal components of the scaled features, colored by diagnosis."),
+        FigureSpec("Elbow Method for Optimal K", elbow_figure, {
+            "k_values": overall["wcss"].index.tolist(), "wcss": overall["wcss"].tolist(),
+            "title": "Elbow Method for Optimal K",
+        }, STAGE_3, "Within-cluster sum of squares of K-Means on all samples."),
+        FigureSpec("K-Means Clustering on PCA-Reduced Data", scatter_figure, {
+            "x": X_pca[:, 0], "y": X_pca[:, 1], "labels": overall["labels"], "cmap": "viridis",
+            "title": "K-Means Clustering on PCA-Reduced Data", "colorbar_label": "Cluster",
+        }, STAGE_3, f"K-Means with K = 2 (silhouette {overall['silhouette']:.3f})."),
+    ]
+    for group, name, cmap in [(0, "Benign", "coolwarm"), (1, "Malignant", "viridis")]:
+        subclass = subclasses[group]
+        specs += [
+            FigureSpec(f"Elbow Method for {name} Subclasses", elbow_figure, {
+                "k_values": subclass["wcss"].index.tolist(), "wcss": subclass["wcss"].tolist(),
+                "title": f"Elbow Method for {name} Subclasses", "chosen_k": subclass["k"],
+            }, STAGE_3, f"K = {subclass['k']} chosen at the elbow for the {name.lower()} samples."),
+            FigureSpec(f"{name} Subclasses", scatter_figure, {
+                "x": X_pca[subclass["rows"], 0], "y": X_pca[subclass["rows"], 1], "labels": subclass["labels"],
+                "cmap": cmap, "title": f"{name} Subclasses", "colorbar_label": "Subclass",
+            }, STAGE_3, f"{len(subclass['rows'])} {name.lower()} samples, silhouette {subclass['silhouette']:.3f}."),
+        ]
+    specs += [
+        FigureSpec("Permutation Feature Importance of the Diagnosis Model", importance_figure, {
+            "groups": importances["group"].tolist(), "mean": importances["importance_mean"].to_numpy(),
+            "ci_low": importances["ci_low"].to_numpy(), "ci_high": importances["ci_high"].to_numpy(),
+        }, STAGE_3, "Drop in held-out accuracy when a feature group is shuffled (20 repeats).", figsize=(10, 6)),
+        FigureSpec("Hierarchical Clustering Dendrogram", dendrogram_figure, {"linkage_matrix": linkage_matrix},
+                   STAGE_3, "Ward linkage, last 30 merges.", figsize=(10, 5)),
+        FigureSpec("Distribution of K-Means Clusters", cluster_distribution_figure,
+                   {"labels": cluster_labels.tolist(), "counts": cluster_counts.tolist()}, STAGE_3,
+                   "Samples per K-Means cluster."),
+    ]
+    return specs
+
+
+SECTIONS = ("stage1", "mutations", "transcriptomics", "cancer")
+
+
+def collect_specs(repo_root, output_dir, sections=SECTIONS, n_jobs=None):
+    """
+    Builds the figure specs of the selected report sections from the bundled datasets.
+
+    Parameters:
+        repo_root (str): Root of the repository.
+        output_dir (str): Report directory (holds the preprocessing cache).
+        sections (iterable): Any of "stage1", "mutations", "transcriptomics", "cancer".
+        n_jobs (int or None): Worker processes for the clustering fits.
+
+    Returns:
+        specs (list): FigureSpec objects in report order.
+    """
+    mutations_dir = os.path.join(repo_root, STAGE_2_MUTATIONS)
+    cancer_dir = os.path.join(repo_root, STAGE_3_CANCER)
+
+    specs = []
+    if "stage1" in sections:
+        specs += stage1_specs()
+    if "mutations" in sections:
+        specs += mutation_specs(os.path.join(mutations_dir, "sift_dataset.csv"),
+                                os.path.join(mutations_dir, "foldx_dataset.csv"))
+    if "transcriptomics" in sections:
+        specs += transcriptomics_specs(os.path.join(repo_root, STAGE_2_TRANSCRIPTOMICS, "transcriptomics_data.csv"))
+    if "cancer" in sections:
+        specs += cancer_specs(os.path.join(cancer_dir, "cancer_transcriptomics_cleaned.csv"),
+                              cache_dir=os.path.join(output_dir, ".preprocessing_cache"), n_jobs=n_jobs)
+    return specs
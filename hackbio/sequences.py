@@ -0,0 +1,186 @@
+# ==============================================
+# Sequence Comparison
+# ==============================================
+
+# Function to calculate the Hamming distance between two strings
+
+def hamming_distance(str1, str2):
+    """
+    Calculates the Hamming distance between two strings.
+
+    The shorter string is padded with spaces, so every extra character counts
+    as one mismatch.
+
+    Parameters:
+        str1 (str): First string.
+        str2 (str): Second string.
+
+    Returns:
+        distance (int): Number of positions at which the strings differ.
+    """
+    # Pad the shorter string with spaces to make both strings of equal length
+    max_len = max(len(str1), len(str2))
+    str1 = str1.ljust(max_len)
+    str2 = str2.ljust(max_len)
+
+    # Calculate the Hamming distance
+    distance = sum(1 for x, y in zip(str1, str2) if x != y)
+    return distance
+
+
+# ==============================================
+# Edit Distance (Insertions, Deletions & Substitutions)
+# ==============================================
+
+def _pattern_bitmasks(pattern):
+    """Bitmask of the positions of every character in the pattern (Myers' Peq table)."""
+    masks = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _myers_distance(masks, pattern_length, text, max_distance=None):
+    """
+    Bit-parallel Levenshtein distance (Myers / Hyyrö) between a pattern and a text.
+
+    One Python integer holds a whole column of the dynamic-programming matrix, so
+    each text character costs a handful of integer operations.
+    """
+    if pattern_length == 0:
+        distance = len(text)
+        return distance if max_distance is None or distance <= max_distance else None
+
+    all_rows = (1 << pattern_length) - 1
+    last_row = 1 << (pattern_length - 1)
+    positive = all_rows  # Vertical +1 deltas
+    negative = 0         # Vertical -1 deltas
+    distance = pattern_length
+    remaining = len(text)
+
+    for char in text:
+        equal = masks.get(char, 0)
+        x_vertical = equal | negative
+        x_horizontal = (((equal & positive) + positive) ^ positive) | equal
+        h_positive = negative | ~(x_horizontal | positive)
+        h_negative = positive & x_horizontal
+
+        if h_positive & last_row:
+            distance += 1
+        elif h_negative & last_row:
+            distance -= 1
+
+        # Early exit: the distance can drop by at most one per remaining text character
+        remaining -= 1
+        if max_distance is not None and distance - remaining > max_distance:
+            return None
+
+        h_positive = ((h_positive << 1) | 1) & all_rows
+        h_negative = (h_negative << 1) & all_rows
+        positive = (h_negative | ~(x_vertical | h_positive)) & all_rows
+        negative = h_positive & x_vertical
+
+    return distance if max_distance is None or distance <= max_distance else None
+
+
+def levenshtein_distance(str1, str2, max_distance=None):
+    """
+    Calculates the edit distance (insertions, deletions and substitutions) between two strings.
+
+    Unlike hamming_distance, a single insertion or deletion costs 1 instead of
+    shifting every following character.
+
+    Parameters:
+        str1 (str): First string.
+        str2 (str): Second string.
+        max_distance (int or None): Stop as soon as the distance is known to exceed this.
+
+    Returns:
+        distance (int or None): The edit distance, or None if it exceeds max_distance.
+    """
+    if max_distance is not None and abs(len(str1) - len(str2)) > max_distance:
+        return None
+
+    # Use the shorter string as the bit-parallel pattern
+    pattern, text = (str1, str2) if len(str1) <= len(str2) else (str2, str1)
+    return _myers_distance(_pattern_bitmasks(pattern), len(pattern), text, max_distance)
+
+
+class KmerIndex:
+    """
+    k-mer index for finding every sequence within an edit distance of a query.
+
+    Candidates must share enough k-mers with the query (q-gram lemma: two strings
+    within distance d share at least max(len) - k + 1 - k * d k-mers) and have a
+    length within d of the query; only they are verified with the bit-parallel
+    edit distance. Targets too short for the lemma to filter are always verified.
+
+    Parameters:
+        sequences (iterable): Target sequences (reads, barcodes, proteins, ...).
+        k (int): k-mer length; smaller k filters less but works for larger distances.
+    """
+
+    def __init__(self, sequences, k=4):
+        self.k = k
+        self.sequences = list(sequences)
+        self.postings = {}   # k-mer -> list of (sequence index, occurrences)
+        self.by_length = {}  # length -> sequence indices
+
+        for index, sequence in enumerate(self.sequences):
+            self.by_length.setdefault(len(sequence), []).append(index)
+            for kmer, occurrences in self._kmer_counts(sequence).items():
+                self.postings.setdefault(kmer, []).append((index, occurrences))
+
+    def _kmer_counts(self, sequence):
+        counts = {}
+        for i in range(len(sequence) - self.k + 1):
+            kmer = sequence[i:i + self.k]
+            counts[kmer] = counts.get(kmer, 0) + 1
+        return counts
+
+    def __len__(self):
+        return len(self.sequences)
+
+    def candidates(self, query, max_distance):
+        """
+        Indices of the sequences that pass the length and k-mer filters.
+
+        Parameters:
+            query (str): Query sequence.
+            max_distance (int): Maximum edit distance.
+
+        Returns:
+            candidates (list): Sequence indices to verify.
+        """
+        shared = {}
+        for kmer, query_occurrences in self._kmer_counts(query).items():
+            for index, occurrences in self.postings.get(kmer, ()):
+                shared[index] = shared.get(index, 0) + min(query_occurrences, occurrences)
+
+        lengths = range(max(0, len(query) - max_distance), len(query) + max_distance + 1)
+        candidates = []
+        for length in lengths:
+            required = max(len(query), length) - self.k + 1 - self.k * max_distance
+            for index in self.by_length.get(length, ()):
+                if required <= 0 or shared.get(index, 0) >= required:
+                    candidates.append(index)
+        return candidates
+
+    def search(self, query, max_distance):
+        """
+        Finds every sequence within max_distance edits of the query.
+
+        Parameters:
+            query (str): Query sequence.
+            max_distance (int): Maximum edit distance.
+
+        Returns:
+            matches (list): (sequence index, distance) tuples, closest first.
+        """
+        masks = _pattern_bitmasks(query)
+        matches = []
+        for index in self.candidates(query, max_distance):
+            distance = _myers_distance(masks, len(query), self.sequences[index], max_distance)
+            if distance is not None:
+                matches.append((index, distance))
+        return sorted(matches, key=lambda match: (match[1], match[0]))
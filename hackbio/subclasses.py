@@ -0,0 +1,171 @@
+# ==============================================
+# Subclass Discovery: Per-Group K Selection & K-Means
+# ==============================================
+#
+# Every (group, k) K-Means fit is an independent task, so all groups' K
+# selection runs concurrently in one worker pool. The fit for the selected k
+# is kept from K selection instead of being refitted.
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.cluster import KMeans
+from sklearn.metrics import davies_bouldin_score, silhouette_score
+
+from .profiling import instrument
+
+# Silhouette scores of larger groups are estimated on a random sample of this size
+SILHOUETTE_SAMPLE = 10000
+
+
+def _fit_k(group, k, X, random_state, n_init):
+    """Fits K-Means for one group and k and scores the clustering."""
+    start = time.perf_counter()
+    model = KMeans(n_clusters=k, random_state=random_state, n_init=n_init)
+    labels = model.fit_predict(X)
+
+    silhouette = davies_bouldin = np.nan
+    if 1 < k < len(X):
+        sample_size = SILHOUETTE_SAMPLE if len(X) > SILHOUETTE_SAMPLE else None
+        silhouette = silhouette_score(X, labels, sample_size=sample_size, random_state=random_state)
+        davies_bouldin = davies_bouldin_score(X, labels)
+
+    return {
+        "group": group,
+        "k": k,
+        "model": model,
+        "labels": labels,
+        "wcss": model.inertia_,
+        "silhouette": silhouette,
+        "davies_bouldin": davies_bouldin,
+        "fit_seconds": time.perf_counter() - start,
+    }
+
+
+def elbow_k(k_values, wcss):
+    """
+    Picks the elbow of a WCSS curve: the k farthest from the straight line
+    between the first and last points (both axes scaled to 0-1).
+
+    Parameters:
+        k_values (array-like): Tried k values, ascending.
+        wcss (array-like): Within-cluster sum of squares for each k.
+
+    Returns:
+        k (int): The elbow.
+    """
+    k_values = np.asarray(k_values, dtype=float)
+    wcss = np.asarray(wcss, dtype=float)
+    if len(k_values) < 3 or wcss[0] == wcss[-1]:
+        return int(k_values[0])
+
+    x = (k_values - k_values[0]) / (k_values[-1] - k_values[0])
+    y = (wcss - wcss[-1]) / (wcss[0] - wcss[-1])
+    # Distance below the chord from (0, 1) to (1, 0)
+    return int(k_values[np.argmax((1 - x) - y)])
+
+
+def _select_k(fits, method):
+    k_values = [fit["k"] for fit in fits]
+    if method == "elbow":
+        return elbow_k(k_values, [fit["wcss"] for fit in fits])
+    if method == "silhouette":
+        scores = np.array([fit["silhouette"] for fit in fits])
+        return k_values[int(np.nanargmax(scores))] if np.isfinite(scores).any() else k_values[0]
+    raise ValueError(f"Unknown K selection method: {method}")
+
+
+@instrument(count=lambda result, X, *args, **kwargs: {"rows": len(X), "groups": len(result["groups"]),
+                                                       "fits": result["timing"]["fits"]})
+def discover_subclasses(X, labels=None, k_range=range(1, 11), n_clusters=None, method="elbow",
+                        min_group_size=3, n_jobs=None, random_state=42, n_init=10):
+    """
+    Finds K-Means subclasses inside every group of a label column (e.g. diagnosis).
+
+    Parameters:
+        X (array-like): Preprocessed (imputed & scaled) feature matrix.
+        labels (array-like or None): Group of each row; None treats all rows as one group "all".
+        k_range (iterable): k values tried for K selection (the elbow curve).
+        n_clusters (int or dict or None): Fixed k for every group, or group -> k; groups
+            without a fixed k are selected with `method`. A fixed k outside k_range is fitted as well.
+        method (str): "elbow" (largest bend in WCSS) or "silhouette" (highest silhouette score).
+        min_group_size (int): Groups with fewer rows are skipped (their rows get subclass -1).
+        n_jobs (int or None): Number of worker processes (all cores if None).
+        random_state (int): K-Means and silhouette sampling seed.
+        n_init (int): K-Means initialisations per fit.
+
+    Returns:
+        result (dict): "groups" (group -> k, labels, centroids, silhouette, davies_bouldin,
+            wcss curve, rows and the fitted model), "summary" (one row per group),
+            "subclasses" (subclass of every row, -1 for skipped groups) and "timing".
+    """
+    start_total = time.perf_counter()
+    X = np.asarray(X)
+    k_range = sorted(set(k_range))
+
+    # Row indices of each group, largest groups first so long fits start early
+    if labels is None:
+        rows = {"all": np.arange(len(X))}
+    else:
+        labels = np.asarray(labels)
+        rows = {group: np.flatnonzero(labels == group) for group in pd.unique(labels)}
+    rows = {name: index for name, index in sorted(rows.items(), key=lambda item: -len(item[1]))
+            if len(index) >= min_group_size}
+
+    def fixed_k(name):
+        return n_clusters.get(name) if isinstance(n_clusters, dict) else n_clusters
+
+    tasks = []
+    for name, index in rows.items():
+        group_k = set(k for k in k_range if k < len(index))
+        if fixed_k(name) is not None:
+            group_k.add(fixed_k(name))
+        tasks.extend((name, k) for k in sorted(group_k))
+
+    start_fits = time.perf_counter()
+    fits = Parallel(n_jobs=n_jobs or os.cpu_count())(
+        delayed(_fit_k)(name, k, X[rows[name]], random_state, n_init) for name, k in tasks
+    )
+    fit_seconds = time.perf_counter() - start_fits
+
+    subclasses = np.full(len(X), -1, dtype=int)
+    results = {}
+    for name, index in rows.items():
+        group_fits = [fit for fit in fits if fit["group"] == name]
+        curve_fits = [fit for fit in group_fits if fit["k"] in k_range]
+        k = fixed_k(name) if fixed_k(name) is not None else _select_k(curve_fits, method)
+        chosen = next(fit for fit in group_fits if fit["k"] == k)
+
+        subclasses[index] = chosen["labels"]
+        results[name] = {
+            "k": k,
+            "rows": index,
+            "labels": chosen["labels"],
+            "centroids": chosen["model"].cluster_centers_,
+            "silhouette": chosen["silhouette"],
+            "davies_bouldin": chosen["davies_bouldin"],
+            "wcss": pd.Series([fit["wcss"] for fit in curve_fits], index=pd.Index([fit["k"] for fit in curve_fits],
+                                                                                   name="k"), name="wcss"),
+            "model": chosen["model"],
+        }
+
+    summary = pd.DataFrame([
+        {"group": name, "samples": len(group["rows"]), "k": group["k"], "silhouette": group["silhouette"],
+         "davies_bouldin": group["davies_bouldin"], "wcss": group["model"].inertia_}
+        for name, group in results.items()
+    ])
+
+    return {
+        "groups": results,
+        "summary": summary,
+        "subclasses": subclasses,
+        "timing": {
+            "fits": len(fits),
+            "fit_wall_seconds": fit_seconds,
+            "fit_seconds_total": float(sum(fit["fit_seconds"] for fit in fits)),
+            "total_wall_seconds": time.perf_counter() - start_total,
+        },
+    }
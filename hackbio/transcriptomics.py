@@ -0,0 +1,81 @@
+# ==============================================
+# Compound X Transcriptomics (RNA-seq) Dataset
+# ==============================================
+
+import io
+
+import numpy as np
+
+import pandas as pd
+
+from .dtypes import threshold_for
+from .profiling import file_size, instrument
+
+DATASET_URL = "https://gist.githubusercontent.com/stephenturner/806e31fce55a8b7175af/raw/1a507c4c3f9f1baaa3a69187223ff3d3050628d4/results.txt"
+
+
+@instrument(count=lambda result, url, save_path: {"bytes": file_size(save_path)})
+def download_and_process_dataset(url, save_path):
+    """
+    Downloads the dataset from the given URL, processes it into a structured CSV format,
+    and saves it to the specified path.
+
+    Parameters:
+        url (str): The dataset URL.
+        save_path (str): Path to save the processed CSV file.
+    """
+    import requests  # Imported lazily; only needed when downloading
+
+    try:
+        # Download the dataset
+        response = requests.get(url)
+        response.raise_for_status()  # Raise an error if download fails
+
+        # Convert content into a DataFrame
+        data = pd.read_csv(io.StringIO(response.text), sep=r"\s+")
+
+        # Save as CSV
+        data.to_csv(save_path, index=False)
+
+        print(f"Dataset successfully saved to: {save_path}")
+
+    except requests.exceptions.RequestException as e:
+        print(f"Error downloading dataset: {e}")
+    except Exception as e:
+        print(f"Error processing dataset: {e}")
+
+
+def load_transcriptomics_dataset(filename):
+    """
+    Loads the differential expression results and adds -log10(p-value).
+
+    Parameters:
+        filename (str): Path of the CSV file (Gene, log2FoldChange, pvalue, padj).
+
+    Returns:
+        df (pd.DataFrame): The dataset with a 'neg_log10_pvalue' column.
+    """
+    df = pd.read_csv(filename)
+    df.columns = df.columns.str.strip()
+    df["neg_log10_pvalue"] = -np.log10(df["pvalue"])
+    return df
+
+
+def significant_gene_masks(df, log2fc_threshold=1, pvalue_threshold=0.01):
+    """
+    Flags significantly up- and downregulated genes.
+
+    Parameters:
+        df (pd.DataFrame): Differential expression results.
+        log2fc_threshold (float): Minimum absolute log2 fold change.
+        pvalue_threshold (float): Maximum p-value.
+
+    Returns:
+        upregulated (pd.Series): Boolean mask of upregulated genes.
+        downregulated (pd.Series): Boolean mask of downregulated genes.
+    """
+    log2fc = df["log2FoldChange"]
+    significant = df["pvalue"] < threshold_for(df["pvalue"], pvalue_threshold)
+    upregulated = (log2fc > threshold_for(log2fc, log2fc_threshold)) & significant
+    downregulated = (log2fc < threshold_for(log2fc, -log2fc_threshold)) & significant
+    return upregulated, downregulated
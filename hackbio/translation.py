@@ -0,0 +1,52 @@
+# ==============================================
+# DNA to Protein Translation
+# ==============================================
+
+from .profiling import instrument
+
+# Standard genetic code (codon to amino acid mapping)
+
+CODON_TABLE = {
+    'ATA': 'I', 'ATC': 'I', 'ATT': 'I', 'ATG': 'M',
+    'ACA': 'T', 'ACC': 'T', 'ACG': 'T', 'ACT': 'T',
+    'AAC': 'N', 'AAT': 'N', 'AAA': 'K', 'AAG': 'K',
+    'AGC': 'S', 'AGT': 'S', 'AGA': 'R', 'AGG': 'R',
+    'CTA': 'L', 'CTC': 'L', 'CTG': 'L', 'CTT': 'L',
+    'CCA': 'P', 'CCC': 'P', 'CCG': 'P', 'CCT': 'P',
+    'CAC': 'H', 'CAT': 'H', 'CAA': 'Q', 'CAG': 'Q',
+    'CGA': 'R', 'CGC': 'R', 'CGG': 'R', 'CGT': 'R',
+    'GTA': 'V', 'GTC': 'V', 'GTG': 'V', 'GTT': 'V',
+    'GCA': 'A', 'GCC': 'A', 'GCG': 'A', 'GCT': 'A',
+    'GAC': 'D', 'GAT': 'D', 'GAA': 'E', 'GAG': 'E',
+    'GGA': 'G', 'GGC': 'G', 'GGG': 'G', 'GGT': 'G',
+    'TCA': 'S', 'TCC': 'S', 'TCG': 'S', 'TCT': 'S',
+    'TTC': 'F', 'TTT': 'F', 'TTA': 'L', 'TTG': 'L',
+    'TAC': 'Y', 'TAT': 'Y', 'TAA': '_', 'TAG': '_',
+    'TGC': 'C', 'TGT': 'C', 'TGA': '_', 'TGG': 'W'
+}
+
+# Function to translate DNA sequence to protein sequence
+
+@instrument(count=lambda protein, dna_sequence: {"bases": len(dna_sequence), "residues": len(protein)})
+def translate_dna_to_protein(dna_sequence):
+    """
+    Translates a DNA sequence into a protein sequence, stopping at the first stop codon.
+
+    Parameters:
+        dna_sequence (str): DNA sequence (case-insensitive).
+
+    Returns:
+        protein_sequence (str): One-letter amino acid sequence ('?' for unknown codons).
+    """
+    # Step 1: Convert DNA to uppercase
+    dna_sequence = dna_sequence.upper()
+
+    # Step 2: Translate complete codons to amino acids (a trailing partial codon is ignored)
+    protein_sequence = []
+    for i in range(0, len(dna_sequence) - 2, 3):
+        amino_acid = CODON_TABLE.get(dna_sequence[i:i + 3], '?')  # Use '?' for unknown codons
+        if amino_acid == '_':  # Stop codon
+            break
+        protein_sequence.append(amino_acid)
+
+    return ''.join(protein_sequence)
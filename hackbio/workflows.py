@@ -0,0 +1,273 @@
+# ==============================================
+# Workflows: The Stage Steps Declared as Pipeline Nodes
+# ==============================================
+
+import os
+import shutil
+
+from .pipeline import Node
+
+STAGE_2_MUTATIONS = os.path.join("Stage 2 Multi BioProjects", "Amino Acid Mutation Analysis")
+STAGE_2_TRANSCRIPTOMICS = os.path.join("Stage 2 Multi BioProjects", "Compond X Transcriptomics")
+STAGE_3_CANCER = "Stage 3 Cancer Classifying & Clusturing"
+
+
+def _copy_bundled(bundled_csv, output_csv):
+    """Copies the dataset bundled with the repository instead of downloading it; False if there is none."""
+    if not bundled_csv or not os.path.exists(bundled_csv):
+        return False
+    shutil.copyfile(bundled_csv, output_csv)
+    print(f"📂 Using bundled dataset: {bundled_csv}")
+    return True
+
+
+# ==============================================
+# Amino Acid Mutation Analysis (SIFT & FoldX)
+# ==============================================
+
+def download_mutation_csv(output_csv, url, bundled_csv=None):
+    """Downloads a SIFT/FoldX TSV and converts it to the CSV layout used by the analysis."""
+    import pandas as pd
+
+    from .mutations import download_tsv
+
+    if _copy_bundled(bundled_csv, output_csv):
+        return
+
+    tsv_filename = os.path.splitext(output_csv)[0] + ".tsv"
+    download_tsv(url, tsv_filename)
+    if os.path.exists(tsv_filename):
+        pd.read_csv(tsv_filename, sep="\t").to_csv(output_csv, index=False)
+
+
+def merge_mutations(sift_csv, foldx_csv, merged_csv):
+    """Loads and merges the SIFT and FoldX datasets."""
+    from .mutations import load_mutation_dataset, merge_mutation_datasets
+
+    merged_df = merge_mutation_datasets(load_mutation_dataset(sift_csv), load_mutation_dataset(foldx_csv))
+    merged_df.to_csv(merged_csv, index=False)
+
+
+def filter_mutations(merged_csv, deleterious_csv, sift_threshold=0.05, foldx_threshold=2):
+    """Keeps mutations that are deleterious in both function and structure."""
+    import pandas as pd
+
+    from .mutations import filter_deleterious_mutations
+
+    deleterious_mutations = filter_deleterious_mutations(pd.read_csv(merged_csv), sift_threshold, foldx_threshold)
+    deleterious_mutations.to_csv(deleterious_csv, index=False)
+
+
+def plot_amino_acid_frequency(deleterious_csv, figure_png):
+    """Bar plot of the wild-type amino acids in deleterious mutations."""
+    import pandas as pd
+    from matplotlib.figure import Figure
+
+    from .mutation_frequencies import mutation_frequencies
+
+    deleterious_mutations = pd.read_csv(deleterious_csv)
+    amino_freq = mutation_frequencies(deleterious_mutations, "Amino_Acid_sift", protein_column=None).wild_type_frequencies()
+
+    # The object-oriented API (no pyplot) is safe to use from pipeline worker threads
+    fig = Figure(figsize=(12, 6))
+    ax = fig.subplots()
+    ax.bar(amino_freq.index, amino_freq.values, color="#3b528b")
+    ax.set_xlabel("Amino Acid", fontsize=14)
+    ax.set_ylabel("Frequency", fontsize=14)
+    ax.set_title("Frequency of Amino Acids in Deleterious Mutations", fontsize=16)
+    fig.savefig(figure_png, dpi=150, bbox_inches="tight")
+
+
+# ==============================================
+# Compound X Transcriptomics
+# ==============================================
+
+def download_transcriptomics(output_csv, url, bundled_csv=None):
+    """Downloads the RNA-seq results and saves them as CSV."""
+    from .transcriptomics import download_and_process_dataset
+
+    if _copy_bundled(bundled_csv, output_csv):
+        return
+
+    download_and_process_dataset(url, output_csv)
+
+
+def split_significant_genes(data_csv, upregulated_csv, downregulated_csv, log2fc_threshold=1, pvalue_threshold=0.01):
+    """Saves the significantly up- and downregulated genes."""
+    from .transcriptomics import load_transcriptomics_dataset, significant_gene_masks
+
+    df = load_transcriptomics_dataset(data_csv)
+    upregulated, downregulated = significant_gene_masks(df, log2fc_threshold, pvalue_threshold)
+    df[upregulated].to_csv(upregulated_csv, index=False)
+    df[downregulated].to_csv(downregulated_csv, index=False)
+
+
+def plot_volcano(data_csv, figure_png, log2fc_threshold=1, pvalue_threshold=0.01):
+    """Volcano plot with the significance thresholds."""
+    from matplotlib.figure import Figure
+
+    from .plotting import volcano_plot
+    from .transcriptomics import load_transcriptomics_dataset, significant_gene_masks
+
+    df = load_transcriptomics_dataset(data_csv)
+    upregulated, downregulated = significant_gene_masks(df, log2fc_threshold, pvalue_threshold)
+
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    volcano_plot(ax, df["log2FoldChange"], df["neg_log10_pvalue"], upregulated, downregulated,
+                 log2fc_threshold, pvalue_threshold)
+    fig.savefig(figure_png, dpi=150, bbox_inches="tight")
+
+
+# ==============================================
+# Breast Cancer Classification
+# ==============================================
+
+def download_cancer_dataset(output_csv, url, bundled_csv=None):
+    """Downloads the raw breast cancer dataset."""
+    from .cancer import download_dataset
+
+    if _copy_bundled(bundled_csv, output_csv):
+        return
+
+    download_dataset(url, os.path.basename(output_csv), output_dir=os.path.dirname(output_csv))
+
+
+def clean_cancer_dataset(raw_csv, cleaned_csv):
+    """Fixes the raw dataset's header and row alignment."""
+    from .cancer import clean_dataset
+
+    clean_dataset(raw_csv, cleaned_csv)
+
+
+def train_diagnosis_model(cleaned_csv, manifest_json, cache_dir, test_size=0.2, random_state=42):
+    """Loads and preprocesses the cleaned data, trains the diagnosis pipeline and saves it."""
+    import json
+
+    from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+    from sklearn.model_selection import train_test_split
+
+    from .cancer import load_and_debug_dataset
+    from .model_artifacts import build_diagnosis_pipeline, save_model_artifact
+    from .preprocessing_cache import preprocess_cached
+
+    preprocessed = preprocess_cached(cleaned_csv, load_and_debug_dataset, cache_dir=cache_dir)
+    X_train, X_test, y_train, y_test = train_test_split(preprocessed["X_raw"], preprocessed["y"],
+                                                        test_size=test_size, random_state=random_state)
+
+    pipeline = build_diagnosis_pipeline()
+    pipeline.fit(X_train, y_train)
+    y_pred = pipeline.predict(X_test)
+
+    manifest = save_model_artifact(pipeline, os.path.dirname(manifest_json), preprocessed["feature_names"], metrics={
+        "accuracy": accuracy_score(y_test, y_pred),
+        "precision": precision_score(y_test, y_pred),
+        "recall": recall_score(y_test, y_pred),
+        "f1": f1_score(y_test, y_pred),
+    }, training_data_hash=preprocessed["meta"]["key"])
+    with open(manifest_json, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+
+# ==============================================
+# Dataset Memory
+# ==============================================
+
+def dataset_memory_report(sift_csv, foldx_csv, transcriptomics_csv, cancer_csv, report_csv):
+    """Compacts every bundled dataset and writes the before/after memory per dataset."""
+    import pandas as pd
+
+    from .dtypes import compact_frame, memory_report, print_memory_report
+    from .mutations import load_mutation_dataset
+    from .transcriptomics import load_transcriptomics_dataset
+
+    datasets = {
+        "sift": (load_mutation_dataset(sift_csv), {"parse_mutations": "Amino_Acid"}),
+        "foldx": (load_mutation_dataset(foldx_csv), {"parse_mutations": "Amino_Acid"}),
+        "transcriptomics": (load_transcriptomics_dataset(transcriptomics_csv), {"exclude": ["pvalue"]}),
+        "cancer": (pd.read_csv(cancer_csv), {}),
+    }
+    report = memory_report({name: (df, compact_frame(df, **options)) for name, (df, options) in datasets.items()})
+    print_memory_report(report)
+    report.to_csv(report_csv, index=False)
+
+
+# ==============================================
+# Pipeline Definition
+# ==============================================
+
+def build_pipeline(repo_root, output_dir, refresh_downloads=False):
+    """
+    Declares every stage step as a pipeline node.
+
+    Download nodes write to output_dir/downloads and start from the datasets
+    bundled with the repository, unless refresh_downloads asks for fresh copies;
+    the bundled files themselves are never overwritten. Everything derived from
+    them is written under output_dir as well.
+
+    Parameters:
+        repo_root (str): Root of the repository.
+        output_dir (str): Directory for downloaded and derived files.
+        refresh_downloads (bool): Download the datasets instead of copying the bundled ones.
+
+    Returns:
+        nodes (list): Node objects for run_pipeline.
+    """
+    from .cancer import DATASET_URL as CANCER_URL
+    from .mutations import FOLDX_URL, SIFT_URL
+    from .transcriptomics import DATASET_URL as TRANSCRIPTOMICS_URL
+
+    downloads_dir = os.path.join(output_dir, "downloads")
+
+    def bundled(*parts):
+        return None if refresh_downloads else os.path.join(repo_root, *parts)
+
+    sift_csv = os.path.join(downloads_dir, "sift_dataset.csv")
+    foldx_csv = os.path.join(downloads_dir, "foldx_dataset.csv")
+    merged_csv = os.path.join(output_dir, "mutations", "merged_mutations.csv")
+    deleterious_csv = os.path.join(output_dir, "mutations", "deleterious_mutations.csv")
+
+    transcriptomics_csv = os.path.join(downloads_dir, "transcriptomics_data.csv")
+    upregulated_csv = os.path.join(output_dir, "transcriptomics", "upregulated_genes.csv")
+    downregulated_csv = os.path.join(output_dir, "transcriptomics", "downregulated_genes.csv")
+
+    raw_cancer_csv = os.path.join(downloads_dir, "cancer_transcriptomics.csv")
+    cleaned_cancer_csv = os.path.join(output_dir, "cancer", "cancer_transcriptomics_cleaned.csv")
+
+    return [
+        Node("download_sift", download_mutation_csv, outputs=[sift_csv],
+             params={"url": SIFT_URL, "bundled_csv": bundled(STAGE_2_MUTATIONS, "sift_dataset.csv")},
+             external=True),
+        Node("download_foldx", download_mutation_csv, outputs=[foldx_csv],
+             params={"url": FOLDX_URL, "bundled_csv": bundled(STAGE_2_MUTATIONS, "foldx_dataset.csv")},
+             external=True),
+        Node("merge_mutations", merge_mutations, inputs=[sift_csv, foldx_csv], outputs=[merged_csv]),
+        Node("filter_deleterious_mutations", filter_mutations, inputs=[merged_csv], outputs=[deleterious_csv],
+             params={"sift_threshold": 0.05, "foldx_threshold": 2}),
+        Node("plot_amino_acid_frequency", plot_amino_acid_frequency, inputs=[deleterious_csv],
+             outputs=[os.path.join(output_dir, "mutations", "amino_acid_frequency.png")]),
+
+        Node("download_transcriptomics", download_transcriptomics, outputs=[transcriptomics_csv],
+             params={"url": TRANSCRIPTOMICS_URL,
+                     "bundled_csv": bundled(STAGE_2_TRANSCRIPTOMICS, "transcriptomics_data.csv")},
+             external=True),
+        Node("split_significant_genes", split_significant_genes, inputs=[transcriptomics_csv],
+             outputs=[upregulated_csv, downregulated_csv],
+             params={"log2fc_threshold": 1, "pvalue_threshold": 0.01}),
+        Node("plot_volcano", plot_volcano, inputs=[transcriptomics_csv],
+             outputs=[os.path.join(output_dir, "transcriptomics", "volcano_plot.png")],
+             params={"log2fc_threshold": 1, "pvalue_threshold": 0.01}),
+
+        Node("download_cancer_dataset", download_cancer_dataset, outputs=[raw_cancer_csv],
+             params={"url": CANCER_URL, "bundled_csv": bundled(STAGE_3_CANCER, "cancer_transcriptomics.csv")},
+             external=True),
+        Node("clean_cancer_dataset", clean_cancer_dataset, inputs=[raw_cancer_csv], outputs=[cleaned_cancer_csv]),
+        Node("train_diagnosis_model", train_diagnosis_model, inputs=[cleaned_cancer_csv],
+             outputs=[os.path.join(output_dir, "cancer", "models", "diagnosis_model-latest.json")],
+             params={"cache_dir": os.path.join(output_dir, "cancer", ".preprocessing_cache"),
+                     "test_size": 0.2, "random_state": 42}),
+
+        Node("dataset_memory_report", dataset_memory_report,
+             inputs=[sift_csv, foldx_csv, transcriptomics_csv, cleaned_cancer_csv],
+             outputs=[os.path.join(output_dir, "dataset_memory_report.csv")]),
+    ]
@@ -0,0 +1,47 @@
+# ==============================================
+# Run the Stage Pipelines (download -> clean -> analyse -> plot)
+# ==============================================
+#
+# python run_pipeline.py                        # run everything, reuse cached nodes
+# python run_pipeline.py train_diagnosis_model  # one node plus its upstream nodes
+# python run_pipeline.py --list                 # show nodes and their dependencies
+
+import argparse
+import os
+import sys
+
+from hackbio.pipeline import build_graph, run_pipeline
+from hackbio.workflows import build_pipeline
+
+repo_root = os.path.dirname(os.path.abspath(__file__))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the HackBio stage pipelines with caching.")
+    parser.add_argument("targets", nargs="*", help="Nodes to run (default: all).")
+    parser.add_argument("--output-dir", default=os.getenv("HACKBIO_OUTPUT_DIR", os.path.join(repo_root, "pipeline_output")),
+                        help="Directory for derived files and the cache state.")
+    parser.add_argument("--jobs", type=int, default=4, help="Maximum number of nodes running at once.")
+    parser.add_argument("--force", action="store_true", help="Ignore the cache and rerun every node.")
+    parser.add_argument("--refresh-downloads", action="store_true",
+                        help="Download the datasets again (into <output-dir>/downloads) instead of using the bundled copies.")
+    parser.add_argument("--list", action="store_true", help="List the nodes and exit.")
+    args = parser.parse_args(argv)
+
+    nodes = build_pipeline(repo_root, args.output_dir, refresh_downloads=args.refresh_downloads)
+
+    if args.list:
+        dependencies = build_graph(nodes)
+        for node in nodes:
+            upstream = ", ".join(sorted(dependencies[node.name])) or "-"
+            print(f"{node.name:<32} <- {upstream}")
+        return 0
+
+    report = run_pipeline(nodes, state_file=os.path.join(args.output_dir, "pipeline_state.json"),
+                          max_workers=args.jobs, force=args.force,
+                          refresh_external=args.refresh_downloads, targets=args.targets)
+    return 1 if any(entry["status"] in ("failed", "blocked") for entry in report) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,21 @@
+# ==============================================
+# Tests: Breast Cancer Dataset Cleaning
+# ==============================================
+
+import pandas as pd
+
+from hackbio.cancer import clean_dataset
+
+
+def test_split_header_names_stay_over_their_columns(tmp_path):
+    raw_csv, cleaned_csv = tmp_path / "raw.csv", tmp_path / "cleaned.csv"
+    raw_csv.write_text('"id,diagnosis,concavity_mean,concave","points_mean,symmetry_mean"\n'
+                       '"842302,M,0.3001,0.1471,0.2419",,,\n'
+                       '"842517,M,0.0869,0.07017,0.1812",,,\n')
+
+    clean_dataset(str(raw_csv), str(cleaned_csv))
+
+    df = pd.read_csv(cleaned_csv)
+    assert list(df.columns) == ["id", "diagnosis", "concavity_mean", "concave points_mean", "symmetry_mean"]
+    assert df.loc[0, "concave points_mean"] == 0.1471
+    assert df.loc[0, "symmetry_mean"] == 0.2419
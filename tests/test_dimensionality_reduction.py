@@ -0,0 +1,27 @@
+# ==============================================
+# Tests: PCA Solver Selection
+# ==============================================
+
+import numpy as np
+from sklearn.decomposition import PCA, IncrementalPCA
+
+from hackbio.dimensionality_reduction import fit_projection
+
+
+def test_auto_solver_does_not_depend_on_the_array_type(tmp_path):
+    X = np.random.default_rng(0).normal(size=(569, 30))
+    np.save(tmp_path / "X.npy", X)
+    X_memmap = np.load(tmp_path / "X.npy", mmap_mode="r")
+
+    in_memory, mapped = fit_projection(X), fit_projection(X_memmap)
+
+    assert type(in_memory) is type(mapped) is PCA
+    assert in_memory.svd_solver == mapped.svd_solver == "full"
+    np.testing.assert_allclose(in_memory.transform(X), mapped.transform(X))
+
+
+def test_auto_streams_matrices_above_the_memory_budget():
+    X = np.random.default_rng(0).normal(size=(200, 5))
+
+    assert isinstance(fit_projection(X, memory_budget=X.nbytes - 1), IncrementalPCA)
+    assert isinstance(fit_projection(X, memory_budget=X.nbytes), PCA)
@@ -0,0 +1,51 @@
+# ==============================================
+# Tests: float32 Precision Contract & Compact Frame Round Trip
+# ==============================================
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from hackbio.dtypes import compact_frame, float32_safe, threshold_for
+
+
+def test_float32_safe_requires_an_exact_round_trip():
+    assert float32_safe([0.5, 3.0, -1024.25, np.nan, np.inf])
+    assert not float32_safe([0.5, 0.1])          # float32(0.1) != 0.1
+    assert not float32_safe([1e300])             # Overflows to inf
+    assert not float32_safe([16777217.0])        # 2**24 + 1 needs 25 bits
+
+
+def test_float32_safe_with_an_explicit_tolerance():
+    assert float32_safe([0.1, 0.01, 123.456], tolerance=2.0 ** -24)
+    assert not float32_safe([16777217.0], tolerance=1e-9)
+    assert not float32_safe([1e300], tolerance=0.5)
+
+
+def test_compact_frame_round_trips_values():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "exact": rng.integers(-1000, 1000, size=200) / 4,        # Quarters fit float32 exactly
+        "decimal": rng.normal(size=200),                         # Stays float64
+        "count": rng.integers(0, 100, size=200),
+        "protein": rng.choice(["A1", "B2", None], size=200),
+        "label": [f"gene_{i}" for i in range(200)],              # Mostly unique: left as is
+    })
+    df.loc[5, "exact"] = np.nan
+
+    compact = compact_frame(df)
+
+    assert compact["exact"].dtype == np.float32 and compact["decimal"].dtype == np.float64
+    assert isinstance(compact["protein"].dtype, pd.CategoricalDtype)
+    assert compact.memory_usage(deep=True).sum() < df.memory_usage(deep=True).sum()
+    restored = compact.astype({"exact": np.float64, "count": df["count"].dtype, "protein": object})
+    pdt.assert_frame_equal(restored, df, check_dtype=False)
+    assert restored["protein"].isna().sum() == df["protein"].isna().sum()
+
+
+def test_lossy_columns_filter_like_the_originals():
+    values = pd.Series(np.linspace(0, 0.02, 2001))
+    lossy = compact_frame(values.to_frame("pvalue"), float_tolerance=2.0 ** -24)["pvalue"]
+
+    assert lossy.dtype == np.float32
+    pdt.assert_series_equal(lossy < threshold_for(lossy, 0.01), values < 0.01, check_names=False)
@@ -0,0 +1,33 @@
+# ==============================================
+# Tests: Cross-Validation Harness Report
+# ==============================================
+
+import numpy as np
+import pytest
+
+from hackbio.evaluation import evaluate_classifier, print_evaluation
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(120, 4))
+    y = (X[:, 0] + 0.5 * rng.normal(size=120) > 0).astype(int)
+    return X, y
+
+
+@pytest.mark.parametrize("scoring, label", [("f1", "F1"), ("recall", "Recall"), ("accuracy", "Accuracy")])
+def test_candidates_are_labelled_with_the_scoring_metric(data, capsys, scoring, label):
+    report = evaluate_classifier(*data, param_grid={"C": [0.1, 1.0]}, scoring=scoring, n_jobs=1)
+    print_evaluation(report, top=2)
+
+    lines = capsys.readouterr().out.splitlines()
+    header = next(index for index, line in enumerate(lines) if "Top 2 candidates" in line)
+    assert lines[header].endswith(f"by {label}:")
+    best = report["summary"].iloc[0]
+    assert lines[header + 1].strip().startswith(f"{label} {best[f'{scoring}_mean']:.4f}")
+
+
+def test_unknown_scoring_metric_is_rejected(data):
+    with pytest.raises(ValueError, match="scoring"):
+        evaluate_classifier(*data, param_grid={"C": [1.0]}, scoring="roc_auc", n_jobs=1)
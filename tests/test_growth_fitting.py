@@ -0,0 +1,43 @@
+# ==============================================
+# Tests: Batch Lag-Logistic Growth Curve Fitting
+# ==============================================
+
+import warnings
+
+import numpy as np
+
+from hackbio.growth_fitting import fit_growth_curves, lag_logistic
+
+
+def synthetic_wells(n_wells=2000, noise=0.01, missing=0.05, seed=0):
+    rng = np.random.default_rng(seed)
+    time = np.arange(0, 48.5, 0.5)
+    params = np.column_stack([rng.uniform(0.02, 0.1, n_wells), rng.uniform(0.6, 1.5, n_wells),
+                              rng.uniform(0.2, 1.5, n_wells), rng.uniform(1, 15, n_wells)])
+    od = lag_logistic(time, *params.T)
+    od = od + noise * params[:, 1:2] * rng.standard_normal(od.shape)
+    od[rng.random(od.shape) < missing] = np.nan
+    return time, od, params
+
+
+def test_noisy_wells_with_missing_points_fit_without_diverging():
+    time, od, params = synthetic_wells()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        fits = fit_growth_curves(time, od)
+
+    assert fits["converged"].all()
+    assert np.isfinite(fits["t80"]).all()
+    assert fits["r2"].min() > 0.95
+    relative_error = np.abs(fits[["K", "r"]].to_numpy() - params[:, 1:3]) / params[:, 1:3]
+    assert relative_error.max() < 0.2
+
+
+def test_flat_wells_are_not_reported_as_converged():
+    rng = np.random.default_rng(0)
+    time = np.arange(0, 48.5, 0.5)
+    flat = 0.1 + 0.001 * rng.standard_normal((5, len(time)))
+
+    fits = fit_growth_curves(time, flat)
+
+    assert not fits["converged"].any()
@@ -0,0 +1,38 @@
+# ==============================================
+# Tests: Hierarchical Clustering Backends
+# ==============================================
+
+import numpy as np
+import pytest
+
+from hackbio import hierarchical
+from hackbio.hierarchical import hierarchical_clustering, hierarchical_linkage
+
+
+@pytest.fixture
+def blobs():
+    rng = np.random.default_rng(0)
+    return np.vstack([rng.normal(0, 0.3, (60, 3)), rng.normal(4, 0.3, (60, 3))])
+
+
+def test_auto_never_builds_a_large_condensed_matrix_without_fastcluster(blobs, monkeypatch):
+    monkeypatch.setattr(hierarchical, "fastcluster", None)
+    monkeypatch.setattr(hierarchical, "CONDENSED_THRESHOLD", 100)
+
+    assert hierarchical_linkage(blobs[:100])[1] == "condensed (scipy)"
+    assert hierarchical_linkage(blobs)[1] == "connectivity"
+
+
+def test_nn_chain_requires_fastcluster(blobs, monkeypatch):
+    monkeypatch.setattr(hierarchical, "fastcluster", None)
+
+    with pytest.raises(ValueError, match="fastcluster"):
+        hierarchical_linkage(blobs, backend="nn_chain")
+
+
+@pytest.mark.parametrize("backend", ["condensed", "connectivity"])
+def test_backends_recover_separated_groups(blobs, backend):
+    labels = hierarchical_clustering(blobs, n_clusters=2, backend=backend)["labels"]
+
+    assert len(set(labels[:60])) == 1 and len(set(labels[60:])) == 1
+    assert labels[0] != labels[-1]
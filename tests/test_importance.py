@@ -0,0 +1,50 @@
+# ==============================================
+# Tests: Permutation Importance Feature Groups
+# ==============================================
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hackbio.importance import feature_groups
+
+CLEANED_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "Stage 3 Cancer Classifying & Clusturing", "cancer_transcriptomics_cleaned.csv")
+PROPERTIES = ["radius", "texture", "perimeter", "area", "smoothness", "compactness", "concavity",
+              "concave points", "symmetry", "fractal_dimension"]
+
+
+def named_groups(names, **kwargs):
+    return {group: [names[index] for index in indices] for group, indices in feature_groups(names, **kwargs).items()}
+
+
+def test_cleaned_cancer_features_form_mean_se_worst_triplets():
+    features = list(pd.read_csv(CLEANED_CSV, nrows=0).columns.drop(["id", "diagnosis"]))
+
+    groups = named_groups(features)
+
+    assert list(groups) == PROPERTIES
+    for name, columns in groups.items():
+        assert columns == [f"{name}_mean", f"{name}_se", f"{name}_worst"]
+
+
+def test_without_a_suffix_pattern_every_column_is_its_own_group():
+    names = ["radius_mean", "radius_se", "texture_mean"]
+    assert named_groups(names, suffix_pattern=None) == {name: [name] for name in names}
+
+
+def test_correlated_groups_are_merged():
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=200)
+    X = pd.DataFrame({"a_mean": base, "b_mean": base + 0.01 * rng.normal(size=200), "c_mean": rng.normal(size=200)})
+
+    groups = named_groups(list(X.columns), X=X, correlation_threshold=0.9)
+
+    assert sorted(map(sorted, groups.values())) == [["a_mean", "b_mean"], ["c_mean"]]
+
+
+def test_correlation_grouping_needs_the_matrix():
+    with pytest.raises(ValueError):
+        feature_groups(["a_mean", "b_mean"], correlation_threshold=0.9)
@@ -0,0 +1,79 @@
+# ==============================================
+# Tests: k-mer & Codon Counts Against Brute Force
+# ==============================================
+
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from hackbio.kmers import SequenceStats, fasta_stats, sequence_stats
+from hackbio.translation import CODON_TABLE
+
+
+def random_dna(rng, length):
+    return "".join(rng.choice("ACGTACGTACGTacgtN") for _ in range(length))
+
+
+@pytest.fixture
+def sequences():
+    rng = random.Random(0)
+    return [random_dna(rng, rng.randint(0, 120)) for _ in range(25)] + ["", "AC", "NNNN"]
+
+
+def brute_force(sequences, k):
+    kmers, codons, bases = Counter(), Counter(), Counter()
+    for sequence in sequences:
+        sequence = sequence.upper()
+        bases.update(base if base in "ACGT" else "N" for base in sequence)
+        kmers.update(sequence[i:i + k] for i in range(len(sequence) - k + 1)
+                     if set(sequence[i:i + k]) <= set("ACGT"))
+        codons.update(sequence[i:i + 3] for i in range(0, len(sequence) - 2, 3)
+                      if set(sequence[i:i + 3]) <= set("ACGT"))
+    return kmers, codons, bases
+
+
+def assert_matches(stats, sequences, k):
+    kmers, codons, bases = brute_force(sequences, k)
+    assert stats.kmer_counts().to_dict() == dict(kmers)
+    usage = stats.codon_usage()
+    assert usage["count"].to_dict() == {codon: codons.get(codon, 0) for codon in CODON_TABLE}
+    assert stats.base_counts().to_dict() == {base: bases.get(base, 0) for base in "ACGTN"}
+
+    # RSCU: count over the mean count of the codons for the same amino acid
+    for codon, amino_acid in CODON_TABLE.items():
+        synonymous = [codons.get(other, 0) for other, acid in CODON_TABLE.items() if acid == amino_acid]
+        mean = sum(synonymous) / len(synonymous)
+        if mean:
+            assert usage.loc[codon, "rscu"] == pytest.approx(codons.get(codon, 0) / mean)
+        else:
+            assert np.isnan(usage.loc[codon, "rscu"])
+
+
+@pytest.mark.parametrize("k", [1, 3, 6, 12])  # 12 uses the sparse table
+def test_sequence_stats_match_brute_force(sequences, k):
+    assert_matches(sequence_stats(sequences, k=k), sequences, k)
+
+
+def test_merged_partial_counts_match_one_pass(sequences):
+    merged = SequenceStats(12)
+    for half in (sequences[::2], sequences[1::2]):
+        merged.merge(sequence_stats(half, k=12))
+    assert_matches(merged, sequences, 12)
+
+
+@pytest.mark.parametrize("k", [2, 5, 12])
+@pytest.mark.parametrize("piece_size", [1, 2, 3, 7, 64])
+def test_fasta_chunk_boundaries_count_each_window_once(tmp_path, sequences, k, piece_size):
+    fasta = tmp_path / "records.fa"
+    with open(fasta, "w") as f:
+        for i, sequence in enumerate(sequences):
+            f.write(f">record_{i}\n")
+            for start in range(0, len(sequence), 11):  # Line breaks independent of the pieces
+                f.write(sequence[start:start + 11] + "\n")
+
+    stats = fasta_stats(str(fasta), k=k, piece_size=piece_size)
+
+    assert stats.sequences == len(sequences)
+    assert_matches(stats, sequences, k)
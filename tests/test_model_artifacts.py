@@ -0,0 +1,82 @@
+# ==============================================
+# Tests: Model Versioning & Batch Scoring Input Checks
+# ==============================================
+
+import importlib.util
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hackbio.model_artifacts import build_diagnosis_pipeline, load_model_artifact, save_model_artifact
+
+SCORE_SAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "Stage 3 Cancer Classifying & Clusturing", "score_samples.py")
+FEATURES = ["radius_mean", "texture_mean", "area_mean"]
+
+
+@pytest.fixture
+def training_data():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(60, 3)), columns=FEATURES)
+    y = (X["radius_mean"] + rng.normal(scale=0.5, size=60) > 0).astype(int)
+    return X, y
+
+
+@pytest.fixture
+def score_samples():
+    spec = importlib.util.spec_from_file_location("score_samples", SCORE_SAMPLES)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_refitting_an_unchanged_model_reuses_its_version(tmp_path, training_data):
+    X, y = training_data
+    first = save_model_artifact(build_diagnosis_pipeline().fit(X, y), tmp_path, FEATURES, training_data_hash="abc")
+    second = save_model_artifact(build_diagnosis_pipeline().fit(X, y), tmp_path, FEATURES, training_data_hash="abc",
+                                 metrics={"accuracy": 1.0})
+
+    assert first["version"] == second["version"] == 1
+    assert sorted(os.listdir(tmp_path)) == ["diagnosis_model-v1.joblib", "diagnosis_model-v1.json"]
+    load_model_artifact(tmp_path)  # The file hash still verifies
+
+
+def test_changed_parameters_or_training_data_get_a_new_version(tmp_path, training_data):
+    X, y = training_data
+    save_model_artifact(build_diagnosis_pipeline().fit(X, y), tmp_path, FEATURES, training_data_hash="abc")
+
+    other_data = save_model_artifact(build_diagnosis_pipeline().fit(X, y), tmp_path, FEATURES, training_data_hash="def")
+    other_params = save_model_artifact(build_diagnosis_pipeline(C=0.1).fit(X, y), tmp_path, FEATURES,
+                                       training_data_hash="def")
+
+    assert (other_data["version"], other_params["version"]) == (2, 3)
+    _, manifest = load_model_artifact(tmp_path)
+    assert manifest["version"] == 3
+
+
+def test_score_batch_handles_case_order_and_single_missing_values(score_samples, training_data):
+    X, y = training_data
+    pipeline = build_diagnosis_pipeline().fit(X, y)
+    manifest = {"feature_names": FEATURES, "label_map": {"B": 0, "M": 1}}
+
+    batch = X.head(5)[FEATURES[::-1]].copy()
+    batch.columns = [f" {name.upper()} " for name in batch.columns]
+    batch.iloc[0, 0] = np.nan
+
+    predictions = score_samples.score_batch(pipeline, manifest, batch)
+    expected = pipeline.predict_proba(X.head(5).assign(area_mean=[np.nan] + list(X["area_mean"].iloc[1:5])))[:, 1]
+    np.testing.assert_allclose(predictions["malignant_probability"], expected)
+
+
+def test_score_batch_rejects_missing_and_non_numeric_features(score_samples, training_data):
+    X, y = training_data
+    pipeline = build_diagnosis_pipeline().fit(X, y)
+    manifest = {"feature_names": FEATURES, "label_map": {"B": 0, "M": 1}}
+
+    with pytest.raises(ValueError, match="missing 3 feature column"):
+        score_samples.score_batch(pipeline, manifest, pd.DataFrame({"foo": [1.0], "bar": [2.0]}))
+
+    with pytest.raises(ValueError, match="no numeric values: texture_mean"):
+        score_samples.score_batch(pipeline, manifest, X.head(3).assign(texture_mean=["high", "low", "n/a"]))
@@ -0,0 +1,59 @@
+# ==============================================
+# Tests: Mutation Code Parsing & Frequency Counts
+# ==============================================
+
+import numpy as np
+import pandas as pd
+
+from hackbio.dtypes import parse_mutation_fields
+from hackbio.mutation_frequencies import RESIDUE_LABELS, UNKNOWN_CODE, MutationFrequencies, parse_mutation_codes
+
+CODES = ["K60Q", "G12D", None, np.nan, "K60", "60Q", "K6a0Q", "", "KQ"]
+
+
+def test_missing_and_malformed_codes_are_unparsed():
+    wild_type, position, mutant = parse_mutation_codes(CODES)
+
+    assert RESIDUE_LABELS[wild_type[:2]].tolist() == ["K", "G"]
+    assert position[:2].tolist() == [60, 12]
+    assert RESIDUE_LABELS[mutant[:2]].tolist() == ["Q", "D"]
+    assert (position[2:] == -1).all()
+    assert (wild_type[2:] == UNKNOWN_CODE).all()
+    assert (mutant[2:] == UNKNOWN_CODE).all()
+
+
+def test_categorical_codes_with_missing_values():
+    codes = pd.Series(CODES, dtype="category")
+    for parsed, expected in zip(parse_mutation_codes(codes), parse_mutation_codes(CODES)):
+        np.testing.assert_array_equal(parsed, expected)
+
+
+def test_unparsed_codes_are_left_out_of_the_counts():
+    proteins = ["P1", "P2", "P1", "P2", "P1", "P2", "P1", "P2", "P3"]
+    frequencies = MutationFrequencies().update(CODES, proteins)
+
+    assert frequencies.unparsed == 7
+    assert frequencies.total == 2
+    assert frequencies.wild_type_frequencies(include_unknown=True).to_dict() == {"G": 1, "K": 1}
+    assert frequencies.mutant_frequencies(include_unknown=True).to_dict() == {"D": 1, "Q": 1}
+    assert frequencies.substitution_matrix(include_unknown=True).to_numpy().sum() == 2
+    assert frequencies.position_frequencies().to_dict() == {12: 1, 60: 1}
+    summary = frequencies.protein_summary().set_index("protein")
+    assert summary["mutations"].to_dict() == {"P1": 1, "P2": 1}
+
+
+def test_chunked_updates_match_one_update():
+    whole = MutationFrequencies().update(CODES)
+    chunked = MutationFrequencies().update(CODES[:3]).update(CODES[3:])
+
+    np.testing.assert_array_equal(whole.substitutions, chunked.substitutions)
+    np.testing.assert_array_equal(whole.position_counts, chunked.position_counts)
+    assert whole.unparsed == chunked.unparsed
+
+
+def test_parse_mutation_fields_marks_missing_codes_unknown():
+    df = parse_mutation_fields(pd.DataFrame({"Amino_Acid": ["K60Q", np.nan, "K60"]}))
+
+    assert df["Amino_Acid_wild_type"].tolist() == ["K", "X", "X"]
+    assert df["Amino_Acid_position"].tolist() == [60, -1, -1]
+    assert df["Amino_Acid_mutant"].tolist() == ["Q", "X", "X"]
@@ -0,0 +1,50 @@
+# ==============================================
+# Tests: SIFT/FoldX Merge Keys
+# ==============================================
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from hackbio.dtypes import compact_frame
+from hackbio.mutations import merge_mutation_datasets
+
+KEY_COLUMNS = ["Protein_sift", "Amino_Acid_sift", "Protein_foldx", "Amino_Acid_foldx"]
+
+
+def datasets():
+    sift_df = pd.DataFrame({"Protein": ["P1", "P1", "P2", None, "P3", "nan"],
+                            "Amino_Acid": ["K60Q", "G12D", "K60Q", "A1B", None, "nan"],
+                            "sift_Score": [0.01, 0.5, 0.02, 0.0, 0.0, 0.0]})
+    foldx_df = pd.DataFrame({"Protein": ["P2", "P1", "P1", np.nan, "P3", "P4"],
+                             "Amino_Acid": ["K60Q", "K60Q", "K60Q", np.nan, None, "K60Q"],
+                             "foldX_Score": [3.0, 2.5, 0.5, 9.0, 9.0, 1.0]})
+    return sift_df, foldx_df
+
+
+def test_merge_matches_protein_and_substitution_pairs():
+    merged = merge_mutation_datasets(*datasets())
+
+    assert merged["specific_Protein_aa"].tolist() == ["P1_K60Q", "P1_K60Q", "P2_K60Q"]
+    assert merged["foldX_Score"].tolist() == [2.5, 0.5, 3.0]
+    assert list(merged.columns) == ["Protein_sift", "Amino_Acid_sift", "sift_Score", "specific_Protein_aa",
+                                    "Protein_foldx", "Amino_Acid_foldx", "foldX_Score"]
+
+
+def test_missing_values_never_match_each_other_or_the_string_nan():
+    merged = merge_mutation_datasets(*datasets())
+
+    assert merged["specific_Protein_aa"].notna().all()
+    assert not merged["specific_Protein_aa"].str.contains("nan|None").any()
+
+
+def test_compacted_frames_merge_like_the_originals():
+    sift_df, foldx_df = datasets()
+
+    expected = merge_mutation_datasets(sift_df, foldx_df)
+    merged = merge_mutation_datasets(compact_frame(sift_df, max_unique_ratio=1),
+                                     compact_frame(foldx_df, max_unique_ratio=1))
+
+    assert isinstance(merged["Protein_sift"].dtype, pd.CategoricalDtype)
+    pdt.assert_frame_equal(merged.astype(dict.fromkeys(KEY_COLUMNS, object)),
+                           expected.astype(dict.fromkeys(KEY_COLUMNS, object)), check_dtype=False)
@@ -0,0 +1,133 @@
+# ==============================================
+# Tests: Pipeline Cache Keys
+# ==============================================
+
+import importlib
+import json
+import sys
+import textwrap
+
+import pytest
+
+from hackbio.pipeline import Node, _function_fingerprint, run_pipeline
+from hackbio.workflows import build_pipeline, download_cancer_dataset
+
+
+@pytest.fixture
+def step_package(tmp_path, monkeypatch):
+    """A throwaway package whose step calls a helper from another module."""
+    package = tmp_path / "stepkit"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "helpers.py").write_text("def double(value):\n    return value * 2\n")
+    (package / "steps.py").write_text(textwrap.dedent('''
+        SUFFIX = "\\n"
+
+
+        def _format(value):
+            return f"{value}{SUFFIX}"
+
+
+        def double_file(input_txt, output_txt):
+            from .helpers import double
+
+            with open(input_txt) as f:
+                value = int(f.read())
+            with open(output_txt, "w") as f:
+                f.write(_format(double(value)))
+    '''))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package
+    for name in [name for name in sys.modules if name.split(".")[0] == "stepkit"]:
+        del sys.modules[name]
+
+
+def test_editing_a_helper_module_changes_the_fingerprint(step_package):
+    steps = importlib.import_module("stepkit.steps")
+    before = _function_fingerprint(steps.double_file)
+
+    (step_package / "helpers.py").write_text("def double(value):\n    return value + value\n")
+
+    assert _function_fingerprint(steps.double_file) != before
+
+
+def test_editing_an_unrelated_module_keeps_the_fingerprint(step_package):
+    steps = importlib.import_module("stepkit.steps")
+    (step_package / "unused.py").write_text("VALUE = 1\n")
+    before = _function_fingerprint(steps.double_file)
+
+    (step_package / "unused.py").write_text("VALUE = 2\n")
+
+    assert _function_fingerprint(steps.double_file) == before
+
+
+def test_stale_helper_outputs_are_not_served_from_cache(step_package, tmp_path):
+    steps = importlib.import_module("stepkit.steps")
+    input_txt, output_txt, state_file = tmp_path / "in.txt", tmp_path / "out.txt", tmp_path / "state.json"
+    input_txt.write_text("21")
+    nodes = [Node("double", steps.double_file, inputs=[input_txt], outputs=[output_txt])]
+
+    assert run_pipeline(nodes, state_file)[0]["status"] == "ran"
+    assert run_pipeline(nodes, state_file)[0]["status"] == "cached"
+
+    (step_package / "helpers.py").write_text("def double(value):\n    return value * 3\n")
+    importlib.reload(importlib.import_module("stepkit.helpers"))
+
+    assert run_pipeline(nodes, state_file)[0]["status"] == "ran"
+    assert output_txt.read_text() == "63\n"
+
+
+def test_node_version_is_part_of_the_cache_key(tmp_path):
+    input_txt, output_txt, state_file = tmp_path / "in.txt", tmp_path / "out.txt", tmp_path / "state.json"
+    input_txt.write_text("1")
+
+    def copy(source, target):
+        target_path = str(target)
+        with open(source) as f, open(target_path, "w") as out:
+            out.write(f.read())
+
+    assert run_pipeline([Node("copy", copy, [input_txt], [output_txt], version=1)], state_file)[0]["status"] == "ran"
+    assert run_pipeline([Node("copy", copy, [input_txt], [output_txt], version=1)], state_file)[0]["status"] == "cached"
+    assert run_pipeline([Node("copy", copy, [input_txt], [output_txt], version=2)], state_file)[0]["status"] == "ran"
+
+
+def test_missing_input_fails_the_node_and_keeps_completed_work(tmp_path):
+    present, missing, state_file = tmp_path / "present.txt", tmp_path / "missing.txt", tmp_path / "state.json"
+    present.write_text("1")
+
+    def copy(source, target):
+        with open(source) as f, open(target, "w") as out:
+            out.write(f.read())
+
+    nodes = [Node("copy_present", copy, [present], [tmp_path / "a.txt"]),
+             Node("copy_missing", copy, [missing], [tmp_path / "b.txt"]),
+             Node("downstream", copy, [tmp_path / "b.txt"], [tmp_path / "c.txt"])]
+
+    statuses = {entry["node"]: entry["status"] for entry in run_pipeline(nodes, state_file, max_workers=1)}
+
+    assert statuses == {"copy_present": "ran", "copy_missing": "failed", "downstream": "blocked"}
+    assert list(json.loads(state_file.read_text())) == ["copy_present"]
+
+
+def test_downloads_never_write_into_the_repository(tmp_path):
+    repo_root, output_dir = tmp_path / "repo", tmp_path / "out"
+    download_nodes = [node for node in build_pipeline(str(repo_root), str(output_dir)) if node.external]
+    refresh_nodes = [node for node in build_pipeline(str(repo_root), str(output_dir), refresh_downloads=True)
+                     if node.external]
+
+    assert len(download_nodes) == 4
+    for node in download_nodes + refresh_nodes:
+        assert all(path.startswith(str(output_dir / "downloads")) for path in node.outputs)
+    assert all(node.params["bundled_csv"].startswith(str(repo_root)) for node in download_nodes)
+    assert all(node.params["bundled_csv"] is None for node in refresh_nodes)
+
+
+def test_download_nodes_start_from_the_bundled_copy(tmp_path):
+    bundled, output_csv = tmp_path / "bundled.csv", tmp_path / "downloads" / "data.csv"
+    bundled.write_text("a,b\n1,2\n")
+    node = Node("download", download_cancer_dataset, outputs=[output_csv],
+                params={"url": "http://invalid.example", "bundled_csv": str(bundled)}, external=True)
+
+    assert run_pipeline([node], tmp_path / "state.json")[0]["status"] == "ran"
+    assert output_csv.read_text() == bundled.read_text()
+    assert run_pipeline([node], tmp_path / "state.json")[0]["status"] == "cached"
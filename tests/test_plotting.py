@@ -0,0 +1,58 @@
+# ==============================================
+# Tests: Class Density Rendering Keeps Labels Categorical
+# ==============================================
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from hackbio.plotting import class_density_scatter
+
+
+@pytest.fixture
+def ax():
+    fig, ax = plt.subplots()
+    yield ax
+    plt.close(fig)
+
+
+def test_hexagons_take_the_most_common_class_not_the_mean(ax):
+    # Every point sits in one spot: four of cluster 0, one of cluster 4 (mean would be 0.8)
+    x = np.zeros(5)
+    y = np.zeros(5)
+    labels = np.array([0, 0, 0, 0, 4])
+
+    density = class_density_scatter(ax, x, y, labels, threshold=1, outlier_quantile=0)
+
+    assert density.get_array().tolist() == [0.0]
+    assert density.norm(0) != density.norm(4)  # Distinct colour bands per class
+
+
+def test_every_hexagon_value_is_an_existing_class(ax):
+    rng = np.random.default_rng(0)
+    labels = rng.integers(0, 3, size=2000)
+    x = rng.normal(size=2000) + labels
+    y = rng.normal(size=2000)
+
+    density = class_density_scatter(ax, x, y, labels, threshold=100, gridsize=15)
+
+    assert set(np.unique(density.get_array())) <= {0.0, 1.0, 2.0}
+
+
+def test_highlighted_and_outlying_points_are_drawn_individually(ax):
+    rng = np.random.default_rng(1)
+    x = rng.normal(size=1000)
+    y = rng.normal(size=1000)
+    x[0] = 50.0  # Outlier
+    highlight = np.zeros(1000, dtype=bool)
+    highlight[5:8] = True
+
+    class_density_scatter(ax, x, y, np.zeros(1000), threshold=100, highlight=highlight, outlier_quantile=0.0005)
+
+    markers = ax.collections[-1].get_offsets()
+    assert [50.0, y[0]] in markers.tolist()
+    assert all([x[i], y[i]] in markers.tolist() for i in range(5, 8))
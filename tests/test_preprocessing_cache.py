@@ -0,0 +1,46 @@
+# ==============================================
+# Tests: Preprocessing Cache Hits Match Misses
+# ==============================================
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from hackbio.preprocessing_cache import preprocess_cached
+
+
+def write_dataset(path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(40, 3)), columns=["radius_mean", "texture_mean", "area_mean"],
+                      index=pd.Index(rng.permutation(1000)[:40], name="id"))
+    df.iloc[3, 1] = np.nan
+    df["diagnosis"] = np.where(df["radius_mean"] > 0, "M", "B")
+    df.to_csv(path)
+    return path
+
+
+def load_indexed(filename):
+    return pd.read_csv(filename, index_col="id")
+
+
+def test_cache_hit_returns_the_same_types_and_values_as_a_miss(tmp_path):
+    filename = write_dataset(tmp_path / "cancer.csv")
+
+    miss = preprocess_cached(filename, load_indexed, cache_dir=tmp_path / "cache")
+    hit = preprocess_cached(filename, load_indexed, cache_dir=tmp_path / "cache")
+
+    assert not miss["meta"]["cache_hit"] and hit["meta"]["cache_hit"]
+    pdt.assert_frame_equal(hit["X_raw"], miss["X_raw"])
+    pdt.assert_series_equal(hit["y"], miss["y"])
+    pdt.assert_index_equal(hit["feature_names"], miss["feature_names"])
+    assert type(hit["X_scaled"]) is np.ndarray and hit["X_scaled"].flags.writeable
+    np.testing.assert_array_equal(hit["X_scaled"], miss["X_scaled"])
+
+
+def test_memory_map_only_on_request(tmp_path):
+    filename = write_dataset(tmp_path / "cancer.csv")
+    preprocess_cached(filename, load_indexed, cache_dir=tmp_path / "cache")
+
+    hit = preprocess_cached(filename, load_indexed, cache_dir=tmp_path / "cache", mmap=True)
+
+    assert isinstance(hit["X_scaled"], np.memmap)
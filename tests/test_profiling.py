@@ -0,0 +1,53 @@
+# ==============================================
+# Tests: Nested Memory Measurements Keep Their Peaks
+# ==============================================
+
+import tracemalloc
+
+import pytest
+
+from hackbio import profiling
+
+BLOCK_BYTES = 8 * 1024 ** 2
+
+
+@pytest.fixture
+def memory_profiling(tmp_path):
+    was_tracing = tracemalloc.is_tracing()
+    profiling.reset()
+    profiling.enable(report_file=str(tmp_path / "profile.json"), trace_memory=True)
+    yield
+    profiling.disable()
+    profiling.reset()
+    profiling._settings["trace_memory"] = False
+    if not was_tracing:
+        tracemalloc.stop()
+
+
+@profiling.instrument(name="inner")
+def small_step():
+    return [0] * 10
+
+
+@profiling.instrument(name="outer")
+def large_then_small():
+    block = bytearray(BLOCK_BYTES)
+    del block
+    return small_step()
+
+
+def test_inner_call_does_not_erase_the_outer_peak(memory_profiling):
+    large_then_small()
+
+    peaks = {record["name"]: record["traced_peak_kb"] for record in profiling.records()}
+    assert peaks["outer"] >= BLOCK_BYTES / 1024
+    assert peaks["inner"] is not None and peaks["inner"] >= 0
+
+
+def test_outermost_measurement_starts_from_a_fresh_peak(memory_profiling):
+    large_then_small()  # Leaves a high peak behind
+    profiling.reset()
+
+    small_step()
+
+    assert profiling.records()[0]["traced_peak_kb"] < BLOCK_BYTES / 1024
@@ -0,0 +1,46 @@
+# ==============================================
+# Tests: Report Figure Hashes & Rendering Cache
+# ==============================================
+
+import importlib
+import sys
+import textwrap
+
+import pytest
+
+from hackbio.report import FigureSpec, render_figures, spec_hash
+
+
+@pytest.fixture
+def figure_package(tmp_path, monkeypatch):
+    """A throwaway package whose figure builder draws with a helper from another module."""
+    package = tmp_path / "figurekit"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "drawing.py").write_text("def draw_line(ax, values):\n    ax.plot(values)\n")
+    (package / "builders.py").write_text(textwrap.dedent('''
+        def line_figure(fig, values):
+            from .drawing import draw_line
+
+            draw_line(fig.subplots(), values)
+    '''))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package
+    for name in [name for name in sys.modules if name.split(".")[0] == "figurekit"]:
+        del sys.modules[name]
+
+
+def test_editing_a_plotting_helper_renders_the_figure_again(figure_package, tmp_path):
+    builders = importlib.import_module("figurekit.builders")
+    spec = FigureSpec("Line", builders.line_figure, {"values": [1, 3, 2]}, figsize=(3, 2))
+    before = spec_hash(spec, dpi=50)
+
+    statuses = [entry["status"] for entry in render_figures([spec], tmp_path / "report", n_jobs=1, dpi=50)]
+    assert statuses == ["rendered"]
+    assert [entry["status"] for entry in render_figures([spec], tmp_path / "report", n_jobs=1, dpi=50)] == ["skipped"]
+
+    (figure_package / "drawing.py").write_text("def draw_line(ax, values):\n    ax.plot(values, 'o-')\n")
+    importlib.reload(importlib.import_module("figurekit.drawing"))
+
+    assert spec_hash(spec, dpi=50) != before
+    assert [entry["status"] for entry in render_figures([spec], tmp_path / "report", n_jobs=1, dpi=50)] == ["rendered"]
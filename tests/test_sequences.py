@@ -0,0 +1,67 @@
+# ==============================================
+# Tests: Edit Distance & k-mer Index Against Brute Force
+# ==============================================
+
+import random
+
+import pytest
+
+from hackbio.sequences import KmerIndex, levenshtein_distance
+
+
+def dp_distance(a, b):
+    """Textbook O(len(a) * len(b)) dynamic-programming edit distance."""
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def random_sequences(rng, count, max_length, alphabet="ACGT"):
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, max_length))) for _ in range(count)]
+
+
+def mutate(rng, sequence, edits, alphabet="ACGT"):
+    for _ in range(edits):
+        position = rng.randint(0, len(sequence))
+        operation = rng.choice("isd") if sequence else "i"
+        if operation == "i":
+            sequence = sequence[:position] + rng.choice(alphabet) + sequence[position:]
+        elif operation == "s" and position < len(sequence):
+            sequence = sequence[:position] + rng.choice(alphabet) + sequence[position + 1:]
+        elif position < len(sequence):
+            sequence = sequence[:position] + sequence[position + 1:]
+    return sequence
+
+
+def test_levenshtein_matches_dynamic_programming():
+    rng = random.Random(0)
+    sequences = random_sequences(rng, 60, 12, alphabet="AC") + random_sequences(rng, 60, 80) + ["", "A"]
+    # Long patterns exercise multi-word bit vectors
+    sequences += [mutate(rng, "".join(rng.choice("ACGT") for _ in range(150)), 10) for _ in range(4)]
+
+    for a in sequences:
+        for b in rng.sample(sequences, 15):
+            expected = dp_distance(a, b)
+            assert levenshtein_distance(a, b) == expected
+            assert levenshtein_distance(b, a) == expected
+            for max_distance in (0, 1, 3, expected):
+                assert levenshtein_distance(a, b, max_distance) == (expected if expected <= max_distance else None)
+
+
+@pytest.mark.parametrize("k", [2, 3, 5])
+@pytest.mark.parametrize("max_distance", [0, 1, 2, 4])
+def test_kmer_index_search_matches_brute_force(k, max_distance):
+    rng = random.Random(k * 10 + max_distance)
+    base = random_sequences(rng, 20, 30)
+    targets = base + [mutate(rng, rng.choice(base), rng.randint(0, 5)) for _ in range(80)] + ["", "AC"]
+    index = KmerIndex(targets, k=k)
+
+    queries = [mutate(rng, rng.choice(targets), rng.randint(0, 3)) for _ in range(25)] + ["", "G"]
+    for query in queries:
+        distances = [(i, dp_distance(query, target)) for i, target in enumerate(targets)]
+        expected = sorted(((i, d) for i, d in distances if d <= max_distance), key=lambda match: (match[1], match[0]))
+        assert index.search(query, max_distance) == expected
@@ -0,0 +1,63 @@
+# ==============================================
+# Tests: Subclass Discovery Reuses Its K Selection Fits
+# ==============================================
+
+import numpy as np
+import pytest
+from sklearn.cluster import KMeans
+
+from hackbio import subclasses
+from hackbio.subclasses import discover_subclasses
+
+
+@pytest.fixture
+def blobs():
+    rng = np.random.default_rng(0)
+    centers = np.array([[0, 0], [6, 0], [0, 6], [20, 20], [26, 20]])
+    X = np.vstack([center + rng.normal(scale=0.5, size=(30, 2)) for center in centers])
+    labels = np.repeat([0, 0, 0, 1, 1], 30)
+    return X, labels
+
+
+@pytest.fixture
+def fit_log(monkeypatch):
+    """Records (rows, k) of every K-Means fit made by discover_subclasses."""
+    log = []
+
+    class CountingKMeans(KMeans):
+        def fit(self, X, y=None, sample_weight=None):
+            log.append((len(X), self.n_clusters))
+            return super().fit(X, y, sample_weight)
+
+    monkeypatch.setattr(subclasses, "KMeans", CountingKMeans)
+    return log
+
+
+def test_each_group_and_k_is_fitted_exactly_once(blobs, fit_log):
+    X, labels = blobs
+
+    result = discover_subclasses(X, labels=labels, k_range=range(1, 6), n_jobs=1)
+
+    assert sorted(fit_log) == sorted([(90, k) for k in range(1, 6)] + [(60, k) for k in range(1, 6)])
+    assert result["timing"]["fits"] == len(fit_log)
+    assert {name: group["k"] for name, group in result["groups"].items()} == {0: 3, 1: 2}
+
+
+def test_chosen_fit_matches_a_fresh_fit(blobs, fit_log):
+    X, labels = blobs
+
+    group = discover_subclasses(X, labels=labels, k_range=range(1, 6), n_jobs=1)["groups"][0]
+
+    fresh = KMeans(n_clusters=group["k"], random_state=42, n_init=10).fit(X[group["rows"]])
+    np.testing.assert_array_equal(group["labels"], fresh.labels_)
+    assert group["model"].inertia_ == pytest.approx(fresh.inertia_)
+    assert group["wcss"][group["k"]] == pytest.approx(fresh.inertia_)
+
+
+def test_fixed_k_outside_the_range_is_fitted_once_and_kept_off_the_curve(blobs, fit_log):
+    X, _ = blobs
+
+    group = discover_subclasses(X, k_range=range(1, 4), n_clusters=5, n_jobs=1)["groups"]["all"]
+
+    assert sorted(fit_log) == [(150, 1), (150, 2), (150, 3), (150, 5)]
+    assert group["k"] == 5 and list(group["wcss"].index) == [1, 2, 3]